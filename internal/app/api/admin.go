@@ -237,6 +237,7 @@ func (s *Server) handleCreateAdmin(w http.ResponseWriter, r *http.Request) {
 	}
 	s.telegramReports.AdminCreated(r.Context(), createdReport)
 	s.enqueueWebhook(r.Context(), webhookAdminEvent(webhookapp.ActionAdminCreated, createdReport))
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, adminResponse(created))
 }
 
@@ -481,6 +482,14 @@ func (s *Server) handleUpdateAdmin(w http.ResponseWriter, r *http.Request, usern
 		writeStatusError(w, err)
 		return
 	}
+	if payload.Services != nil {
+		s.invalidateServiceList()
+	}
+	_, domainChanged := payload.fields["subscription_domain"]
+	_, settingsChanged := payload.fields["subscription_settings"]
+	if domainChanged || settingsChanged {
+		s.userService.InvalidateSubscriptionSettings()
+	}
 	updatedReport := telegramapp.AdminReport{
 		Username: updated.Username,
 		Actor:    telegramActor(r),
@@ -489,6 +498,7 @@ func (s *Server) handleUpdateAdmin(w http.ResponseWriter, r *http.Request, usern
 	}
 	s.telegramReports.AdminUpdated(r.Context(), updatedReport)
 	s.enqueueWebhook(r.Context(), webhookAdminEvent(webhookapp.ActionAdminUpdated, updatedReport))
+	s.systemStatsService().InvalidateSummaries()
 	if limitTransition.Disabled {
 		s.telegramReports.AdminLimitReached(r.Context(), telegramAdminLimitReport(updated.Username, limitTransition.Reason, telegramActor(r)))
 	}
@@ -530,10 +540,8 @@ func (s *Server) handleDeleteAdmin(w http.ResponseWriter, r *http.Request, usern
 		if err != nil {
 			return err
 		}
-		for _, userID := range userIDs {
-			if err := enqueueNodeOperationTx(r.Context(), tx, "remove_user", nil, &userID, map[string]any{}); err != nil {
-				return err
-			}
+		if err := enqueueUsersNodeOperationTx(r.Context(), tx, "remove_user", userIDs, map[string]any{}); err != nil {
+			return err
 		}
 		if _, err := tx.ExecContext(r.Context(), `UPDATE users SET status = ?, last_status_change = ? WHERE admin_id = ?`, "deleted", now, target.ID); err != nil {
 			return err
@@ -553,6 +561,7 @@ func (s *Server) handleDeleteAdmin(w http.ResponseWriter, r *http.Request, usern
 	}
 	s.telegramReports.AdminDeleted(r.Context(), deletedReport)
 	s.enqueueWebhook(r.Context(), webhookAdminEvent(webhookapp.ActionAdminDeleted, deletedReport))
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, map[string]any{"detail": "Admin removed successfully"})
 }
 
@@ -590,10 +599,8 @@ func (s *Server) handleDisableAdmin(w http.ResponseWriter, r *http.Request, user
 		if _, err := tx.ExecContext(r.Context(), `UPDATE users SET status = ?, last_status_change = ?, admin_disabled_at = ? WHERE admin_id = ? AND status IN (?, ?)`, "disabled", now, now, target.ID, "active", "on_hold"); err != nil {
 			return err
 		}
-		for _, userID := range userIDs {
-			if err := enqueueNodeOperationTx(r.Context(), tx, "disable_user", nil, &userID, map[string]any{}); err != nil {
-				return err
-			}
+		if err := enqueueUsersNodeOperationTx(r.Context(), tx, "disable_user", userIDs, map[string]any{}); err != nil {
+			return err
 		}
 		updated, err = adminByUsernameTx(r.Context(), tx, target.Username)
 		return err
@@ -609,6 +616,7 @@ func (s *Server) handleDisableAdmin(w http.ResponseWriter, r *http.Request, user
 	}
 	s.telegramReports.AdminUpdated(r.Context(), disabledReport)
 	s.enqueueWebhook(r.Context(), webhookAdminEvent(webhookapp.ActionAdminUpdated, disabledReport))
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, adminResponse(updated))
 }
 
@@ -656,10 +664,8 @@ func (s *Server) handleEnableAdmin(w http.ResponseWriter, r *http.Request, usern
 		); err != nil {
 			return err
 		}
-		for _, userID := range userIDs {
-			if err := enqueueNodeOperationTx(r.Context(), tx, "enable_user", nil, &userID, map[string]any{}); err != nil {
-				return err
-			}
+		if err := enqueueUsersNodeOperationTx(r.Context(), tx, "enable_user", userIDs, map[string]any{}); err != nil {
+			return err
 		}
 		updated, err = adminByUsernameTx(r.Context(), tx, target.Username)
 		if err != nil {
@@ -682,6 +688,7 @@ func (s *Server) handleEnableAdmin(w http.ResponseWriter, r *http.Request, usern
 	}
 	s.telegramReports.AdminUpdated(r.Context(), enabledReport)
 	s.enqueueWebhook(r.Context(), webhookAdminEvent(webhookapp.ActionAdminUpdated, enabledReport))
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, adminResponse(updated))
 }
 
@@ -692,6 +699,7 @@ func (s *Server) handleDisableAdminUsers(w http.ResponseWriter, r *http.Request,
 		writeStatusError(w, err)
 		return
 	}
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, map[string]any{"detail": "Users successfully disabled"})
 }
 
@@ -702,6 +710,7 @@ func (s *Server) handleActivateAdminUsers(w http.ResponseWriter, r *http.Request
 		writeStatusError(w, err)
 		return
 	}
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, map[string]any{"detail": "Users successfully activated"})
 }
 
@@ -724,10 +733,8 @@ func (s *Server) bulkUpdateAdminUsers(ctx context.Context, actor adminapp.Admin,
 			if _, err := tx.ExecContext(ctx, `UPDATE users SET status = ?, last_status_change = ?, admin_disabled_at = NULL WHERE admin_id = ? AND status IN (?, ?)`, "disabled", now, target.ID, "active", "on_hold"); err != nil {
 				return err
 			}
-			for _, userID := range userIDs {
-				if err := enqueueNodeOperationTx(ctx, tx, "disable_user", nil, &userID, map[string]any{}); err != nil {
-					return err
-				}
+			if err := enqueueUsersNodeOperationTx(ctx, tx, "disable_user", userIDs, map[string]any{}); err != nil {
+				return err
 			}
 		case "activate":
 			userIDs, err := userIDsByAdminTx(ctx, tx, target.ID, "disabled")
@@ -749,10 +756,8 @@ func (s *Server) bulkUpdateAdminUsers(ctx context.Context, actor adminapp.Admin,
 			); err != nil {
 				return err
 			}
-			for _, userID := range userIDs {
-				if err := enqueueNodeOperationTx(ctx, tx, "enable_user", nil, &userID, map[string]any{}); err != nil {
-					return err
-				}
+			if err := enqueueUsersNodeOperationTx(ctx, tx, "enable_user", userIDs, map[string]any{}); err != nil {
+				return err
 			}
 		}
 		return nil
@@ -813,6 +818,7 @@ func (s *Server) handleAdminUsageResetPath(w http.ResponseWriter, r *http.Reques
 	}
 	s.telegramReports.AdminUsageReset(r.Context(), usageResetReport)
 	s.enqueueWebhook(r.Context(), webhookAdminEvent(webhookapp.ActionAdminUsageReset, usageResetReport))
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, adminResponse(updated))
 }
 
@@ -855,6 +861,7 @@ func (s *Server) handleDeletedUsersUsageReset(w http.ResponseWriter, r *http.Req
 	}
 	s.telegramReports.AdminUsageReset(r.Context(), usageResetReport)
 	s.enqueueWebhook(r.Context(), webhookAdminEvent(webhookapp.ActionAdminUsageReset, usageResetReport))
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, adminResponse(updated))
 }
 
@@ -1369,26 +1376,61 @@ func scanInt64Rows(rows *sql.Rows) ([]int64, error) {
 }
 
 func enqueueNodeOperationTx(ctx context.Context, tx *sql.Tx, operationType string, nodeID *int64, userID *int64, payload any) error {
-	now := time.Now().UTC()
 	if nodeID == nil && userID != nil && operationType != "sync_config" {
-		rows, err := tx.QueryContext(ctx, `SELECT id FROM nodes WHERE LOWER(COALESCE(status, '')) = 'connected' ORDER BY id`)
-		if err != nil {
-			return err
-		}
-		nodeIDs, err := scanInt64Rows(rows)
+		nodeIDs, err := connectedNodeIDsTx(ctx, tx)
 		if err != nil {
 			return err
 		}
 		if len(nodeIDs) > 0 {
 			for _, id := range nodeIDs {
 				targetNodeID := id
-				if err := enqueueNodeOperationTx(ctx, tx, operationType, &targetNodeID, userID, payload); err != nil {
+				if err := insertNodeOperationTx(ctx, tx, operationType, &targetNodeID, userID, payload); err != nil {
 					return err
 				}
 			}
 			return nil
 		}
 	}
+	return insertNodeOperationTx(ctx, tx, operationType, nodeID, userID, payload)
+}
+
+// enqueueUsersNodeOperationTx queues the same user operation for every user on
+// every connected node, reading the connected nodes once for the whole batch
+// rather than once per user.
+func enqueueUsersNodeOperationTx(ctx context.Context, tx *sql.Tx, operationType string, userIDs []int64, payload any) error {
+	if len(userIDs) == 0 {
+		return nil
+	}
+	nodeIDs, err := connectedNodeIDsTx(ctx, tx)
+	if err != nil {
+		return err
+	}
+	for _, userID := range userIDs {
+		if len(nodeIDs) == 0 {
+			if err := insertNodeOperationTx(ctx, tx, operationType, nil, &userID, payload); err != nil {
+				return err
+			}
+			continue
+		}
+		for _, nodeID := range nodeIDs {
+			if err := insertNodeOperationTx(ctx, tx, operationType, &nodeID, &userID, payload); err != nil {
+				return err
+			}
+		}
+	}
+	return nil
+}
+
+func connectedNodeIDsTx(ctx context.Context, tx *sql.Tx) ([]int64, error) {
+	rows, err := tx.QueryContext(ctx, `SELECT id FROM nodes WHERE LOWER(COALESCE(status, '')) = 'connected' ORDER BY id`)
+	if err != nil {
+		return nil, err
+	}
+	return scanInt64Rows(rows)
+}
+
+func insertNodeOperationTx(ctx context.Context, tx *sql.Tx, operationType string, nodeID *int64, userID *int64, payload any) error {
+	now := time.Now().UTC()
 	payload = operationPayloadWithQueuedAt(payload, now)
 	payloadJSON, err := json.Marshal(payload)
 	if err != nil {
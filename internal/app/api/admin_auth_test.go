@@ -26,6 +26,7 @@ import (
 	"github.com/rebeccapanel/rebecca/internal/app/nodecontroller"
 	settingsapp "github.com/rebeccapanel/rebecca/internal/app/settings"
 	telegramapp "github.com/rebeccapanel/rebecca/internal/app/telegram"
+	userapp "github.com/rebeccapanel/rebecca/internal/app/user"
 	warpapp "github.com/rebeccapanel/rebecca/internal/app/warp"
 	"github.com/rebeccapanel/rebecca/internal/app/xrayconfig"
 )
@@ -1302,3 +1303,32 @@ func TestExpiredAdminTokenReturnsPythonCompatibleAuthError(t *testing.T) {
 		t.Fatalf("expected Python-compatible auth error, got %#v", body)
 	}
 }
+
+func TestAdminUpdateDropsEffectiveSubscriptionSettings(t *testing.T) {
+	server, db := testAdminServer(t)
+	for _, statement := range []string{
+		`CREATE TABLE panel_settings (id INTEGER PRIMARY KEY, default_subscription_type TEXT)`,
+		`CREATE TABLE subscription_settings (id INTEGER PRIMARY KEY, subscription_profile_title TEXT)`,
+	} {
+		if _, err := db.Exec(statement); err != nil {
+			t.Fatal(err)
+		}
+	}
+	server.userService = userapp.NewService(userapp.NewRepository(db, "sqlite"))
+	insertMasterAPIAdmin(t, db, 1, "pouria", "pass123", adminapp.RoleFullAccess, adminapp.StatusActive)
+	insertMasterAPIAdmin(t, db, 2, "seller", "pass123", adminapp.RoleStandard, adminapp.StatusActive)
+	token := adminBearerToken(t, server, "pouria", "pass123")
+	ctx := context.Background()
+	sellerID := int64(2)
+
+	if got := server.userService.EffectiveSubscriptionSettings(ctx, &sellerID).SubscriptionProfileTitle; got != "Subscription" {
+		t.Fatalf("profile title = %q, want Subscription", got)
+	}
+	rec := adminJSONRequest(t, server, http.MethodPut, "/api/admin/seller", token, `{"subscription_settings":{"subscription_profile_title":"Seller"}}`)
+	if rec.Code != http.StatusOK {
+		t.Fatalf("update admin status = %d body=%s", rec.Code, rec.Body.String())
+	}
+	if got := server.userService.EffectiveSubscriptionSettings(ctx, &sellerID).SubscriptionProfileTitle; got != "Seller" {
+		t.Fatalf("profile title after admin update = %q, want Seller", got)
+	}
+}
@@ -122,10 +122,8 @@ func reconcileAdminLimitStateTx(ctx context.Context, tx *sql.Tx, target adminapp
 		if _, err := tx.ExecContext(ctx, `UPDATE users SET status = ?, last_status_change = ?, admin_disabled_at = ? WHERE admin_id = ? AND status IN (?, ?)`, "disabled", now, now, target.ID, "active", "on_hold"); err != nil {
 			return adminLimitTransition{}, err
 		}
-		for _, userID := range userIDs {
-			if err := enqueueNodeOperationTx(ctx, tx, "disable_user", nil, &userID, map[string]any{}); err != nil {
-				return adminLimitTransition{}, err
-			}
+		if err := enqueueUsersNodeOperationTx(ctx, tx, "disable_user", userIDs, map[string]any{}); err != nil {
+			return adminLimitTransition{}, err
 		}
 		return adminLimitTransition{Disabled: true, Reason: reason}, nil
 	}
@@ -157,10 +155,8 @@ func reconcileAdminLimitStateTx(ctx context.Context, tx *sql.Tx, target adminapp
 		); err != nil {
 			return adminLimitTransition{}, err
 		}
-		for _, userID := range userIDs {
-			if err := enqueueNodeOperationTx(ctx, tx, "enable_user", nil, &userID, map[string]any{}); err != nil {
-				return adminLimitTransition{}, err
-			}
+		if err := enqueueUsersNodeOperationTx(ctx, tx, "enable_user", userIDs, map[string]any{}); err != nil {
+			return adminLimitTransition{}, err
 		}
 		return adminLimitTransition{Reenabled: true}, nil
 	}
@@ -104,7 +104,7 @@ func (b botUserService) Delete(ctx context.Context, actor telegrambot.Actor, use
 		return err
 	}
 	_, err = b.server.userService.DeleteUser(ctx, admin, username)
-	return err
+	return b.invalidateSummaries(err)
 }
 
 func (b botUserService) Reset(ctx context.Context, actor telegrambot.Actor, username string) error {
@@ -113,7 +113,7 @@ func (b botUserService) Reset(ctx context.Context, actor telegrambot.Actor, user
 		return err
 	}
 	_, err = b.server.userService.ResetUser(ctx, admin, username)
-	return err
+	return b.invalidateSummaries(err)
 }
 
 func (b botUserService) RevokeSubscription(ctx context.Context, actor telegrambot.Actor, username string) error {
@@ -122,7 +122,7 @@ func (b botUserService) RevokeSubscription(ctx context.Context, actor telegrambo
 		return err
 	}
 	_, err = b.server.userService.RevokeUserSubscription(ctx, admin, username)
-	return err
+	return b.invalidateSummaries(err)
 }
 
 func (b botUserService) SetStatus(ctx context.Context, actor telegrambot.Actor, username string, status string) error {
@@ -143,6 +143,15 @@ func (b botUserService) update(ctx context.Context, actor telegrambot.Actor, use
 		return err
 	}
 	_, err = b.server.userService.UpdateUser(ctx, admin, username, raw)
+	return b.invalidateSummaries(err)
+}
+
+// invalidateSummaries drops cached dashboard summaries once a user write
+// made through the bot has succeeded.
+func (b botUserService) invalidateSummaries(err error) error {
+	if err == nil {
+		b.server.systemStatsService().InvalidateSummaries()
+	}
 	return err
 }
 
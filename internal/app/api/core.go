@@ -98,13 +98,27 @@ func (s *Server) serveNodeLogWebSocket(w http.ResponseWriter, r *http.Request, n
 		defer conn.Close()
 		ctx, cancel := context.WithCancel(r.Context())
 		defer cancel()
+		// The hijacked connection does not cancel r.Context when the client
+		// goes away, so watch the read side and stop the node stream at once
+		// instead of waiting for the next log line to fail on send.
+		go func() {
+			defer cancel()
+			var discard string
+			for websocket.Message.Receive(conn, &discard) == nil {
+			}
+		}()
+		// Lines are written straight into text frames through one reused
+		// buffer instead of a fresh Message codec allocation per line.
+		var frame []byte
 		err := s.nodeController.StreamLogs(ctx, nodecontroller.StreamLogsRequest{
 			NodeID:   nodeID,
 			MaxLines: maxLines,
 		}, func(line string) error {
-			return websocket.Message.Send(conn, line)
+			frame = append(frame[:0], line...)
+			_, err := conn.Write(frame)
+			return err
 		})
-		if err != nil && !strings.Contains(strings.ToLower(err.Error()), "use of closed network connection") {
+		if err != nil && ctx.Err() == nil && !strings.Contains(strings.ToLower(err.Error()), "use of closed network connection") {
 			_ = websocket.Message.Send(conn, err.Error())
 		}
 	}).ServeHTTP(w, r)
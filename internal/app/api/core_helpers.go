@@ -598,7 +598,32 @@ func masterPublicIPv6(ctx context.Context) string {
 	return "[::1]"
 }
 
+// publicIPEndpointRetryDelay is how long an IP lookup endpoint is skipped
+// after it could not be reached, so hosts without a route to it (commonly no
+// IPv6) do not wait out the dial timeout on every request.
+const publicIPEndpointRetryDelay = time.Minute
+
+var publicIPEndpointBackoff = struct {
+	mu    sync.Mutex
+	until map[string]time.Time
+}{until: map[string]time.Time{}}
+
+func publicIPEndpointAvailable(endpoint string, now time.Time) bool {
+	publicIPEndpointBackoff.mu.Lock()
+	defer publicIPEndpointBackoff.mu.Unlock()
+	return !now.Before(publicIPEndpointBackoff.until[endpoint])
+}
+
+func markPublicIPEndpointUnavailable(endpoint string, now time.Time) {
+	publicIPEndpointBackoff.mu.Lock()
+	publicIPEndpointBackoff.until[endpoint] = now.Add(publicIPEndpointRetryDelay)
+	publicIPEndpointBackoff.mu.Unlock()
+}
+
 func fetchPublicIP(ctx context.Context, endpoint string, wantIPv4 bool) string {
+	if !publicIPEndpointAvailable(endpoint, time.Now()) {
+		return ""
+	}
 	requestCtx, cancel := context.WithTimeout(ctx, 5*time.Second)
 	defer cancel()
 	request, err := http.NewRequestWithContext(requestCtx, http.MethodGet, endpoint, nil)
@@ -607,6 +632,11 @@ func fetchPublicIP(ctx context.Context, endpoint string, wantIPv4 bool) string {
 	}
 	response, err := http.DefaultClient.Do(request)
 	if err != nil {
+		// Only transport failures count against the endpoint; a caller that
+		// went away says nothing about its reachability.
+		if ctx.Err() == nil {
+			markPublicIPEndpointUnavailable(endpoint, time.Now())
+		}
 		return ""
 	}
 	defer response.Body.Close()
@@ -4,11 +4,13 @@ package api
 
 import (
 	"bytes"
+	"context"
 	"encoding/json"
 	"net/http"
 	"net/http/httptest"
 	"strings"
 	"testing"
+	"time"
 
 	adminapp "github.com/rebeccapanel/rebecca/internal/app/admin"
 )
@@ -369,3 +371,24 @@ func TestOutboundTestTypeNormalization(t *testing.T) {
 		})
 	}
 }
+
+func TestFetchPublicIPSkipsUnreachableEndpoint(t *testing.T) {
+	unreachable := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {}))
+	endpoint := unreachable.URL + "/"
+	unreachable.Close()
+	t.Cleanup(func() {
+		publicIPEndpointBackoff.mu.Lock()
+		delete(publicIPEndpointBackoff.until, endpoint)
+		publicIPEndpointBackoff.mu.Unlock()
+	})
+
+	if ip := fetchPublicIP(context.Background(), endpoint, true); ip != "" {
+		t.Fatalf("expected no IP from closed endpoint, got %q", ip)
+	}
+	if publicIPEndpointAvailable(endpoint, time.Now()) {
+		t.Fatalf("expected unreachable endpoint to be skipped")
+	}
+	if !publicIPEndpointAvailable(endpoint, time.Now().Add(publicIPEndpointRetryDelay)) {
+		t.Fatalf("expected endpoint to be retried after the delay")
+	}
+}
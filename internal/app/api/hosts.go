@@ -14,12 +14,12 @@ import (
 	"strings"
 
 	adminapp "github.com/rebeccapanel/rebecca/internal/app/admin"
+	"github.com/rebeccapanel/rebecca/internal/app/xrayconfig"
 )
 
 var (
 	hostFragmentPattern = regexp.MustCompile(`^((\d{1,4}-\d{1,4})|(\d{1,4})),((\d{1,3}-\d{1,3})|(\d{1,3})),(tlshello|\d|\d-\d)(,(\d{1,4}-\d{1,4}|\d{1,4}))?$`)
 	hostNoisePattern    = regexp.MustCompile(`^(rand:(\d{1,4}-\d{1,4}|\d{1,4})|str:.+|hex:.+|base64:.+)(,(\d{1,4}-\d{1,4}|\d{1,4}))?(&(rand:(\d{1,4}-\d{1,4}|\d{1,4})|str:.+|hex:.+|base64:.+)(,(\d{1,4}-\d{1,4}|\d{1,4}))?)*$`)
-	autoServiceHostTag  = regexp.MustCompile(`^setservice-\d+$`)
 )
 
 type hostPayload struct {
@@ -179,18 +179,22 @@ func (s *Server) listHostsGrouped(r *http.Request) (map[string][]hostResponse, e
 	if err != nil {
 		return nil, err
 	}
-	tx, err := s.db.BeginTx(r.Context(), nil)
+	missing, err := missingHostInboundTags(r.Context(), s.db, tags)
 	if err != nil {
 		return nil, err
 	}
-	defer tx.Rollback()
-	for _, tag := range tags {
-		if err := ensureHostInboundRecordTx(r.Context(), tx, tag); err != nil {
+	if len(missing) > 0 {
+		tx, err := s.db.BeginTx(r.Context(), nil)
+		if err != nil {
+			return nil, err
+		}
+		defer tx.Rollback()
+		if err := ensureHostInboundRecordsTx(r.Context(), tx, missing); err != nil {
+			return nil, err
+		}
+		if err := tx.Commit(); err != nil {
 			return nil, err
 		}
-	}
-	if err := tx.Commit(); err != nil {
-		return nil, err
 	}
 
 	return queryHostsGroupedByInbound(r.Context(), s.db, tags)
@@ -210,10 +214,7 @@ func (s *Server) modifyHosts(r *http.Request, payload map[string][]hostPayload)
 			return nil, statusError{status: http.StatusBadRequest, detail: fmt.Sprintf("Inbound %s doesn't exist", inboundTag)}
 		}
 	}
-	inboundProtocols := make(map[string]string, len(payload))
-	for inboundTag := range payload {
-		inboundProtocols[inboundTag] = s.hostInboundProtocol(r.Context(), inboundTag)
-	}
+	inboundProtocols := s.hostInboundProtocols(r.Context(), sortedMapKeys(payload))
 
 	allKeptIDs := make(map[int64]bool)
 	for _, hosts := range payload {
@@ -233,10 +234,10 @@ func (s *Server) modifyHosts(r *http.Request, payload map[string][]hostPayload)
 	affectedServices := make(map[int64]bool)
 	beforeServiceTags := map[int64]map[string]bool{}
 	inboundTags := sortedMapKeys(payload)
+	if err := ensureHostInboundRecordsTx(r.Context(), tx, inboundTags); err != nil {
+		return nil, err
+	}
 	for _, inboundTag := range inboundTags {
-		if err := ensureHostInboundRecordTx(r.Context(), tx, inboundTag); err != nil {
-			return nil, err
-		}
 		if err := s.replaceHostsForInboundTx(r, tx, inboundTag, inboundProtocols[inboundTag], payload[inboundTag], allKeptIDs, affectedServices, beforeServiceTags); err != nil {
 			return nil, err
 		}
@@ -375,12 +376,16 @@ func (s *Server) replaceHostsForInboundTx(r *http.Request, tx *sql.Tx, inboundTa
 	return nil
 }
 
-func (s *Server) hostInboundProtocol(ctx context.Context, tag string) string {
-	inbound, err := s.configRepo.GetInbound(ctx, tag)
+func (s *Server) hostInboundProtocols(ctx context.Context, tags []string) map[string]string {
+	found, err := s.configRepo.InboundProtocols(ctx, tags)
+	protocols := make(map[string]string, len(tags))
 	if err != nil {
-		return ""
+		return protocols
+	}
+	for tag, protocol := range found {
+		protocols[tag] = strings.ToLower(strings.TrimSpace(fmt.Sprint(protocol)))
 	}
-	return strings.ToLower(strings.TrimSpace(fmt.Sprint(inbound["protocol"])))
+	return protocols
 }
 
 func sanitizeHostPayloadForInboundProtocol(payload hostPayload, protocol string) hostPayload {
@@ -475,28 +480,69 @@ func isHostsMissingTableError(err error) bool {
 		strings.Contains(msg, "unknown table")
 }
 
-func ensureHostInboundRecordTx(ctx context.Context, tx *sql.Tx, tag string) error {
-	var id int64
-	err := tx.QueryRowContext(ctx, `SELECT id FROM inbounds WHERE tag = ?`, tag).Scan(&id)
-	if err == nil {
-		return nil
+// missingHostInboundTags returns the tags, in input order, that have no
+// inbounds row yet.
+func missingHostInboundTags(ctx context.Context, db queryer, tags []string) ([]string, error) {
+	if len(tags) == 0 {
+		return nil, nil
 	}
-	if !errors.Is(err, sql.ErrNoRows) {
+	rows, err := db.QueryContext(ctx, `SELECT tag FROM inbounds`)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	existing := make(map[string]bool)
+	for rows.Next() {
+		var tag string
+		if err := rows.Scan(&tag); err != nil {
+			return nil, err
+		}
+		existing[tag] = true
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	missing := make([]string, 0)
+	for _, tag := range tags {
+		if !existing[tag] {
+			existing[tag] = true
+			missing = append(missing, tag)
+		}
+	}
+	return missing, nil
+}
+
+// ensureHostInboundRecordsTx creates the inbounds rows and default hosts for
+// every tag that does not exist yet, using one INSERT per table.
+func ensureHostInboundRecordsTx(ctx context.Context, tx *sql.Tx, tags []string) error {
+	missing, err := missingHostInboundTags(ctx, tx, tags)
+	if err != nil || len(missing) == 0 {
 		return err
 	}
-	if _, err := tx.ExecContext(ctx, `INSERT INTO inbounds (tag) VALUES (?)`, tag); err != nil {
+	inboundValues := make([]string, 0, len(missing))
+	inboundArgs := make([]any, 0, len(missing))
+	hostValues := make([]string, 0, len(missing))
+	hostArgs := make([]any, 0, len(missing)*3)
+	for _, tag := range missing {
+		inboundValues = append(inboundValues, "(?)")
+		inboundArgs = append(inboundArgs, tag)
+		if xrayconfig.IsServiceAutoInboundTag(tag) {
+			continue
+		}
+		hostValues = append(hostValues, "(?, ?, ?, 'inbound_default', 'none', 'none', 0, 0, 0, 0)")
+		hostArgs = append(hostArgs, "Rebecca ({USERNAME}) [{PROTOCOL} - {TRANSPORT}]", "{SERVER_IP}", tag)
+	}
+	if _, err := tx.ExecContext(ctx, `INSERT INTO inbounds (tag) VALUES `+strings.Join(inboundValues, ", "), inboundArgs...); err != nil {
 		return err
 	}
-	if autoServiceHostTag.MatchString(tag) {
+	if len(hostValues) == 0 {
 		return nil
 	}
 	_, err = tx.ExecContext(
 		ctx,
 		`INSERT INTO hosts (remark, address, inbound_tag, security, alpn, fingerprint, is_disabled, mux_enable, random_user_agent, use_sni_as_host)
-		 VALUES (?, ?, ?, 'inbound_default', 'none', 'none', 0, 0, 0, 0)`,
-		"Rebecca ({USERNAME}) [{PROTOCOL} - {TRANSPORT}]",
-		"{SERVER_IP}",
-		tag,
+		 VALUES `+strings.Join(hostValues, ", "),
+		hostArgs...,
 	)
 	return err
 }
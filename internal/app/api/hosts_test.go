@@ -37,6 +37,13 @@ func TestHostsListCreatesDefaultHosts(t *testing.T) {
 	}
 	assertMasterAPICount(t, db, `SELECT COUNT(*) FROM inbounds`, 2)
 	assertMasterAPICount(t, db, `SELECT COUNT(*) FROM hosts`, 2)
+
+	rec = adminJSONRequest(t, server, http.MethodGet, "/hosts", token, "")
+	if rec.Code != http.StatusOK {
+		t.Fatalf("second hosts list status=%d body=%s", rec.Code, rec.Body.String())
+	}
+	assertMasterAPICount(t, db, `SELECT COUNT(*) FROM inbounds`, 2)
+	assertMasterAPICount(t, db, `SELECT COUNT(*) FROM hosts`, 2)
 }
 
 func TestHostStatusDisablesAndDetachesServiceUsers(t *testing.T) {
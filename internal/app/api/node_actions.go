@@ -31,6 +31,7 @@ func (s *Server) handleNodeRoot(w http.ResponseWriter, r *http.Request) {
 		writeNodeMutationError(w, err)
 		return
 	}
+	s.invalidateNodeList()
 	s.telegramReports.NodeCreated(r.Context(), telegramNodeReport(node, "", telegramActor(r)))
 	writeJSON(w, http.StatusOK, node)
 }
@@ -75,6 +76,7 @@ func (s *Server) handleNodeUpdate(w http.ResponseWriter, r *http.Request, nodeID
 		writeNodeMutationError(w, err)
 		return
 	}
+	s.invalidateNodeList()
 	if strings.TrimSpace(before.Status) != "" && before.Status != node.Status {
 		s.telegramReports.NodeStatusChanged(r.Context(), telegramNodeReport(node, before.Status, telegramActor(r)))
 	}
@@ -89,6 +91,7 @@ func (s *Server) handleNodeDelete(w http.ResponseWriter, r *http.Request, nodeID
 		writeNodeMutationError(w, err)
 		return
 	}
+	s.invalidateNodeList()
 	s.telegramReports.NodeDeleted(r.Context(), telegramNodeReport(before, "", telegramActor(r)))
 	writeJSON(w, http.StatusOK, map[string]any{})
 }
@@ -101,6 +104,7 @@ func (s *Server) handleNodeCertificateRegenerate(w http.ResponseWriter, r *http.
 		writeNodeMutationError(w, err)
 		return
 	}
+	s.invalidateNodeList()
 	writeJSON(w, http.StatusOK, node)
 }
 
@@ -112,10 +116,26 @@ func (s *Server) handleNodeUsageReset(w http.ResponseWriter, r *http.Request, no
 		writeNodeMutationError(w, err)
 		return
 	}
-	s.telegramReports.NodeUsageReset(r.Context(), telegramNodeReport(node, "", telegramActor(r)))
+	s.invalidateNodeList()
+	report := telegramNodeReport(node, "", telegramActor(r))
+	sendInBackground(r, func(ctx context.Context) {
+		s.telegramReports.NodeUsageReset(ctx, report)
+	})
 	writeJSON(w, http.StatusOK, node)
 }
 
+// sendInBackground runs a best-effort notification after the handler returns.
+// The request context is detached so the send is not cancelled with the
+// response, but it is still bounded by its own timeout.
+func sendInBackground(r *http.Request, send func(context.Context)) {
+	parent := context.WithoutCancel(r.Context())
+	go func() {
+		ctx, cancel := context.WithTimeout(parent, 30*time.Second)
+		defer cancel()
+		send(ctx)
+	}()
+}
+
 func telegramNodeReport(node nodeapp.NodeResponse, previousStatus string, actor string) telegramapp.NodeReport {
 	return telegramapp.NodeReport{
 		Name:             firstNonEmpty(node.Name, "node"),
@@ -11,6 +11,7 @@ import (
 
 const defaultNodeOperationsPollInterval = 15 * time.Second
 const defaultNodeOperationsBatchSize = 5000
+const userNodeOperationsKickChunk = 200
 
 func (s *Server) runNodeOperationsWorker(ctx context.Context) {
 	interval := parseNodeOperationsPollInterval(s.cfg.NodeOperationsPollInterval)
@@ -102,17 +103,115 @@ func (s *Server) kickUserNodeOperationsSoon(userIDs ...int64) {
 				continue
 			}
 			ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
-			for _, userID := range userIDs {
+			for start := 0; start < len(userIDs) && ctx.Err() == nil; start += userNodeOperationsKickChunk {
+				end := start + userNodeOperationsKickChunk
+				if end > len(userIDs) {
+					end = len(userIDs)
+				}
+				s.processUserNodeOperationsWithContext(ctx, userIDs[start:end], defaultNodeOperationsBatchSize)
+			}
+			cancel()
+		}
+	}()
+}
+
+// kickNodeOperationsSoon works through the queued operations of nodeIDs in the
+// background right away instead of waiting for the next queue poll, which may
+// be disabled. Like kickUserNodeOperationsSoon, kicks that arrive while a pass
+// is running are coalesced into the next pass of the same worker.
+func (s *Server) kickNodeOperationsSoon(nodeIDs ...int64) {
+	queued := false
+	s.nodeOpsKickMu.Lock()
+	if s.nodeOpsKickNodeIDs == nil {
+		s.nodeOpsKickNodeIDs = map[int64]struct{}{}
+	}
+	for _, nodeID := range nodeIDs {
+		if nodeID <= 0 {
+			continue
+		}
+		s.nodeOpsKickNodeIDs[nodeID] = struct{}{}
+		queued = true
+	}
+	if !queued {
+		s.nodeOpsKickMu.Unlock()
+		return
+	}
+	if s.nodeOpsKicking {
+		s.nodeOpsKickMu.Unlock()
+		return
+	}
+	s.nodeOpsKicking = true
+	s.nodeOpsKickMu.Unlock()
+
+	process := s.nodeOpsKickProcess
+	if process == nil {
+		process = s.processNodeQueueWithContext
+	}
+	go func() {
+		for {
+			nodeIDs := s.drainNodeOperationKickIDs()
+			if len(nodeIDs) == 0 {
+				s.nodeOpsKickMu.Lock()
+				if len(s.nodeOpsKickNodeIDs) == 0 {
+					s.nodeOpsKicking = false
+					s.nodeOpsKickMu.Unlock()
+					return
+				}
+				s.nodeOpsKickMu.Unlock()
+				continue
+			}
+			ctx, cancel := context.WithTimeout(context.Background(), 2*time.Minute)
+			for _, nodeID := range nodeIDs {
 				if ctx.Err() != nil {
 					break
 				}
-				s.processUserNodeOperationsWithContext(ctx, userID, defaultNodeOperationsBatchSize)
+				process(ctx, nodeID)
 			}
 			cancel()
 		}
 	}()
 }
 
+func (s *Server) drainNodeOperationKickIDs() []int64 {
+	s.nodeOpsKickMu.Lock()
+	defer s.nodeOpsKickMu.Unlock()
+	if len(s.nodeOpsKickNodeIDs) == 0 {
+		return nil
+	}
+	nodeIDs := make([]int64, 0, len(s.nodeOpsKickNodeIDs))
+	for nodeID := range s.nodeOpsKickNodeIDs {
+		nodeIDs = append(nodeIDs, nodeID)
+	}
+	s.nodeOpsKickNodeIDs = map[int64]struct{}{}
+	return nodeIDs
+}
+
+func (s *Server) processNodeQueueWithContext(ctx context.Context, nodeID int64) {
+	result, err := s.nodeController.ProcessQueue(ctx, nodecontroller.ProcessOperationsRequest{
+		NodeID: nodeID,
+		Limit:  defaultNodeOperationsBatchSize,
+	})
+	if err != nil {
+		if ctx.Err() != nil {
+			logging.Debugf(logging.ComponentNode, "operation queue kick stopped node=%d: %v", nodeID, err)
+			return
+		}
+		logging.Warnf(logging.ComponentNode, "operation queue kick failed node=%d: %v", nodeID, err)
+		return
+	}
+	if result.Processed > 0 {
+		logging.Debugf(
+			logging.ComponentNode,
+			"operation queue kicked node=%d processed=%d done=%d retrying=%d failed=%d",
+			nodeID,
+			result.Processed,
+			result.Done,
+			result.Retrying,
+			result.Failed,
+		)
+	}
+}
+
 func (s *Server) drainUserNodeOperationKickIDs() []int64 {
 	s.userOpsKickMu.Lock()
 	defer s.userOpsKickMu.Unlock()
@@ -127,24 +226,27 @@ func (s *Server) drainUserNodeOperationKickIDs() []int64 {
 	return userIDs
 }
 
-func (s *Server) processUserNodeOperationsWithContext(ctx context.Context, userID int64, limit int) {
+// processUserNodeOperationsWithContext hot-applies the queued deltas of a
+// batch of users in one pass, so each node works through its share in
+// parallel with the others instead of once per user.
+func (s *Server) processUserNodeOperationsWithContext(ctx context.Context, userIDs []int64, limit int) {
 	result, err := s.nodeController.ProcessRuntimeUserOperations(ctx, nodecontroller.ProcessUserOperationsRequest{
-		UserID: userID,
-		Limit:  limit,
+		UserIDs: userIDs,
+		Limit:   limit,
 	})
 	if err != nil {
 		if ctx.Err() != nil {
-			logging.Debugf(logging.ComponentNode, "user operation hot apply stopped user_id=%d: %v", userID, err)
+			logging.Debugf(logging.ComponentNode, "user operation hot apply stopped users=%d: %v", len(userIDs), err)
 			return
 		}
-		logging.Warnf(logging.ComponentNode, "user operation hot apply failed user_id=%d: %v", userID, err)
+		logging.Warnf(logging.ComponentNode, "user operation hot apply failed users=%d: %v", len(userIDs), err)
 		return
 	}
 	if result.Processed > 0 {
 		logging.Debugf(
 			logging.ComponentNode,
-			"user operation hot applied user_id=%d processed=%d done=%d retrying=%d failed=%d",
-			userID,
+			"user operation hot applied users=%d processed=%d done=%d retrying=%d failed=%d",
+			len(userIDs),
 			result.Processed,
 			result.Done,
 			result.Retrying,
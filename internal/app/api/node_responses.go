@@ -2,97 +2,161 @@ package api
 
 import "github.com/rebeccapanel/rebecca/internal/app/nodecontroller"
 
-func flattenNodeItem(node nodecontroller.NodeListItem) map[string]any {
-	return map[string]any{
-		"id":                       node.ID,
-		"name":                     node.Name,
-		"note":                     node.Note,
-		"address":                  node.Address,
-		"port":                     node.Port,
-		"api_port":                 node.APIPort,
-		"usage_coefficient":        node.UsageCoefficient,
-		"data_limit":               node.DataLimit,
-		"proxy_enabled":            node.ProxyEnabled,
-		"proxy_type":               node.ProxyType,
-		"proxy_host":               node.ProxyHost,
-		"proxy_port":               node.ProxyPort,
-		"proxy_username":           node.ProxyUsername,
-		"proxy_password":           node.ProxyPassword,
-		"status":                   node.Status,
-		"message":                  node.Message,
-		"xray_version":             node.XrayVersion,
-		"node_service_version":     node.NodeServiceVersion,
-		"node_install_mode":        node.NodeInstallMode,
-		"node_binary_tag":          nil,
-		"node_update_channel":      node.NodeUpdateChannel,
-		"cpu_cores":                node.CPU.Cores,
-		"cpu_frequency_hz":         node.CPU.FrequencyHz,
-		"cpu_usage_percent":        node.CPU.UsagePercent,
-		"memory_used":              node.Memory.UsedBytes,
-		"memory_total":             node.Memory.TotalBytes,
-		"memory_usage_percent":     node.Memory.UsagePercent,
-		"uptime_seconds":           node.UptimeSeconds,
-		"upload_speed":             node.Transfer.UploadSpeed,
-		"download_speed":           node.Transfer.DownloadSpeed,
-		"geo_mode":                 node.GeoMode,
-		"xray_config_mode":         node.XrayConfigMode,
-		"uplink":                   node.Uplink,
-		"downlink":                 node.Downlink,
-		"has_custom_certificate":   node.HasCustomCertificate,
-		"uses_default_certificate": node.UsesDefaultCertificate,
-		"certificate_public_key":   node.CertificatePublicKey,
-		"node_certificate":         node.NodeCertificate,
-		"node_certificate_key":     node.NodeCertificateKey,
+// nodeItemResponse is the flat JSON shape of a node in the list and detail
+// endpoints. Rows come from our own repository, so they are copied field by
+// field into a typed struct instead of a per-node map[string]any.
+type nodeItemResponse struct {
+	ID                     int64   `json:"id"`
+	Name                   string  `json:"name"`
+	Note                   *string `json:"note"`
+	Address                string  `json:"address"`
+	Port                   int     `json:"port"`
+	APIPort                int     `json:"api_port"`
+	UsageCoefficient       float64 `json:"usage_coefficient"`
+	DataLimit              *int64  `json:"data_limit"`
+	ProxyEnabled           bool    `json:"proxy_enabled"`
+	ProxyType              *string `json:"proxy_type"`
+	ProxyHost              *string `json:"proxy_host"`
+	ProxyPort              *int64  `json:"proxy_port"`
+	ProxyUsername          *string `json:"proxy_username"`
+	ProxyPassword          *string `json:"proxy_password"`
+	Status                 string  `json:"status"`
+	Message                *string `json:"message"`
+	XrayVersion            *string `json:"xray_version"`
+	NodeServiceVersion     *string `json:"node_service_version"`
+	NodeInstallMode        *string `json:"node_install_mode"`
+	NodeBinaryTag          *string `json:"node_binary_tag"`
+	NodeUpdateChannel      *string `json:"node_update_channel"`
+	CPUCores               int32   `json:"cpu_cores"`
+	CPUFrequencyHz         float64 `json:"cpu_frequency_hz"`
+	CPUUsagePercent        float64 `json:"cpu_usage_percent"`
+	MemoryUsed             uint64  `json:"memory_used"`
+	MemoryTotal            uint64  `json:"memory_total"`
+	MemoryUsagePercent     float64 `json:"memory_usage_percent"`
+	UptimeSeconds          uint64  `json:"uptime_seconds"`
+	UploadSpeed            uint64  `json:"upload_speed"`
+	DownloadSpeed          uint64  `json:"download_speed"`
+	GeoMode                string  `json:"geo_mode"`
+	XrayConfigMode         string  `json:"xray_config_mode"`
+	Uplink                 int64   `json:"uplink"`
+	Downlink               int64   `json:"downlink"`
+	HasCustomCertificate   bool    `json:"has_custom_certificate"`
+	UsesDefaultCertificate bool    `json:"uses_default_certificate"`
+	CertificatePublicKey   *string `json:"certificate_public_key"`
+	NodeCertificate        *string `json:"node_certificate"`
+	NodeCertificateKey     *string `json:"node_certificate_key"`
+}
+
+func newNodeItemResponse(node nodecontroller.NodeListItem) nodeItemResponse {
+	return nodeItemResponse{
+		ID:                     node.ID,
+		Name:                   node.Name,
+		Note:                   node.Note,
+		Address:                node.Address,
+		Port:                   node.Port,
+		APIPort:                node.APIPort,
+		UsageCoefficient:       node.UsageCoefficient,
+		DataLimit:              node.DataLimit,
+		ProxyEnabled:           node.ProxyEnabled,
+		ProxyType:              node.ProxyType,
+		ProxyHost:              node.ProxyHost,
+		ProxyPort:              node.ProxyPort,
+		ProxyUsername:          node.ProxyUsername,
+		ProxyPassword:          node.ProxyPassword,
+		Status:                 node.Status,
+		Message:                node.Message,
+		XrayVersion:            node.XrayVersion,
+		NodeServiceVersion:     node.NodeServiceVersion,
+		NodeInstallMode:        node.NodeInstallMode,
+		NodeUpdateChannel:      node.NodeUpdateChannel,
+		CPUCores:               node.CPU.Cores,
+		CPUFrequencyHz:         node.CPU.FrequencyHz,
+		CPUUsagePercent:        node.CPU.UsagePercent,
+		MemoryUsed:             node.Memory.UsedBytes,
+		MemoryTotal:            node.Memory.TotalBytes,
+		MemoryUsagePercent:     node.Memory.UsagePercent,
+		UptimeSeconds:          node.UptimeSeconds,
+		UploadSpeed:            node.Transfer.UploadSpeed,
+		DownloadSpeed:          node.Transfer.DownloadSpeed,
+		GeoMode:                node.GeoMode,
+		XrayConfigMode:         node.XrayConfigMode,
+		Uplink:                 node.Uplink,
+		Downlink:               node.Downlink,
+		HasCustomCertificate:   node.HasCustomCertificate,
+		UsesDefaultCertificate: node.UsesDefaultCertificate,
+		CertificatePublicKey:   node.CertificatePublicKey,
+		NodeCertificate:        node.NodeCertificate,
+		NodeCertificateKey:     node.NodeCertificateKey,
 	}
 }
 
 func flattenNodeStaticItem(node nodecontroller.NodeListItem) map[string]any {
-	item := flattenNodeItem(node)
-	for _, key := range []string{
-		"node_service_version",
-		"node_install_mode",
-		"node_binary_tag",
-		"node_update_channel",
-		"cpu_cores",
-		"cpu_frequency_hz",
-		"cpu_usage_percent",
-		"memory_used",
-		"memory_total",
-		"memory_usage_percent",
-		"uptime_seconds",
-		"upload_speed",
-		"download_speed",
-	} {
-		delete(item, key)
-	}
-	return item
+	return flattenNodeStaticFields(node, nodeStaticFieldCount)
 }
 
 func flattenNodeLiveItem(node nodecontroller.NodeListItem) map[string]any {
-	item := flattenNodeItem(node)
-	delete(item, "node_binary_tag")
-	if node.NodeServiceVersion != nil {
-		return item
-	}
-	for _, key := range []string{
-		"node_service_version",
-		"node_install_mode",
-		"node_update_channel",
-		"cpu_cores",
-		"cpu_frequency_hz",
-		"cpu_usage_percent",
-		"memory_used",
-		"memory_total",
-		"memory_usage_percent",
-		"uptime_seconds",
-		"upload_speed",
-		"download_speed",
-	} {
-		delete(item, key)
+	if node.NodeServiceVersion == nil {
+		return flattenNodeStaticFields(node, nodeStaticFieldCount)
 	}
+	item := flattenNodeStaticFields(node, nodeStaticFieldCount+nodeRuntimeFieldCount)
+	addNodeRuntimeFields(item, node)
 	return item
 }
 
+const (
+	nodeStaticFieldCount  = 26
+	nodeRuntimeFieldCount = 12
+)
+
+// flattenNodeStaticFields builds the persisted part of a node payload in a
+// single map sized for the caller, so the static/live variants never have to
+// build the full payload and then delete keys from it.
+func flattenNodeStaticFields(node nodecontroller.NodeListItem, size int) map[string]any {
+	item := make(map[string]any, size)
+	item["id"] = node.ID
+	item["name"] = node.Name
+	item["note"] = node.Note
+	item["address"] = node.Address
+	item["port"] = node.Port
+	item["api_port"] = node.APIPort
+	item["usage_coefficient"] = node.UsageCoefficient
+	item["data_limit"] = node.DataLimit
+	item["proxy_enabled"] = node.ProxyEnabled
+	item["proxy_type"] = node.ProxyType
+	item["proxy_host"] = node.ProxyHost
+	item["proxy_port"] = node.ProxyPort
+	item["proxy_username"] = node.ProxyUsername
+	item["proxy_password"] = node.ProxyPassword
+	item["status"] = node.Status
+	item["message"] = node.Message
+	item["xray_version"] = node.XrayVersion
+	item["geo_mode"] = node.GeoMode
+	item["xray_config_mode"] = node.XrayConfigMode
+	item["uplink"] = node.Uplink
+	item["downlink"] = node.Downlink
+	item["has_custom_certificate"] = node.HasCustomCertificate
+	item["uses_default_certificate"] = node.UsesDefaultCertificate
+	item["certificate_public_key"] = node.CertificatePublicKey
+	item["node_certificate"] = node.NodeCertificate
+	item["node_certificate_key"] = node.NodeCertificateKey
+	return item
+}
+
+func addNodeRuntimeFields(item map[string]any, node nodecontroller.NodeListItem) {
+	item["node_service_version"] = node.NodeServiceVersion
+	item["node_install_mode"] = node.NodeInstallMode
+	item["node_update_channel"] = node.NodeUpdateChannel
+	item["cpu_cores"] = node.CPU.Cores
+	item["cpu_frequency_hz"] = node.CPU.FrequencyHz
+	item["cpu_usage_percent"] = node.CPU.UsagePercent
+	item["memory_used"] = node.Memory.UsedBytes
+	item["memory_total"] = node.Memory.TotalBytes
+	item["memory_usage_percent"] = node.Memory.UsagePercent
+	item["uptime_seconds"] = node.UptimeSeconds
+	item["upload_speed"] = node.Transfer.UploadSpeed
+	item["download_speed"] = node.Transfer.DownloadSpeed
+}
+
 func flattenRuntimeResult(result nodecontroller.RuntimeResult) map[string]any {
 	return map[string]any{
 		"node_id":              result.NodeID,
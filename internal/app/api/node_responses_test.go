@@ -1,6 +1,7 @@
 package api
 
 import (
+	"encoding/json"
 	"testing"
 
 	"github.com/rebeccapanel/rebecca/internal/app/nodecontroller"
@@ -63,3 +64,69 @@ func TestFlattenNodeLiveItemOmitsUnavailableRuntime(t *testing.T) {
 		}
 	}
 }
+
+func TestFlattenNodeLiveItemIncludesReportedRuntime(t *testing.T) {
+	nodeVersion := "dev-abc123"
+	item := flattenNodeLiveItem(nodecontroller.NodeListItem{
+		ID:                 7,
+		Name:               "de-1",
+		Status:             "connected",
+		NodeServiceVersion: &nodeVersion,
+		Transfer: nodecontroller.NetInfo{
+			UploadSpeed: 100,
+		},
+	})
+	if item["node_service_version"] != &nodeVersion || item["upload_speed"] != uint64(100) {
+		t.Fatalf("reported runtime fields were not included: %#v", item)
+	}
+	if _, exists := item["node_binary_tag"]; exists {
+		t.Fatalf("live update must not include node_binary_tag")
+	}
+}
+
+func TestNodeItemResponseMatchesFlattenedKeys(t *testing.T) {
+	nodeVersion := "dev-abc123"
+	node := nodecontroller.NodeListItem{ID: 7, Name: "de-1", NodeServiceVersion: &nodeVersion}
+	raw, err := json.Marshal(newNodeItemResponse(node))
+	if err != nil {
+		t.Fatalf("marshal node response: %v", err)
+	}
+	var decoded map[string]any
+	if err := json.Unmarshal(raw, &decoded); err != nil {
+		t.Fatalf("unmarshal node response: %v", err)
+	}
+	live := flattenNodeLiveItem(node)
+	for key := range live {
+		if _, ok := decoded[key]; !ok {
+			t.Fatalf("node response is missing %q", key)
+		}
+	}
+	if len(decoded) != len(live)+1 {
+		t.Fatalf("node response has %d keys, want %d", len(decoded), len(live)+1)
+	}
+	if _, ok := decoded["node_binary_tag"]; !ok {
+		t.Fatalf("node response is missing node_binary_tag")
+	}
+}
+
+func TestNodeListCacheDropsSnapshotsTakenBeforeInvalidation(t *testing.T) {
+	s := &Server{}
+	_, version, ok := s.cachedNodeList()
+	if ok {
+		t.Fatal("empty cache returned a node list")
+	}
+	s.storeNodeList(version, []nodeItemResponse{{ID: 1}})
+	if nodes, _, ok := s.cachedNodeList(); !ok || len(nodes) != 1 {
+		t.Fatalf("expected cached node list, got %#v ok=%v", nodes, ok)
+	}
+
+	_, staleVersion, _ := s.cachedNodeList()
+	s.invalidateNodeList()
+	if _, _, ok := s.cachedNodeList(); ok {
+		t.Fatal("invalidated node list was served")
+	}
+	s.storeNodeList(staleVersion, []nodeItemResponse{{ID: 2}})
+	if _, _, ok := s.cachedNodeList(); ok {
+		t.Fatal("list read before a node mutation was cached after it")
+	}
+}
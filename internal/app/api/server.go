@@ -59,7 +59,17 @@ type Server struct {
 	userOpsKickMu      sync.Mutex
 	userOpsKicking     bool
 	userOpsKickUserIDs map[int64]struct{}
+	nodeOpsKickMu      sync.Mutex
+	nodeOpsKicking     bool
+	nodeOpsKickNodeIDs map[int64]struct{}
+	nodeOpsKickProcess func(ctx context.Context, nodeID int64)
 	sessionAdmissionMu sync.Mutex
+	nodeListMu         sync.Mutex
+	nodeListVersion    uint64
+	nodeList           nodeListSnapshot
+	serviceListMu      sync.Mutex
+	serviceListVersion uint64
+	serviceLists       map[serviceListKey]serviceListSnapshot
 	operators          *operatorResolver
 }
 
@@ -77,8 +87,9 @@ func New(cfg Config) (*Server, error) {
 		return nil, fmt.Errorf("database integrity check: %w", err)
 	}
 	adminRepo := adminapp.NewRepository(pool.DB, pool.Dialect)
-	nodeRepo := nodecontroller.NewRepository(pool.DB, pool.Dialect)
-	nodeMutationRepo := nodeapp.NewRepository(pool.DB, pool.Dialect)
+	tlsCache := nodeapp.NewTLSCache()
+	nodeRepo := nodecontroller.NewRepositoryWithTLSCache(pool.DB, pool.Dialect, tlsCache)
+	nodeMutationRepo := nodeapp.NewRepositoryWithTLSCache(pool.DB, pool.Dialect, tlsCache)
 	usageRepo := usage.NewRepository(pool.DB, pool.Dialect)
 	userRepo := userapp.NewRepository(pool.DB, pool.Dialect)
 	warpRepo := warpapp.NewRepository(pool.DB, pool.Dialect)
@@ -189,6 +200,11 @@ func (s *Server) handleNodes(w http.ResponseWriter, r *http.Request) {
 		writeError(w, http.StatusMethodNotAllowed, "method not allowed")
 		return
 	}
+	cached, version, ok := s.cachedNodeList()
+	if ok {
+		writeJSON(w, http.StatusOK, cached)
+		return
+	}
 	ctx, cancel := context.WithTimeout(r.Context(), 10*time.Second)
 	defer cancel()
 	result, err := s.nodeController.List(ctx, nodecontroller.Request{})
@@ -196,13 +212,50 @@ func (s *Server) handleNodes(w http.ResponseWriter, r *http.Request) {
 		writeError(w, http.StatusBadGateway, err.Error())
 		return
 	}
-	nodes := make([]map[string]any, 0, len(result.Nodes))
-	for _, node := range result.Nodes {
-		nodes = append(nodes, flattenNodeItem(node))
+	nodes := make([]nodeItemResponse, len(result.Nodes))
+	for idx, node := range result.Nodes {
+		nodes[idx] = newNodeItemResponse(node)
 	}
+	s.storeNodeList(version, nodes)
 	writeJSON(w, http.StatusOK, nodes)
 }
 
+const nodeListCacheTTL = 2 * time.Second
+
+// nodeListSnapshot holds the last /api/nodes response for dashboards polling
+// the list. Node mutations bump nodeListVersion, so a snapshot taken before a
+// write is never served after it; runtime status changes age out with the TTL.
+type nodeListSnapshot struct {
+	version uint64
+	expires time.Time
+	nodes   []nodeItemResponse
+}
+
+func (s *Server) cachedNodeList() ([]nodeItemResponse, uint64, bool) {
+	s.nodeListMu.Lock()
+	defer s.nodeListMu.Unlock()
+	if s.nodeList.nodes != nil && s.nodeList.version == s.nodeListVersion && time.Now().Before(s.nodeList.expires) {
+		return s.nodeList.nodes, s.nodeListVersion, true
+	}
+	return nil, s.nodeListVersion, false
+}
+
+func (s *Server) storeNodeList(version uint64, nodes []nodeItemResponse) {
+	s.nodeListMu.Lock()
+	defer s.nodeListMu.Unlock()
+	if version != s.nodeListVersion {
+		return
+	}
+	s.nodeList = nodeListSnapshot{version: version, expires: time.Now().Add(nodeListCacheTTL), nodes: nodes}
+}
+
+func (s *Server) invalidateNodeList() {
+	s.nodeListMu.Lock()
+	defer s.nodeListMu.Unlock()
+	s.nodeListVersion++
+	s.nodeList = nodeListSnapshot{}
+}
+
 func (s *Server) handleNodesUsage(w http.ResponseWriter, r *http.Request) {
 	if r.URL.Path != "/api/nodes/usage" {
 		writeError(w, http.StatusNotFound, "not found")
@@ -362,12 +415,13 @@ func (s *Server) handleNode(w http.ResponseWriter, r *http.Request, nodeID int64
 		writeControllerError(w, err)
 		return
 	}
-	writeJSON(w, http.StatusOK, flattenNodeItem(node))
+	writeJSON(w, http.StatusOK, newNodeItemResponse(node))
 }
 
 func (s *Server) handleNodeReconnect(w http.ResponseWriter, r *http.Request, nodeID int64) {
 	ctx, cancel := context.WithTimeout(r.Context(), 90*time.Second)
 	defer cancel()
+	defer s.invalidateNodeList()
 	result, err := s.nodeController.Reconnect(ctx, nodecontroller.Request{NodeID: nodeID})
 	if err != nil {
 		writeControllerError(w, err)
@@ -379,6 +433,7 @@ func (s *Server) handleNodeReconnect(w http.ResponseWriter, r *http.Request, nod
 func (s *Server) handleNodeRestart(w http.ResponseWriter, r *http.Request, nodeID int64) {
 	ctx, cancel := context.WithTimeout(r.Context(), 90*time.Second)
 	defer cancel()
+	defer s.invalidateNodeList()
 	result, err := s.nodeController.Restart(ctx, nodecontroller.Request{NodeID: nodeID})
 	if err != nil {
 		writeControllerError(w, err)
@@ -390,6 +445,7 @@ func (s *Server) handleNodeRestart(w http.ResponseWriter, r *http.Request, nodeI
 func (s *Server) handleNodeSync(w http.ResponseWriter, r *http.Request, nodeID int64) {
 	ctx, cancel := context.WithTimeout(r.Context(), 90*time.Second)
 	defer cancel()
+	defer s.invalidateNodeList()
 	result, err := s.nodeController.Sync(ctx, nodecontroller.Request{NodeID: nodeID})
 	if err != nil {
 		writeControllerError(w, err)
@@ -430,14 +486,14 @@ func (s *Server) handleNodeUsageDaily(w http.ResponseWriter, r *http.Request, no
 		writeError(w, http.StatusBadRequest, "Invalid granularity. Use 'day' or 'hour'.")
 		return
 	}
-	nodeName, err := s.nodeName(r.Context(), nodeID)
+	start, end, err := normalizeUsageRange(r.URL.Query().Get("start"), r.URL.Query().Get("end"))
 	if err != nil {
-		writeControllerError(w, err)
+		writeError(w, http.StatusBadRequest, err.Error())
 		return
 	}
-	start, end, err := normalizeUsageRange(r.URL.Query().Get("start"), r.URL.Query().Get("end"))
+	nodeName, err := s.nodeName(r.Context(), nodeID)
 	if err != nil {
-		writeError(w, http.StatusBadRequest, err.Error())
+		writeControllerError(w, err)
 		return
 	}
 	rows, err := s.usageService.NodeUsageByDay(r.Context(), usage.UsageRequest{
@@ -496,11 +552,11 @@ func (s *Server) handleNodeGeoUpdate(w http.ResponseWriter, r *http.Request, nod
 		writeError(w, status, err.Error())
 		return
 	}
-	ctx, cancel := context.WithTimeout(r.Context(), 5*time.Minute)
-	defer cancel()
-	result, err := s.nodeController.UpdateGeo(ctx, nodecontroller.Request{
-		NodeID: nodeID,
-		Files:  files,
+	result, err := runNodeHostAction(r, 5*time.Minute, func(ctx context.Context) (nodecontroller.RuntimeResult, error) {
+		return s.nodeController.UpdateGeo(ctx, nodecontroller.Request{
+			NodeID: nodeID,
+			Files:  files,
+		})
 	})
 	if err != nil {
 		writeControllerError(w, err)
@@ -510,9 +566,9 @@ func (s *Server) handleNodeGeoUpdate(w http.ResponseWriter, r *http.Request, nod
 }
 
 func (s *Server) handleNodeServiceRestart(w http.ResponseWriter, r *http.Request, nodeID int64) {
-	ctx, cancel := context.WithTimeout(r.Context(), 2*time.Minute)
-	defer cancel()
-	result, err := s.nodeController.RestartService(ctx, nodecontroller.Request{NodeID: nodeID})
+	result, err := runNodeHostAction(r, 2*time.Minute, func(ctx context.Context) (nodecontroller.RuntimeResult, error) {
+		return s.nodeController.RestartService(ctx, nodecontroller.Request{NodeID: nodeID})
+	})
 	if err != nil {
 		writeControllerError(w, err)
 		return
@@ -529,12 +585,12 @@ func (s *Server) handleNodeServiceUpdate(w http.ResponseWriter, r *http.Request,
 		writeError(w, http.StatusBadRequest, err.Error())
 		return
 	}
-	ctx, cancel := context.WithTimeout(r.Context(), 5*time.Minute)
-	defer cancel()
-	result, err := s.nodeController.UpdateService(ctx, nodecontroller.Request{
-		NodeID:  nodeID,
-		Channel: payload.Channel,
-		Version: payload.Version,
+	result, err := runNodeHostAction(r, 5*time.Minute, func(ctx context.Context) (nodecontroller.RuntimeResult, error) {
+		return s.nodeController.UpdateService(ctx, nodecontroller.Request{
+			NodeID:  nodeID,
+			Channel: payload.Channel,
+			Version: payload.Version,
+		})
 	})
 	if err != nil {
 		writeControllerError(w, err)
@@ -544,9 +600,9 @@ func (s *Server) handleNodeServiceUpdate(w http.ResponseWriter, r *http.Request,
 }
 
 func (s *Server) handleNodeHostReboot(w http.ResponseWriter, r *http.Request, nodeID int64) {
-	ctx, cancel := context.WithTimeout(r.Context(), 2*time.Minute)
-	defer cancel()
-	result, err := s.nodeController.RebootHost(ctx, nodecontroller.Request{NodeID: nodeID})
+	result, err := runNodeHostAction(r, 2*time.Minute, func(ctx context.Context) (nodecontroller.RuntimeResult, error) {
+		return s.nodeController.RebootHost(ctx, nodecontroller.Request{NodeID: nodeID})
+	})
 	if err != nil {
 		writeControllerError(w, err)
 		return
@@ -554,6 +610,30 @@ func (s *Server) handleNodeHostReboot(w http.ResponseWriter, r *http.Request, no
 	writeJSON(w, http.StatusAccepted, flattenRuntimeResult(result))
 }
 
+// runNodeHostAction runs a long node RPC on its own goroutine and context, so a
+// dashboard request that goes away does not abort a half-applied update or
+// restart. The handler still waits for the result while the client is there.
+func runNodeHostAction(r *http.Request, timeout time.Duration, action func(context.Context) (nodecontroller.RuntimeResult, error)) (nodecontroller.RuntimeResult, error) {
+	type outcome struct {
+		result nodecontroller.RuntimeResult
+		err    error
+	}
+	done := make(chan outcome, 1)
+	parent := context.WithoutCancel(r.Context())
+	go func() {
+		ctx, cancel := context.WithTimeout(parent, timeout)
+		defer cancel()
+		result, err := action(ctx)
+		done <- outcome{result: result, err: err}
+	}()
+	select {
+	case out := <-done:
+		return out.result, out.err
+	case <-r.Context().Done():
+		return nodecontroller.RuntimeResult{}, r.Context().Err()
+	}
+}
+
 func parseNodePath(path string) (int64, string, bool) {
 	rest := strings.TrimPrefix(path, "/api/node/")
 	if rest == path || rest == "" {
@@ -569,7 +649,7 @@ func parseNodePath(path string) (int64, string, bool) {
 
 func (s *Server) nodeName(ctx context.Context, nodeID int64) (string, error) {
 	var name string
-	err := s.db.QueryRowContext(ctx, `SELECT COALESCE(name, '') FROM nodes WHERE id = ? LIMIT 1`, nodeID).Scan(&name)
+	err := s.db.QueryRowContext(ctx, `SELECT COALESCE(name, '') FROM nodes WHERE id = ?`, nodeID).Scan(&name)
 	if err == sql.ErrNoRows {
 		return "", fmt.Errorf("node not found")
 	}
@@ -11,9 +11,11 @@ import (
 	"net/http"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	adminapp "github.com/rebeccapanel/rebecca/internal/app/admin"
+	"github.com/rebeccapanel/rebecca/internal/app/nodecontroller"
 	"github.com/rebeccapanel/rebecca/internal/app/usage"
 	userapp "github.com/rebeccapanel/rebecca/internal/app/user"
 	"github.com/rebeccapanel/rebecca/internal/app/xrayconfig"
@@ -223,14 +225,86 @@ func (s *Server) handleServicesList(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	name := strings.TrimSpace(r.URL.Query().Get("name"))
+	key := newServiceListKey(principal.Context.Admin, name, offset, limit)
+	cached, version, ok := s.cachedServiceList(key)
+	if ok {
+		writeJSON(w, http.StatusOK, map[string]any{"services": cached.services, "total": cached.total})
+		return
+	}
 	services, total, err := s.servicesList(r, principal.Context.Admin, name, offset, limit)
 	if err != nil {
 		writeError(w, http.StatusInternalServerError, err.Error())
 		return
 	}
+	s.storeServiceList(key, version, services, total)
 	writeJSON(w, http.StatusOK, map[string]any{"services": services, "total": total})
 }
 
+const (
+	serviceListCacheTTL     = 5 * time.Second
+	serviceListCacheEntries = 64
+)
+
+// serviceListKey identifies one services page. Global admins all see the same
+// rows, so they share the zero admin ID.
+type serviceListKey struct {
+	adminID  int64
+	name     string
+	offset   int64
+	limit    int64
+	hasLimit bool
+}
+
+// serviceListSnapshot holds a services page for dashboards polling the list.
+// Service writes bump serviceListVersion, so a page read before a write is
+// never served after it; traffic and user counts age out with the TTL.
+type serviceListSnapshot struct {
+	version  uint64
+	expires  time.Time
+	services []serviceBaseResponse
+	total    int64
+}
+
+func newServiceListKey(dbadmin adminapp.Admin, name string, offset int64, limit *int64) serviceListKey {
+	key := serviceListKey{name: name, offset: offset}
+	if !dbadmin.Role.IsGlobal() {
+		key.adminID = dbadmin.ID
+	}
+	if limit != nil {
+		key.limit, key.hasLimit = *limit, true
+	}
+	return key
+}
+
+func (s *Server) cachedServiceList(key serviceListKey) (serviceListSnapshot, uint64, bool) {
+	s.serviceListMu.Lock()
+	defer s.serviceListMu.Unlock()
+	snapshot, ok := s.serviceLists[key]
+	if ok && snapshot.version == s.serviceListVersion && time.Now().Before(snapshot.expires) {
+		return snapshot, s.serviceListVersion, true
+	}
+	return serviceListSnapshot{}, s.serviceListVersion, false
+}
+
+func (s *Server) storeServiceList(key serviceListKey, version uint64, services []serviceBaseResponse, total int64) {
+	s.serviceListMu.Lock()
+	defer s.serviceListMu.Unlock()
+	if version != s.serviceListVersion {
+		return
+	}
+	if s.serviceLists == nil || len(s.serviceLists) >= serviceListCacheEntries {
+		s.serviceLists = map[serviceListKey]serviceListSnapshot{}
+	}
+	s.serviceLists[key] = serviceListSnapshot{version: version, expires: time.Now().Add(serviceListCacheTTL), services: services, total: total}
+}
+
+func (s *Server) invalidateServiceList() {
+	s.serviceListMu.Lock()
+	defer s.serviceListMu.Unlock()
+	s.serviceListVersion++
+	s.serviceLists = nil
+}
+
 func (s *Server) handleServiceCreate(w http.ResponseWriter, r *http.Request) {
 	if err := requireServiceSudo(r); err != nil {
 		writeServiceError(w, err)
@@ -272,7 +346,19 @@ func (s *Server) handleServiceCreate(w http.ResponseWriter, r *http.Request) {
 		writeServiceError(w, err)
 		return
 	}
-	s.writeServiceDetail(w, r, serviceID, http.StatusCreated)
+	s.invalidateServiceList()
+	// A new service has no traffic or users yet, so its base row is known
+	// from the payload and only the linked hosts and admins are read back.
+	base := serviceBaseResponse{ID: serviceID, Name: strings.TrimSpace(payload.Name)}
+	if description, ok := nullableTrimmedString(payload.Description).(string); ok {
+		base.Description = &description
+	}
+	detail, err := s.serviceDetailWithBase(r.Context(), base)
+	if err != nil {
+		writeServiceError(w, err)
+		return
+	}
+	writeJSON(w, http.StatusCreated, detail)
 }
 
 func (s *Server) handleServiceDetail(w http.ResponseWriter, r *http.Request, serviceID int64) {
@@ -281,9 +367,13 @@ func (s *Server) handleServiceDetail(w http.ResponseWriter, r *http.Request, ser
 		writeError(w, http.StatusUnauthorized, "missing admin context")
 		return
 	}
-	if err := s.ensureServiceVisible(r.Context(), serviceID, principal.Context.Admin); err != nil {
-		writeServiceError(w, err)
-		return
+	// serviceDetail already answers 404 for a missing service, so only
+	// scoped admins need the separate visibility lookup.
+	if !principal.Context.Admin.Role.IsGlobal() {
+		if err := s.ensureServiceVisible(r.Context(), serviceID, principal.Context.Admin); err != nil {
+			writeServiceError(w, err)
+			return
+		}
 	}
 	s.writeServiceDetail(w, r, serviceID, http.StatusOK)
 }
@@ -357,6 +447,7 @@ func (s *Server) handleServiceUpdate(w http.ResponseWriter, r *http.Request, ser
 		writeServiceError(w, err)
 		return
 	}
+	s.invalidateServiceList()
 	s.writeServiceDetail(w, r, serviceID, http.StatusOK)
 }
 
@@ -375,6 +466,8 @@ func (s *Server) handleServiceDelete(w http.ResponseWriter, r *http.Request, ser
 		payload.Mode = "transfer_users"
 	}
 
+	var refreshUserIDs []int64
+	var syncedNodeIDs []int64
 	err := s.withTx(r.Context(), func(tx *sql.Tx) error {
 		if err := ensureServiceExistsTx(r.Context(), tx, serviceID); err != nil {
 			return err
@@ -386,7 +479,7 @@ func (s *Server) handleServiceDelete(w http.ResponseWriter, r *http.Request, ser
 		if adminLinks > 0 && !payload.UnlinkAdmins {
 			return statusError{status: http.StatusBadRequest, detail: "Service has admins assigned. Unlink them before deleting."}
 		}
-		refreshUserIDs := []int64{}
+		refreshUserIDs = nil
 		switch payload.Mode {
 		case "transfer_users":
 			ids, err := serviceUserIDsTx(r.Context(), tx, serviceID)
@@ -432,21 +525,50 @@ func (s *Server) handleServiceDelete(w http.ResponseWriter, r *http.Request, ser
 		if _, err := tx.ExecContext(r.Context(), `DELETE FROM services WHERE id = ?`, serviceID); err != nil {
 			return err
 		}
-		for _, userID := range refreshUserIDs {
-			id := userID
-			if err := enqueueNodeOperationTx(r.Context(), tx, "update_user", nil, &id, map[string]any{"service_id": serviceID, "deleted": true}); err != nil {
-				return err
-			}
-		}
-		return nil
+		var err error
+		syncedNodeIDs, err = s.enqueueServiceUsersRuntimeRefreshTx(r.Context(), tx, refreshUserIDs, map[string]any{"service_id": serviceID, "deleted": true})
+		return err
 	})
 	if err != nil {
 		writeServiceError(w, err)
 		return
 	}
+	s.invalidateServiceList()
+	s.systemStatsService().InvalidateSummaries()
+	if len(syncedNodeIDs) > 0 {
+		s.kickNodeOperationsSoon(syncedNodeIDs...)
+	} else {
+		s.kickUserNodeOperationsSoon(refreshUserIDs...)
+	}
 	w.WriteHeader(http.StatusNoContent)
 }
 
+// enqueueServiceUsersRuntimeRefreshTx refreshes the runtime state of the users
+// of a deleted service on every connected node. Small batches get per-user
+// update operations that are hot-applied right after commit; from the node
+// queue's backlog threshold on, each node's queued user deltas are replaced by
+// one full config sync instead. It returns the nodes that got a full sync.
+func (s *Server) enqueueServiceUsersRuntimeRefreshTx(ctx context.Context, tx *sql.Tx, userIDs []int64, payload map[string]any) ([]int64, error) {
+	if len(userIDs) < nodecontroller.RuntimeBacklogSyncThreshold {
+		return nil, enqueueUsersNodeOperationTx(ctx, tx, "update_user", userIDs, payload)
+	}
+	nodeIDs, err := connectedNodeIDsTx(ctx, tx)
+	if err != nil {
+		return nil, err
+	}
+	syncPayload := map[string]any{"source": "service_delete", "operation_count": len(userIDs)}
+	for key, value := range payload {
+		syncPayload[key] = value
+	}
+	now := time.Now().UTC()
+	for _, nodeID := range nodeIDs {
+		if err := s.nodeController.ReplaceRuntimeUserOperationsWithSyncTx(ctx, tx, nodeID, syncPayload, now); err != nil {
+			return nil, err
+		}
+	}
+	return nodeIDs, nil
+}
+
 func (s *Server) handleServiceResetUsage(w http.ResponseWriter, r *http.Request, serviceID int64) {
 	if err := requireServiceSudo(r); err != nil {
 		writeServiceError(w, err)
@@ -467,6 +589,8 @@ func (s *Server) handleServiceResetUsage(w http.ResponseWriter, r *http.Request,
 		writeServiceError(w, err)
 		return
 	}
+	s.invalidateServiceList()
+	s.systemStatsService().InvalidateSummaries()
 	s.writeServiceDetail(w, r, serviceID, http.StatusOK)
 }
 
@@ -484,6 +608,7 @@ func (s *Server) handleServiceAutoInboundCreate(w http.ResponseWriter, r *http.R
 		writeServiceAutoInboundError(w, err)
 		return
 	}
+	s.invalidateServiceList()
 	writeJSON(w, http.StatusOK, result)
 }
 
@@ -501,6 +626,7 @@ func (s *Server) handleServiceAutoInboundDelete(w http.ResponseWriter, r *http.R
 		writeServiceAutoInboundError(w, err)
 		return
 	}
+	s.invalidateServiceList()
 	writeJSON(w, http.StatusOK, result)
 }
 
@@ -912,12 +1038,9 @@ func (s *Server) servicesList(r *http.Request, dbadmin adminapp.Admin, name stri
 	s.description,
 	COALESCE(s.used_traffic, 0),
 	COALESCE(s.lifetime_used_traffic, 0),
-	COALESCE(SUM(CASE WHEN h.id IS NOT NULL AND COALESCE(h.is_disabled, 0) = 0 THEN 1 ELSE 0 END), 0) AS host_count,
-	(SELECT COUNT(*) FROM users u WHERE u.service_id = s.id AND COALESCE(u.status, '') != 'deleted') AS user_count
-FROM services s` + join + `
-LEFT JOIN service_hosts sh ON sh.service_id = s.id
-LEFT JOIN hosts h ON h.id = sh.host_id` + whereSQL + `
-GROUP BY s.id, s.name, s.description, s.used_traffic, s.lifetime_used_traffic
+	0 AS host_count,
+	0 AS user_count
+FROM services s` + join + whereSQL + `
 ORDER BY s.created_at DESC, s.id DESC`
 	queryArgs := append([]any{}, args...)
 	if limit != nil {
@@ -937,14 +1060,100 @@ ORDER BY s.created_at DESC, s.id DESC`
 	}
 	defer rows.Close()
 	services := []serviceBaseResponse{}
+	serviceIDs := []int64{}
 	for rows.Next() {
 		item, err := scanServiceBase(rows)
 		if err != nil {
 			return nil, 0, err
 		}
 		services = append(services, item)
+		serviceIDs = append(serviceIDs, item.ID)
 	}
-	return services, total, rows.Err()
+	if err := rows.Err(); err != nil {
+		return nil, 0, err
+	}
+	_ = rows.Close()
+	// The two count queries are independent, so they run side by side on
+	// separate pool connections.
+	var hostCounts, userCounts map[int64]int64
+	var hostErr, userErr error
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		hostCounts, hostErr = serviceHostCounts(r.Context(), s.db, serviceIDs)
+	}()
+	userCounts, userErr = serviceUserCounts(r.Context(), s.db, serviceIDs)
+	wg.Wait()
+	if hostErr != nil {
+		return nil, 0, hostErr
+	}
+	if userErr != nil {
+		return nil, 0, userErr
+	}
+	for idx := range services {
+		item := &services[idx]
+		item.HostCount = hostCounts[item.ID]
+		item.HasHosts = item.HostCount > 0
+		item.Broken = item.HostCount == 0
+		item.UserCount = userCounts[item.ID]
+	}
+	return services, total, nil
+}
+
+// serviceHostCounts counts the enabled hosts of every listed service with one
+// grouped query, so the page query itself no longer joins and groups every
+// service's host links before pagination.
+func serviceHostCounts(ctx context.Context, db queryer, serviceIDs []int64) (map[int64]int64, error) {
+	counts := make(map[int64]int64, len(serviceIDs))
+	if len(serviceIDs) == 0 {
+		return counts, nil
+	}
+	placeholders, args := sqlInClauseInt64(serviceIDs)
+	rows, err := db.QueryContext(ctx, `SELECT sh.service_id, COUNT(*)
+FROM service_hosts sh
+JOIN hosts h ON h.id = sh.host_id
+WHERE sh.service_id IN (`+placeholders+`) AND COALESCE(h.is_disabled, 0) = 0
+GROUP BY sh.service_id`, args...)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	for rows.Next() {
+		var serviceID, count int64
+		if err := rows.Scan(&serviceID, &count); err != nil {
+			return nil, err
+		}
+		counts[serviceID] = count
+	}
+	return counts, rows.Err()
+}
+
+// serviceUserCounts counts the live users of every listed service with one
+// grouped query, instead of a correlated subquery evaluated for each service
+// row before pagination is applied.
+func serviceUserCounts(ctx context.Context, db queryer, serviceIDs []int64) (map[int64]int64, error) {
+	counts := make(map[int64]int64, len(serviceIDs))
+	if len(serviceIDs) == 0 {
+		return counts, nil
+	}
+	placeholders, args := sqlInClauseInt64(serviceIDs)
+	rows, err := db.QueryContext(ctx, `SELECT service_id, COUNT(*)
+FROM users
+WHERE service_id IN (`+placeholders+`) AND COALESCE(status, '') != 'deleted'
+GROUP BY service_id`, args...)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	for rows.Next() {
+		var serviceID, count int64
+		if err := rows.Scan(&serviceID, &count); err != nil {
+			return nil, err
+		}
+		counts[serviceID] = count
+	}
+	return counts, rows.Err()
 }
 
 func (s *Server) serviceDetail(ctx context.Context, serviceID int64) (serviceDetailResponse, error) {
@@ -952,14 +1161,33 @@ func (s *Server) serviceDetail(ctx context.Context, serviceID int64) (serviceDet
 	if err != nil {
 		return serviceDetailResponse{}, err
 	}
-	hosts, hostIDs, err := s.serviceHosts(ctx, serviceID)
-	if err != nil {
-		return serviceDetailResponse{}, err
+	return s.serviceDetailWithBase(ctx, base)
+}
+
+// serviceDetailWithBase loads the linked hosts and admins of a service. The
+// host count is taken from the enabled hosts loaded here rather than from the
+// base row.
+func (s *Server) serviceDetailWithBase(ctx context.Context, base serviceBaseResponse) (serviceDetailResponse, error) {
+	var hosts []serviceHostResponse
+	var hostIDs []int64
+	var hostsErr error
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		hosts, hostIDs, hostsErr = s.serviceHosts(ctx, base.ID)
+	}()
+	admins, adminIDs, err := s.serviceAdmins(ctx, base.ID)
+	wg.Wait()
+	if hostsErr != nil {
+		return serviceDetailResponse{}, hostsErr
 	}
-	admins, adminIDs, err := s.serviceAdmins(ctx, serviceID)
 	if err != nil {
 		return serviceDetailResponse{}, err
 	}
+	base.HostCount = int64(len(hosts))
+	base.HasHosts = base.HostCount > 0
+	base.Broken = base.HostCount == 0
 	return serviceDetailResponse{
 		serviceBaseResponse: base,
 		Admins:              admins,
@@ -976,13 +1204,10 @@ func (s *Server) serviceBase(ctx context.Context, serviceID int64) (serviceBaseR
 	s.description,
 	COALESCE(s.used_traffic, 0),
 	COALESCE(s.lifetime_used_traffic, 0),
-	COALESCE(SUM(CASE WHEN h.id IS NOT NULL AND COALESCE(h.is_disabled, 0) = 0 THEN 1 ELSE 0 END), 0) AS host_count,
+	0 AS host_count,
 	(SELECT COUNT(*) FROM users u WHERE u.service_id = s.id AND COALESCE(u.status, '') != 'deleted') AS user_count
 FROM services s
-LEFT JOIN service_hosts sh ON sh.service_id = s.id
-LEFT JOIN hosts h ON h.id = sh.host_id
-WHERE s.id = ?
-GROUP BY s.id, s.name, s.description, s.used_traffic, s.lifetime_used_traffic`, serviceID)
+WHERE s.id = ?`, serviceID)
 	item, err := scanServiceBase(row)
 	if err == sql.ErrNoRows {
 		return serviceBaseResponse{}, statusError{status: http.StatusNotFound, detail: "Service not found"}
@@ -1141,6 +1366,11 @@ func (s *Server) ensureServiceVisible(ctx context.Context, serviceID int64, dbad
 	if dbadmin.Role.IsGlobal() {
 		return ensureServiceExistsDB(ctx, s.db, serviceID)
 	}
+	// The authenticated admin already carries its service links; only fall
+	// back to the database when the service is not among them.
+	if adminServiceAssigned(dbadmin, serviceID) {
+		return nil
+	}
 	var exists int64
 	err := s.db.QueryRowContext(ctx, `SELECT COUNT(*) FROM admins_services WHERE admin_id = ? AND service_id = ?`, dbadmin.ID, serviceID).Scan(&exists)
 	if err != nil {
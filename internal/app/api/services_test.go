@@ -3,6 +3,7 @@
 package api
 
 import (
+	"context"
 	"database/sql"
 	"encoding/base64"
 	"encoding/json"
@@ -10,8 +11,10 @@ import (
 	"strconv"
 	"strings"
 	"testing"
+	"time"
 
 	adminapp "github.com/rebeccapanel/rebecca/internal/app/admin"
+	"github.com/rebeccapanel/rebecca/internal/app/nodecontroller"
 	"github.com/rebeccapanel/rebecca/internal/app/usage"
 	userapp "github.com/rebeccapanel/rebecca/internal/app/user"
 )
@@ -457,6 +460,26 @@ func TestServiceDeleteTransferUsersEnqueuesOperations(t *testing.T) {
 		(21, 'transfer_b', 2, 'limited', ?)`, source.ID, source.ID); err != nil {
 		t.Fatal(err)
 	}
+	rec = adminJSONRequest(t, server, http.MethodGet, "/api/v2/services", token, `{}`)
+	if rec.Code != http.StatusOK {
+		t.Fatalf("list status = %d body=%s", rec.Code, rec.Body.String())
+	}
+	var list struct {
+		Services []struct {
+			ID        int64 `json:"id"`
+			UserCount int64 `json:"user_count"`
+		} `json:"services"`
+	}
+	if err := json.Unmarshal(rec.Body.Bytes(), &list); err != nil {
+		t.Fatal(err)
+	}
+	userCounts := map[int64]int64{}
+	for _, service := range list.Services {
+		userCounts[service.ID] = service.UserCount
+	}
+	if len(userCounts) != 2 || userCounts[source.ID] != 2 || userCounts[target.ID] != 0 {
+		t.Fatalf("unexpected service user counts: %#v", list.Services)
+	}
 
 	rec = adminJSONRequest(t, server, http.MethodDelete, "/api/v2/services/"+itoa(source.ID), token, `{"mode":"transfer_users","target_service_id":`+itoa(target.ID)+`,"unlink_admins":true}`)
 	if rec.Code != http.StatusNoContent {
@@ -468,6 +491,82 @@ func TestServiceDeleteTransferUsersEnqueuesOperations(t *testing.T) {
 	assertDBInt64(t, db, `SELECT COUNT(*) FROM node_operations WHERE operation_type = 'sync_config'`, 0)
 }
 
+func TestServiceDeleteLargeServiceQueuesOneSyncPerNode(t *testing.T) {
+	server, db, token := testServiceServer(t)
+	kicked := make(chan int64, 1)
+	server.nodeOpsKickProcess = func(ctx context.Context, nodeID int64) {
+		kicked <- nodeID
+	}
+
+	rec := adminJSONRequest(t, server, http.MethodPost, "/api/v2/services", token, `{"name":"Large","hosts":[{"host_id":1}],"admin_ids":[2]}`)
+	if rec.Code != http.StatusCreated {
+		t.Fatalf("create status = %d body=%s", rec.Code, rec.Body.String())
+	}
+	var created struct {
+		ID int64 `json:"id"`
+	}
+	if err := json.Unmarshal(rec.Body.Bytes(), &created); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := db.Exec(`INSERT INTO nodes (id, name, status) VALUES (1, 'node-a', 'connected')`); err != nil {
+		t.Fatal(err)
+	}
+	for i := 0; i < nodecontroller.RuntimeBacklogSyncThreshold; i++ {
+		if _, err := db.Exec(`INSERT INTO users (id, username, admin_id, status, service_id) VALUES (?, ?, 2, 'active', ?)`, 100+i, "bulk_"+itoa(int64(i)), created.ID); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	rec = adminJSONRequest(t, server, http.MethodDelete, "/api/v2/services/"+itoa(created.ID), token, `{"mode":"delete_users","unlink_admins":true}`)
+	if rec.Code != http.StatusNoContent {
+		t.Fatalf("delete status = %d body=%s", rec.Code, rec.Body.String())
+	}
+	assertDBInt64(t, db, `SELECT COUNT(*) FROM users WHERE status = 'deleted'`, int64(nodecontroller.RuntimeBacklogSyncThreshold))
+	assertDBInt64(t, db, `SELECT COUNT(*) FROM node_operations WHERE operation_type = 'update_user'`, 0)
+	assertDBInt64(t, db, `SELECT COUNT(*) FROM node_operations WHERE operation_type = 'sync_config' AND node_id = 1 AND status = 'pending'`, 1)
+	select {
+	case nodeID := <-kicked:
+		if nodeID != 1 {
+			t.Fatalf("kicked node = %d, want 1", nodeID)
+		}
+	case <-time.After(5 * time.Second):
+		t.Fatal("node operation queue was not kicked")
+	}
+}
+
+func TestServicesListCacheIsDroppedByServiceWrites(t *testing.T) {
+	server, db, token := testServiceServer(t)
+	listTotal := func() int64 {
+		t.Helper()
+		rec := adminJSONRequest(t, server, http.MethodGet, "/api/v2/services", token, `{}`)
+		if rec.Code != http.StatusOK {
+			t.Fatalf("list status = %d body=%s", rec.Code, rec.Body.String())
+		}
+		var list struct {
+			Total int64 `json:"total"`
+		}
+		if err := json.Unmarshal(rec.Body.Bytes(), &list); err != nil {
+			t.Fatal(err)
+		}
+		return list.Total
+	}
+
+	before := listTotal()
+	if _, err := db.Exec(`INSERT INTO services (name) VALUES ('Out of band')`); err != nil {
+		t.Fatal(err)
+	}
+	if got := listTotal(); got != before {
+		t.Fatalf("expected cached total %d, got %d", before, got)
+	}
+	rec := adminJSONRequest(t, server, http.MethodPost, "/api/v2/services", token, `{"name":"Cached","hosts":[{"host_id":1}]}`)
+	if rec.Code != http.StatusCreated {
+		t.Fatalf("create status = %d body=%s", rec.Code, rec.Body.String())
+	}
+	if got := listTotal(); got != before+2 {
+		t.Fatalf("expected total %d after create, got %d", before+2, got)
+	}
+}
+
 func TestServiceDeleteEmptyService(t *testing.T) {
 	server, db, token := testServiceServer(t)
 
@@ -43,6 +43,7 @@ func (s *Server) handlePanelSettings(w http.ResponseWriter, r *http.Request) {
 			writeError(w, http.StatusInternalServerError, err.Error())
 			return
 		}
+		s.userService.InvalidateSubscriptionSettings()
 		writeJSON(w, http.StatusOK, settings)
 	default:
 		writeError(w, http.StatusMethodNotAllowed, "method not allowed")
@@ -109,6 +110,7 @@ func (s *Server) handleSubscriptionSettings(w http.ResponseWriter, r *http.Reque
 			writeError(w, http.StatusBadRequest, err.Error())
 			return
 		}
+		s.userService.InvalidateSubscriptionSettings()
 		writeJSON(w, http.StatusOK, settings)
 	default:
 		writeError(w, http.StatusMethodNotAllowed, "method not allowed")
@@ -144,6 +146,7 @@ func (s *Server) handleAdminSubscriptionSettingsPath(w http.ResponseWriter, r *h
 		writeError(w, http.StatusBadRequest, err.Error())
 		return
 	}
+	s.userService.InvalidateSubscriptionSettings()
 	writeJSON(w, http.StatusOK, adminSettings)
 }
 
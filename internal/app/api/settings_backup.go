@@ -3,6 +3,7 @@ package api
 import (
 	"errors"
 	"io"
+	"mime/multipart"
 	"net/http"
 	"os"
 	"path/filepath"
@@ -83,16 +84,33 @@ func (s *Server) isBinaryRuntime() bool {
 	return strings.EqualFold(strings.TrimSpace(info.Mode), "binary")
 }
 
+// saveBackupUpload streams the "file" part of the multipart body straight to
+// a temp file, so the archive is never buffered in memory or spooled twice.
 func saveBackupUpload(r *http.Request) (string, func(), error) {
-	if err := r.ParseMultipartForm(128 << 20); err != nil {
-		return "", func() {}, err
-	}
-	file, header, err := r.FormFile("file")
+	reader, err := r.MultipartReader()
 	if err != nil {
 		return "", func() {}, err
 	}
-	defer file.Close()
-	suffix := filepath.Ext(header.Filename)
+	for {
+		part, err := reader.NextPart()
+		if err == io.EOF {
+			return "", func() {}, http.ErrMissingFile
+		}
+		if err != nil {
+			return "", func() {}, err
+		}
+		if part.FormName() != "file" || part.FileName() == "" {
+			_ = part.Close()
+			continue
+		}
+		path, cleanup, err := writeBackupUploadPart(part)
+		_ = part.Close()
+		return path, cleanup, err
+	}
+}
+
+func writeBackupUploadPart(part *multipart.Part) (string, func(), error) {
+	suffix := filepath.Ext(part.FileName())
 	if suffix == "" {
 		suffix = backupapp.Extension
 	}
@@ -102,7 +120,7 @@ func saveBackupUpload(r *http.Request) (string, func(), error) {
 	}
 	path := tempFile.Name()
 	cleanup := func() { _ = os.Remove(path) }
-	if _, err := io.Copy(tempFile, file); err != nil {
+	if _, err := io.Copy(tempFile, part); err != nil {
 		_ = tempFile.Close()
 		cleanup()
 		return "", func() {}, err
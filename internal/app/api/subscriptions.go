@@ -1,9 +1,12 @@
 package api
 
 import (
+	"crypto/sha256"
+	"encoding/hex"
 	"encoding/json"
 	"errors"
 	"net/http"
+	"net/url"
 	"strings"
 
 	userapp "github.com/rebeccapanel/rebecca/internal/app/user"
@@ -15,7 +18,8 @@ func (s *Server) handleSubscriptionPath(w http.ResponseWriter, r *http.Request)
 		writeError(w, http.StatusMethodNotAllowed, "method not allowed")
 		return
 	}
-	req, ok, err := s.userService.ResolveSubscriptionAlias(r.Context(), r.URL.Path, r.URL.Query())
+	query := r.URL.Query()
+	req, ok, err := s.userService.ResolveSubscriptionAlias(r.Context(), r.URL.Path, query)
 	if err != nil {
 		writeSubscriptionError(w, err)
 		return
@@ -24,16 +28,16 @@ func (s *Server) handleSubscriptionPath(w http.ResponseWriter, r *http.Request)
 		writeError(w, http.StatusNotFound, "Not Found")
 		return
 	}
-	s.handleResolvedSubscription(w, r, req)
+	s.handleResolvedSubscription(w, r, req, query)
 }
 
-func (s *Server) handleResolvedSubscription(w http.ResponseWriter, r *http.Request, req userapp.SubscriptionRenderRequest) {
+func (s *Server) handleResolvedSubscription(w http.ResponseWriter, r *http.Request, req userapp.SubscriptionRenderRequest, query url.Values) {
 	setSubscriptionNoCacheHeaders(w)
 	req.UserAgent = r.Header.Get("User-Agent")
 	req.Accept = r.Header.Get("Accept")
 	req.URL = requestAbsoluteURL(r)
-	req.Start = r.URL.Query().Get("start")
-	req.End = r.URL.Query().Get("end")
+	req.Start = query.Get("start")
+	req.End = query.Get("end")
 	req.ReadOnly = s.cfg.SubscriptionReadOnly
 	if runtimeSettings, err := s.settingsRepo.RuntimeSettings(r.Context()); err == nil {
 		req.ReadOnly = runtimeSettings.SubscriptionReadOnly
@@ -47,14 +51,14 @@ func (s *Server) handleResolvedSubscription(w http.ResponseWriter, r *http.Reque
 			writeSubscriptionError(w, err)
 			return
 		}
-		writeJSON(w, http.StatusOK, user)
+		writeSubscriptionPollJSON(w, r, user)
 	case "usage":
 		payload, err := s.userService.SubscriptionUsage(r.Context(), req)
 		if err != nil {
 			writeSubscriptionError(w, err)
 			return
 		}
-		writeJSON(w, http.StatusOK, payload)
+		writeSubscriptionPollJSON(w, r, payload)
 	default:
 		response, err := s.userService.RenderSubscription(r.Context(), req)
 		if err != nil {
@@ -88,6 +92,43 @@ func setSubscriptionNoCacheHeaders(w http.ResponseWriter) {
 	w.Header().Set("Pragma", "no-cache")
 }
 
+// writeSubscriptionPollJSON serves the polled info/usage payloads with a short
+// private cache window and a content ETag, so repeat polls can be answered
+// with 304 instead of the full body.
+func writeSubscriptionPollJSON(w http.ResponseWriter, r *http.Request, value any) {
+	body, err := json.Marshal(value)
+	if err != nil {
+		writeError(w, http.StatusInternalServerError, err.Error())
+		return
+	}
+	body = append(body, '\n')
+	sum := sha256.Sum256(body)
+	etag := `"` + hex.EncodeToString(sum[:16]) + `"`
+
+	header := w.Header()
+	header.Set("Cache-Control", "private, max-age=10")
+	header.Del("Expires")
+	header.Del("Pragma")
+	header.Set("ETag", etag)
+	if etagMatches(r.Header.Get("If-None-Match"), etag) {
+		w.WriteHeader(http.StatusNotModified)
+		return
+	}
+	header.Set("Content-Type", "application/json")
+	w.WriteHeader(http.StatusOK)
+	_, _ = w.Write(body)
+}
+
+func etagMatches(ifNoneMatch string, etag string) bool {
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimPrefix(strings.TrimSpace(candidate), "W/")
+		if candidate == etag || candidate == "*" {
+			return true
+		}
+	}
+	return false
+}
+
 func writeSubscriptionError(w http.ResponseWriter, err error) {
 	var mutationErr userapp.MutationError
 	if errors.As(err, &mutationErr) {
@@ -0,0 +1,43 @@
+package api
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"testing"
+)
+
+func TestWriteSubscriptionPollJSONRevalidatesWithETag(t *testing.T) {
+	payload := map[string]any{"username": "alice", "used_traffic": 42}
+
+	first := httptest.NewRecorder()
+	setSubscriptionNoCacheHeaders(first)
+	writeSubscriptionPollJSON(first, httptest.NewRequest(http.MethodGet, "/sub/token/usage", nil), payload)
+	if first.Code != http.StatusOK {
+		t.Fatalf("status = %d, want 200", first.Code)
+	}
+	etag := first.Header().Get("ETag")
+	if etag == "" {
+		t.Fatal("missing ETag")
+	}
+	if got := first.Header().Get("Cache-Control"); got != "private, max-age=10" {
+		t.Fatalf("Cache-Control = %q", got)
+	}
+	if got := first.Header().Get("CDN-Cache-Control"); got != "no-store" {
+		t.Fatalf("CDN-Cache-Control = %q", got)
+	}
+
+	request := httptest.NewRequest(http.MethodGet, "/sub/token/usage", nil)
+	request.Header.Set("If-None-Match", `"other", `+etag)
+	second := httptest.NewRecorder()
+	writeSubscriptionPollJSON(second, request, payload)
+	if second.Code != http.StatusNotModified || second.Body.Len() != 0 {
+		t.Fatalf("revalidation = %d with %d bytes, want empty 304", second.Code, second.Body.Len())
+	}
+
+	payload["used_traffic"] = 43
+	third := httptest.NewRecorder()
+	writeSubscriptionPollJSON(third, request, payload)
+	if third.Code != http.StatusOK || third.Header().Get("ETag") == etag {
+		t.Fatalf("changed payload = %d with ETag %q", third.Code, third.Header().Get("ETag"))
+	}
+}
@@ -292,6 +292,7 @@ func (s *Server) handleUserCreate(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	s.kickUserNodeOperationsSoon(result.UserID)
+	s.systemStatsService().InvalidateSummaries()
 	createdReport := userReportForTelegram(result, principal.Context.Admin.Username, principal.Context.Admin.Username, raw)
 	s.telegramReports.UserCreated(r.Context(), createdReport)
 	s.enqueueWebhook(r.Context(), webhookUserEvent(webhookapp.ActionUserCreated, createdReport))
@@ -315,6 +316,7 @@ func (s *Server) handleUserUpdate(w http.ResponseWriter, r *http.Request, userna
 		return
 	}
 	s.kickUserNodeOperationsSoon(result.UserID)
+	s.systemStatsService().InvalidateSummaries()
 	report := userReportForTelegram(result, principal.Context.Admin.Username, principal.Context.Admin.Username, raw)
 	s.telegramReports.UserUpdated(r.Context(), report)
 	s.enqueueWebhook(r.Context(), webhookUserEvent(webhookapp.ActionUserUpdated, report))
@@ -337,6 +339,7 @@ func (s *Server) handleUserDelete(w http.ResponseWriter, r *http.Request, userna
 		return
 	}
 	s.kickUserNodeOperationsSoon(result.UserID)
+	s.systemStatsService().InvalidateSummaries()
 	deletedReport := telegramapp.UserReport{
 		Username: result.Username,
 		Owner:    principal.Context.Admin.Username,
@@ -381,6 +384,7 @@ func (s *Server) handleUserMutationAction(w http.ResponseWriter, r *http.Request
 		return
 	}
 	s.kickUserNodeOperationsSoon(result.UserID)
+	s.systemStatsService().InvalidateSummaries()
 	report := telegramapp.UserReport{
 		Username: result.Username,
 		Owner:    principal.Context.Admin.Username,
@@ -461,6 +465,7 @@ func (s *Server) handleBulkUsersAction(w http.ResponseWriter, r *http.Request, s
 		return
 	}
 	s.kickUserNodeOperationsSoon(result.UserIDs...)
+	s.systemStatsService().InvalidateSummaries()
 	writeJSON(w, http.StatusOK, result)
 }
 
@@ -52,7 +52,12 @@ func (r Repository) SystemSummary(ctx context.Context, req SystemSummaryRequest)
 		scopedAdminID = &dbadmin.ID
 	}
 
-	counts, err := r.userCounts(ctx, scopedAdminID)
+	// A global admin's personal total is folded into the status counts query.
+	var personalAdminID *int64
+	if global && hasDBAdmin {
+		personalAdminID = &dbadmin.ID
+	}
+	counts, personalTotalUsers, err := r.userCounts(ctx, scopedAdminID, personalAdminID)
 	if err != nil {
 		return summary, err
 	}
@@ -69,15 +74,8 @@ func (r Repository) SystemSummary(ctx context.Context, req SystemSummaryRequest)
 	}
 	summary.OnlineUsers = online
 
-	personalTotalUsers := int64(0)
 	if !global {
 		personalTotalUsers = summary.TotalUser
-	} else if hasDBAdmin {
-		value, err := r.countUsers(ctx, &dbadmin.ID, "")
-		if err != nil {
-			return summary, err
-		}
-		personalTotalUsers = value
 	}
 	consumed := int64(0)
 	built := int64(0)
@@ -163,7 +161,10 @@ FROM admins ` + where + ` LIMIT 1`
 	return row, true, nil
 }
 
-func (r Repository) userCounts(ctx context.Context, adminID *int64) (map[string]int64, error) {
+// userCounts returns per-status user counts plus their total from one GROUP BY
+// query. When personalAdminID is set, the users owned by that admin are
+// counted in the same pass.
+func (r Repository) userCounts(ctx context.Context, adminID *int64, personalAdminID *int64) (map[string]int64, int64, error) {
 	result := map[string]int64{
 		"total":    0,
 		"active":   0,
@@ -172,54 +173,42 @@ func (r Repository) userCounts(ctx context.Context, adminID *int64) (map[string]
 		"limited":  0,
 		"on_hold":  0,
 	}
-	total, err := r.countUsers(ctx, adminID, "")
-	if err != nil {
-		return nil, err
+	columns := `status, COUNT(id), 0`
+	args := []any{}
+	if personalAdminID != nil {
+		columns = `status, COUNT(id), COALESCE(SUM(CASE WHEN admin_id = ? THEN 1 ELSE 0 END), 0)`
+		args = append(args, *personalAdminID)
 	}
-	result["total"] = total
-
 	clauses := []string{"status != ?"}
-	args := []any{"deleted"}
+	args = append(args, "deleted")
 	if adminID != nil {
 		clauses = append(clauses, "admin_id = ?")
 		args = append(args, *adminID)
 	}
-	query := `SELECT status, COUNT(id) FROM users WHERE ` + strings.Join(clauses, " AND ") + ` GROUP BY status`
+	query := `SELECT ` + columns + ` FROM users WHERE ` + strings.Join(clauses, " AND ") + ` GROUP BY status`
 	rows, err := r.db.QueryContext(ctx, query, args...)
 	if err != nil {
-		return nil, err
+		return nil, 0, err
 	}
 	defer rows.Close()
+	personal := int64(0)
 	for rows.Next() {
 		var status string
 		var count int64
-		if err := rows.Scan(&status, &count); err != nil {
-			return nil, err
+		var owned int64
+		if err := rows.Scan(&status, &count, &owned); err != nil {
+			return nil, 0, err
 		}
-		if _, ok := result[status]; ok {
+		result["total"] += count
+		personal += owned
+		if _, ok := result[status]; ok && status != "total" {
 			result[status] = count
 		}
 	}
-	return result, rows.Err()
-}
-
-func (r Repository) countUsers(ctx context.Context, adminID *int64, status string) (int64, error) {
-	clauses := []string{"status != ?"}
-	args := []any{"deleted"}
-	if adminID != nil {
-		clauses = append(clauses, "admin_id = ?")
-		args = append(args, *adminID)
-	}
-	if strings.TrimSpace(status) != "" {
-		clauses = append(clauses, "status = ?")
-		args = append(args, status)
-	}
-	query := `SELECT COUNT(id) FROM users WHERE ` + strings.Join(clauses, " AND ")
-	var count int64
-	if err := r.db.QueryRowContext(ctx, query, args...).Scan(&count); err != nil {
-		return 0, err
+	if err := rows.Err(); err != nil {
+		return nil, 0, err
 	}
-	return count, nil
+	return result, personal, nil
 }
 
 func (r Repository) onlineUsers(ctx context.Context, adminID *int64) (int64, error) {
@@ -237,49 +226,11 @@ func (r Repository) onlineUsers(ctx context.Context, adminID *int64) (int64, err
 	return count, nil
 }
 
+// adminOverview counts admins by role and picks the top admin by effective
+// usage in a single scan; the effective usage depends on per-admin limit
+// settings, so the top admin cannot be chosen with ORDER BY alone.
 func (r Repository) adminOverview(ctx context.Context) (AdminOverviewStats, error) {
 	var overview AdminOverviewStats
-	rows, err := r.db.QueryContext(
-		ctx,
-		`SELECT role, COUNT(id) FROM admins WHERE status != ? GROUP BY role`,
-		"deleted",
-	)
-	if err != nil {
-		return overview, err
-	}
-	defer rows.Close()
-	for rows.Next() {
-		var role string
-		var count int64
-		if err := rows.Scan(&role, &count); err != nil {
-			return overview, err
-		}
-		overview.TotalAdmins += count
-		switch normalizeRole(role) {
-		case "sudo":
-			overview.SudoAdmins = count
-		case "full_access":
-			overview.FullAccessAdmins = count
-		case "standard":
-			overview.StandardAdmins = count
-		}
-	}
-	if err := rows.Err(); err != nil {
-		return overview, err
-	}
-
-	top, found, err := r.topAdminByUsage(ctx)
-	if err != nil {
-		return overview, err
-	}
-	if found {
-		overview.TopAdminUsername = &top.Username
-		overview.TopAdminUsage = effectiveUsage(top)
-	}
-	return overview, nil
-}
-
-func (r Repository) topAdminByUsage(ctx context.Context) (adminRow, bool, error) {
 	rows, err := r.db.QueryContext(
 		ctx,
 		`SELECT
@@ -297,7 +248,7 @@ ORDER BY id`,
 		"deleted",
 	)
 	if err != nil {
-		return adminRow{}, false, err
+		return overview, err
 	}
 	defer rows.Close()
 
@@ -317,9 +268,20 @@ ORDER BY id`,
 			&row.TrafficLimitMode,
 			&useService,
 		); err != nil {
-			return adminRow{}, false, err
+			return overview, err
 		}
 		row.UseServiceTrafficLimits = useService.Valid && useService.Bool
+
+		overview.TotalAdmins++
+		switch normalizeRole(row.Role) {
+		case "sudo":
+			overview.SudoAdmins++
+		case "full_access":
+			overview.FullAccessAdmins++
+		case "standard":
+			overview.StandardAdmins++
+		}
+
 		usage := effectiveUsage(row)
 		if !found || usage > topUsage {
 			top = row
@@ -327,7 +289,14 @@ ORDER BY id`,
 			found = true
 		}
 	}
-	return top, found, rows.Err()
+	if err := rows.Err(); err != nil {
+		return overview, err
+	}
+	if found {
+		overview.TopAdminUsername = &top.Username
+		overview.TopAdminUsage = topUsage
+	}
+	return overview, nil
 }
 
 func (r Repository) timeArg(value time.Time) any {
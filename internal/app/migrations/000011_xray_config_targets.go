@@ -120,10 +120,15 @@ func normalizeLegacyXrayJSON(raw []byte) (string, bool) {
 	if text == "" {
 		return "", false
 	}
-	cleaned := removeTrailingJSONCommas(stripJSONComments(text))
+	// Most configs are plain JSON; only strip comments and trailing commas
+	// when the stdlib decoder rejects the file as written.
 	var payload any
-	if err := json.Unmarshal([]byte(cleaned), &payload); err != nil {
-		return "", false
+	if err := json.Unmarshal([]byte(text), &payload); err != nil {
+		cleaned := removeTrailingJSONCommas(stripJSONComments(text))
+		payload = nil
+		if err := json.Unmarshal([]byte(cleaned), &payload); err != nil {
+			return "", false
+		}
 	}
 	encoded, err := json.Marshal(payload)
 	if err != nil {
@@ -134,6 +139,7 @@ func normalizeLegacyXrayJSON(raw []byte) (string, bool) {
 
 func stripJSONComments(input string) string {
 	var out strings.Builder
+	out.Grow(len(input))
 	inString := false
 	escaped := false
 	for i := 0; i < len(input); i++ {
@@ -181,13 +187,14 @@ func stripJSONComments(input string) string {
 	return out.String()
 }
 
+var trailingJSONCommaPattern = regexp.MustCompile(`,\s*([}\]])`)
+
 func removeTrailingJSONCommas(input string) string {
-	re := regexp.MustCompile(`,\s*([}\]])`)
 	previous := ""
 	output := input
 	for previous != output {
 		previous = output
-		output = re.ReplaceAllString(output, "$1")
+		output = trailingJSONCommaPattern.ReplaceAllString(output, "$1")
 	}
 	return output
 }
@@ -1008,6 +1008,16 @@ func TestXrayConfigMigrationLoadsLegacyFileAndDefault(t *testing.T) {
 	}
 }
 
+func TestNormalizeLegacyXrayJSONParsesPlainJSONAsWritten(t *testing.T) {
+	normalized, ok := normalizeLegacyXrayJSON([]byte(`{"remarks": "a, ]"}`))
+	if !ok {
+		t.Fatal("plain JSON was rejected")
+	}
+	if normalized != `{"remarks":"a, ]"}` {
+		t.Fatalf("plain JSON values changed: %s", normalized)
+	}
+}
+
 func TestNodeXrayUsageMigrationPreservesLegacyRows(t *testing.T) {
 	ctx := context.Background()
 	db := openSQLiteTestDB(t)
@@ -13,19 +13,27 @@ import (
 )
 
 const DefaultPendingCertificateTTL = 30 * time.Minute
+const maxPendingCertificates = 64
 const (
 	MaxNodeNameLength = 120
 	MaxNodeNoteLength = 500
 )
 
 type Repository struct {
-	db      *sql.DB
-	dialect string
-	now     func() time.Time
+	db       *sql.DB
+	dialect  string
+	now      func() time.Time
+	tlsCache *TLSCache
 }
 
 func NewRepository(db *sql.DB, dialect string) Repository {
-	return Repository{db: db, dialect: dialect, now: func() time.Time { return time.Now().UTC() }}
+	return NewRepositoryWithTLSCache(db, dialect, NewTLSCache())
+}
+
+// NewRepositoryWithTLSCache builds a repository that reads the default TLS
+// certificate through tlsCache, so several repositories can share one entry.
+func NewRepositoryWithTLSCache(db *sql.DB, dialect string, tlsCache *TLSCache) Repository {
+	return Repository{db: db, dialect: dialect, now: func() time.Time { return time.Now().UTC() }, tlsCache: tlsCache}
 }
 
 func (r Repository) WithNow(now func() time.Time) Repository {
@@ -34,7 +42,7 @@ func (r Repository) WithNow(now func() time.Time) Repository {
 }
 
 func (r Repository) Settings(ctx context.Context) (NodeSettings, error) {
-	tls, err := r.tls(ctx)
+	tls, err := r.tls(ctx, r.db)
 	if err != nil {
 		return NodeSettings{}, err
 	}
@@ -48,12 +56,20 @@ func (r Repository) CreatePendingCertificate(ctx context.Context, ttl time.Durat
 	if ttl <= 0 {
 		ttl = DefaultPendingCertificateTTL
 	}
+	cn, err := GenerateUniqueCN()
+	if err != nil {
+		return PendingNodeCertificate{}, err
+	}
+	cert, key, err := GenerateCertificate(cn)
+	if err != nil {
+		return PendingNodeCertificate{}, err
+	}
 	tx, err := r.db.BeginTx(ctx, nil)
 	if err != nil {
 		return PendingNodeCertificate{}, err
 	}
 	defer rollbackQuiet(tx)
-	pending, err := r.createPendingCertificateTx(ctx, tx, ttl)
+	pending, err := r.createPendingCertificateTx(ctx, tx, ttl, cert, key)
 	if err != nil {
 		return PendingNodeCertificate{}, err
 	}
@@ -136,11 +152,11 @@ INSERT INTO nodes (
 	if err := r.enqueueNodeOperationTx(ctx, tx, NodeOperationSyncConfig, &nodeID, nil, map[string]any{"node_id": nodeID}, now); err != nil {
 		return NodeResponse{}, err
 	}
-	if err := tx.Commit(); err != nil {
+	node, err := r.loadNode(ctx, tx, nodeID)
+	if err != nil {
 		return NodeResponse{}, err
 	}
-	node, err := r.GetNode(ctx, nodeID)
-	if err != nil {
+	if err := tx.Commit(); err != nil {
 		return NodeResponse{}, err
 	}
 	node.NodeCertificateKey = &key
@@ -148,11 +164,7 @@ INSERT INTO nodes (
 }
 
 func (r Repository) GetNode(ctx context.Context, nodeID int64) (NodeResponse, error) {
-	defaultCert := ""
-	if tls, err := r.tls(ctx); err == nil {
-		defaultCert = tls.Certificate
-	}
-	return r.getNode(ctx, r.db, nodeID, defaultCert)
+	return r.loadNode(ctx, r.db, nodeID)
 }
 
 func (r Repository) UpdateNode(ctx context.Context, nodeID int64, payload NodeModify) (NodeResponse, error) {
@@ -358,11 +370,11 @@ func (r Repository) UpdateNode(ctx context.Context, nodeID int64, payload NodeMo
 			return NodeResponse{}, err
 		}
 	}
-	if err := tx.Commit(); err != nil {
+	node, err := r.loadNode(ctx, tx, nodeID)
+	if err != nil {
 		return NodeResponse{}, err
 	}
-	node, err := r.GetNode(ctx, nodeID)
-	if err != nil {
+	if err := tx.Commit(); err != nil {
 		return NodeResponse{}, err
 	}
 	return node, nil
@@ -418,41 +430,42 @@ func (r Repository) ResetNodeUsage(ctx context.Context, nodeID int64) (NodeRespo
 	if err := r.enqueueNodeOperationTx(ctx, tx, NodeOperationSyncConfig, &nodeID, nil, map[string]any{"node_id": nodeID, "usage_reset": true}, r.now().UTC()); err != nil {
 		return NodeResponse{}, err
 	}
-	if err := tx.Commit(); err != nil {
+	node, err := r.loadNode(ctx, tx, nodeID)
+	if err != nil {
 		return NodeResponse{}, err
 	}
-	node, err := r.GetNode(ctx, nodeID)
-	if err != nil {
+	if err := tx.Commit(); err != nil {
 		return NodeResponse{}, err
 	}
 	return node, nil
 }
 
 func (r Repository) RegenerateNodeCertificate(ctx context.Context, nodeID int64) (NodeResponse, error) {
-	tx, err := r.db.BeginTx(ctx, nil)
+	cn, err := GenerateUniqueCN()
 	if err != nil {
 		return NodeResponse{}, err
 	}
-	defer rollbackQuiet(tx)
-	if _, err := r.getNode(ctx, tx, nodeID, ""); err != nil {
+	cert, key, err := GenerateCertificate(cn)
+	if err != nil {
 		return NodeResponse{}, err
 	}
-	cn, err := GenerateUniqueCN()
+	tx, err := r.db.BeginTx(ctx, nil)
 	if err != nil {
 		return NodeResponse{}, err
 	}
-	cert, key, err := GenerateCertificate(cn)
+	defer rollbackQuiet(tx)
+	res, err := tx.ExecContext(ctx, `UPDATE nodes SET certificate = ?, certificate_key = ? WHERE id = ?`, cert, key, nodeID)
 	if err != nil {
 		return NodeResponse{}, err
 	}
-	if _, err := tx.ExecContext(ctx, `UPDATE nodes SET certificate = ?, certificate_key = ? WHERE id = ?`, cert, key, nodeID); err != nil {
-		return NodeResponse{}, err
+	if affected, err := res.RowsAffected(); err == nil && affected == 0 {
+		return NodeResponse{}, typedError(ErrorNotFound, "Node not found")
 	}
-	if err := tx.Commit(); err != nil {
+	node, err := r.loadNode(ctx, tx, nodeID)
+	if err != nil {
 		return NodeResponse{}, err
 	}
-	node, err := r.GetNode(ctx, nodeID)
-	if err != nil {
+	if err := tx.Commit(); err != nil {
 		return NodeResponse{}, err
 	}
 	node.NodeCertificateKey = &key
@@ -464,20 +477,19 @@ func (r Repository) DeleteExpiredPendingCertificates(ctx context.Context) error
 	return err
 }
 
-func (r Repository) createPendingCertificateTx(ctx context.Context, tx *sql.Tx, ttl time.Duration) (PendingNodeCertificate, error) {
+func (r Repository) createPendingCertificateTx(ctx context.Context, tx *sql.Tx, ttl time.Duration, cert string, key string) (PendingNodeCertificate, error) {
 	now := r.now().UTC()
 	if _, err := tx.ExecContext(ctx, `DELETE FROM pending_node_certificates WHERE expires_at <= ?`, dbTimestamp(now)); err != nil {
 		return PendingNodeCertificate{}, err
 	}
-	token, err := randomToken()
-	if err != nil {
+	// Keep at most maxPendingCertificates unclaimed key pairs, evicting the
+	// oldest ones, so repeated calls cannot grow the table within the TTL.
+	if _, err := tx.ExecContext(ctx, `DELETE FROM pending_node_certificates WHERE id NOT IN (
+	SELECT id FROM (SELECT id FROM pending_node_certificates ORDER BY id DESC LIMIT ?) AS newest
+)`, maxPendingCertificates-1); err != nil {
 		return PendingNodeCertificate{}, err
 	}
-	cn, err := GenerateUniqueCN()
-	if err != nil {
-		return PendingNodeCertificate{}, err
-	}
-	cert, key, err := GenerateCertificate(cn)
+	token, err := randomToken()
 	if err != nil {
 		return PendingNodeCertificate{}, err
 	}
@@ -560,7 +572,7 @@ func (r Repository) nodeStoredXrayConfigExistsTx(ctx context.Context, tx *sql.Tx
 	}
 	return false, err
 }
-func (r Repository) getNode(ctx context.Context, q queryer, nodeID int64, defaultCert string) (NodeResponse, error) {
+func (r Repository) getNode(ctx context.Context, q Queryer, nodeID int64, defaultCert string) (NodeResponse, error) {
 	var row NodeResponse
 	var dataLimit, proxyPort sql.NullInt64
 	var note, proxyType, proxyHost, proxyUsername, proxyPassword, message, xrayVersion, cert sql.NullString
@@ -613,10 +625,20 @@ FROM nodes WHERE id = ? LIMIT 1`, nodeID).Scan(
 	return row, nil
 }
 
-func (r Repository) tls(ctx context.Context) (tlsRow, error) {
-	var row tlsRow
-	err := r.db.QueryRowContext(ctx, `SELECT certificate, `+"`key`"+` FROM tls ORDER BY id LIMIT 1`).Scan(&row.Certificate, &row.Key)
-	return row, err
+// loadNode reads the default TLS certificate and the node row through the same
+// queryer, so mutations can build their response inside their own transaction
+// instead of checking out a second connection after commit.
+func (r Repository) loadNode(ctx context.Context, q Queryer, nodeID int64) (NodeResponse, error) {
+	defaultCert := ""
+	if tls, err := r.tls(ctx, q); err == nil {
+		defaultCert = tls.Certificate
+	}
+	return r.getNode(ctx, q, nodeID, defaultCert)
+}
+
+func (r Repository) tls(ctx context.Context, q Queryer) (tlsRow, error) {
+	certificate, key, err := r.tlsCache.Load(ctx, q)
+	return tlsRow{Certificate: certificate, Key: key}, err
 }
 
 func (r Repository) ensureNodeNameAvailableTx(ctx context.Context, tx *sql.Tx, name string, exceptID int64) error {
@@ -666,7 +688,8 @@ type tlsRow struct {
 	Key         string
 }
 
-type queryer interface {
+// Queryer is the single-row read side shared by *sql.DB and *sql.Tx.
+type Queryer interface {
 	QueryRowContext(ctx context.Context, query string, args ...any) *sql.Row
 }
 
@@ -105,6 +105,9 @@ func TestNodeRepositoryCreateUpdateResetDeleteAndRegenerate(t *testing.T) {
 		t.Fatalf("DeleteNode error: %v", err)
 	}
 	assertNodeTestCount(t, db, `SELECT COUNT(*) FROM nodes WHERE id = 1`, 0)
+	if _, err := repo.RegenerateNodeCertificate(ctx, created.ID); !IsKind(err, ErrorNotFound) {
+		t.Fatalf("expected not found regenerating deleted node, got %v", err)
+	}
 	assertNodeTestCount(t, db, `SELECT COUNT(*) FROM node_operations WHERE node_id = 1`, 0)
 	assertNodeTestCount(t, db, `SELECT COUNT(*) FROM node_usage_user_queue WHERE node_id = 1`, 0)
 	assertNodeTestCount(t, db, `SELECT COUNT(*) FROM node_usage_outbound_queue WHERE node_id = 1`, 0)
@@ -200,6 +203,54 @@ func baseNodeCreate(name string) NodeCreate {
 	}
 }
 
+func TestNodeRepositoryCachesDefaultTLSCertificate(t *testing.T) {
+	db := newNodeTestDB(t)
+	repo := NewRepository(db, "sqlite")
+	ctx := context.Background()
+
+	first, err := repo.Settings(ctx)
+	if err != nil {
+		t.Fatalf("Settings error: %v", err)
+	}
+	if _, err := db.Exec(`UPDATE tls SET certificate = 'rotated-cert' WHERE id = 1`); err != nil {
+		t.Fatalf("rotate tls: %v", err)
+	}
+	cached, err := repo.Settings(ctx)
+	if err != nil {
+		t.Fatalf("Settings cached error: %v", err)
+	}
+	if first.Certificate != "legacy-cert" || cached.Certificate != first.Certificate {
+		t.Fatalf("default certificate was not served from cache: first=%q cached=%q", first.Certificate, cached.Certificate)
+	}
+	fresh, err := NewRepository(db, "sqlite").Settings(ctx)
+	if err != nil {
+		t.Fatalf("Settings fresh error: %v", err)
+	}
+	if fresh.Certificate != "rotated-cert" {
+		t.Fatalf("new repository should read the current certificate, got %q", fresh.Certificate)
+	}
+}
+
+func TestNodeRepositoriesShareTLSCache(t *testing.T) {
+	db := newNodeTestDB(t)
+	ctx := context.Background()
+	tlsCache := NewTLSCache()
+
+	if _, err := NewRepositoryWithTLSCache(db, "sqlite", tlsCache).Settings(ctx); err != nil {
+		t.Fatalf("Settings error: %v", err)
+	}
+	if _, err := db.Exec(`UPDATE tls SET certificate = 'rotated-cert' WHERE id = 1`); err != nil {
+		t.Fatalf("rotate tls: %v", err)
+	}
+	shared, err := NewRepositoryWithTLSCache(db, "sqlite", tlsCache).Settings(ctx)
+	if err != nil {
+		t.Fatalf("Settings shared error: %v", err)
+	}
+	if shared.Certificate != "legacy-cert" {
+		t.Fatalf("repository sharing the cache read %q, want the cached legacy-cert", shared.Certificate)
+	}
+}
+
 func fixedNow() func() time.Time {
 	return func() time.Time {
 		return time.Date(2026, 6, 9, 1, 0, 0, 0, time.UTC)
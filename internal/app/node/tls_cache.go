@@ -0,0 +1,65 @@
+package node
+
+import (
+	"context"
+	"sync"
+	"time"
+)
+
+// DefaultTLSCacheTTL is how long the default TLS certificate is served from
+// memory. The tls row is only written by migrations, so a short TTL is enough
+// to pick up a database restore.
+const DefaultTLSCacheTTL = 5 * time.Second
+
+// TLSCache keeps the default TLS certificate row for DefaultTLSCacheTTL. The
+// API server hands one instance to both the node and nodecontroller
+// repositories, so they expire and refill the same entry.
+type TLSCache struct {
+	mu          sync.RWMutex
+	certificate string
+	key         string
+	expires     time.Time
+}
+
+func NewTLSCache() *TLSCache {
+	return &TLSCache{}
+}
+
+// Load returns the cached certificate and key, reading them through q when the
+// entry has expired. A nil cache always reads through q.
+func (c *TLSCache) Load(ctx context.Context, q Queryer) (string, string, error) {
+	if certificate, key, ok := c.cached(); ok {
+		return certificate, key, nil
+	}
+	var certificate, key string
+	err := q.QueryRowContext(ctx, `SELECT certificate, `+"`key`"+` FROM tls ORDER BY id LIMIT 1`).Scan(&certificate, &key)
+	if err != nil {
+		return "", "", err
+	}
+	c.store(certificate, key)
+	return certificate, key, nil
+}
+
+func (c *TLSCache) cached() (string, string, bool) {
+	if c == nil {
+		return "", "", false
+	}
+	now := time.Now()
+	c.mu.RLock()
+	defer c.mu.RUnlock()
+	if now.After(c.expires) {
+		return "", "", false
+	}
+	return c.certificate, c.key, true
+}
+
+func (c *TLSCache) store(certificate, key string) {
+	if c == nil {
+		return
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.certificate = certificate
+	c.key = key
+	c.expires = time.Now().Add(DefaultTLSCacheTTL)
+}
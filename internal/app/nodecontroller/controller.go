@@ -299,6 +299,7 @@ func (c Controller) ProcessQueue(ctx context.Context, req ProcessOperationsReque
 	}
 	result := ProcessOperationsResult{}
 	blockedNodes := map[int64]bool{}
+	configData := &sharedRuntimeConfigData{}
 	groups := []operationGroup{}
 	groupIndexes := map[string]int{}
 	globalCoalesced := []OperationRow{}
@@ -316,22 +317,32 @@ func (c Controller) ProcessQueue(ctx context.Context, req ProcessOperationsReque
 		}
 		groups[idx].operations = append(groups[idx].operations, operation)
 	}
-	if err := c.processOrderedOperationGroups(ctx, groups, blockedNodes, &result); err != nil {
+	if err := c.processOrderedOperationGroups(ctx, groups, blockedNodes, &result, configData); err != nil {
 		return result, err
 	}
 	if len(globalCoalesced) > 0 {
-		if err := c.processCoalescedOperations(ctx, globalCoalesced, blockedNodes, &result); err != nil {
+		if err := c.processCoalescedOperations(ctx, globalCoalesced, blockedNodes, &result, configData); err != nil {
 			return result, err
 		}
 	}
 	return result, nil
 }
 
+// ReplaceRuntimeUserOperationsWithSyncTx replaces the node's queued user
+// deltas with one full config sync inside the caller's transaction.
+func (c Controller) ReplaceRuntimeUserOperationsWithSyncTx(ctx context.Context, tx *sql.Tx, nodeID int64, payload any, now time.Time) error {
+	return c.repo.ReplaceRuntimeUserOperationsWithSyncTx(ctx, tx, nodeID, payload, now)
+}
+
 func (c Controller) ProcessRuntimeUserOperations(ctx context.Context, req ProcessUserOperationsRequest) (ProcessOperationsResult, error) {
-	if req.UserID <= 0 {
+	userIDs := req.UserIDs
+	if req.UserID > 0 {
+		userIDs = append([]int64{req.UserID}, userIDs...)
+	}
+	if len(userIDs) == 0 {
 		return ProcessOperationsResult{}, nil
 	}
-	operations, err := c.repo.PendingRuntimeUserOperations(ctx, req.UserID, req.Limit)
+	operations, err := c.repo.PendingRuntimeUsersOperations(ctx, userIDs, req.Limit)
 	if err != nil {
 		return ProcessOperationsResult{}, err
 	}
@@ -352,7 +363,7 @@ func (c Controller) ProcessRuntimeUserOperations(ctx context.Context, req Proces
 		}
 		groups[idx].operations = append(groups[idx].operations, operation)
 	}
-	if err := c.processOrderedOperationGroups(ctx, groups, blockedNodes, &result); err != nil {
+	if err := c.processOrderedOperationGroups(ctx, groups, blockedNodes, &result, &sharedRuntimeConfigData{}); err != nil {
 		return result, err
 	}
 	return result, nil
@@ -363,7 +374,7 @@ type operationGroup struct {
 	operations []OperationRow
 }
 
-func (c Controller) processOrderedOperationGroups(ctx context.Context, groups []operationGroup, blockedNodes map[int64]bool, result *ProcessOperationsResult) error {
+func (c Controller) processOrderedOperationGroups(ctx context.Context, groups []operationGroup, blockedNodes map[int64]bool, result *ProcessOperationsResult, configData *sharedRuntimeConfigData) error {
 	type groupResult struct {
 		result       ProcessOperationsResult
 		blockedNodes map[int64]bool
@@ -389,9 +400,9 @@ func (c Controller) processOrderedOperationGroups(ctx context.Context, groups []
 				var err error
 				for _, operation := range group.operations {
 					if canCoalesceRuntimeSyncOperation(operation) {
-						err = c.processCoalescedOperations(ctx, []OperationRow{operation}, localBlocked, &localResult)
+						err = c.processCoalescedOperations(ctx, []OperationRow{operation}, localBlocked, &localResult, configData)
 					} else {
-						err = c.processSingleOperation(ctx, operation, localBlocked, &localResult)
+						err = c.processSingleOperation(ctx, operation, localBlocked, &localResult, configData)
 					}
 					if err != nil {
 						break
@@ -449,7 +460,7 @@ func cloneBlockedNodes(blockedNodes map[int64]bool) map[int64]bool {
 	return clone
 }
 
-func (c Controller) processSingleOperation(ctx context.Context, operation OperationRow, blockedNodes map[int64]bool, result *ProcessOperationsResult) error {
+func (c Controller) processSingleOperation(ctx context.Context, operation OperationRow, blockedNodes map[int64]bool, result *ProcessOperationsResult, configData *sharedRuntimeConfigData) error {
 	if operation.NodeID.Valid && blockedNodes[operation.NodeID.Int64] {
 		return nil
 	}
@@ -462,7 +473,7 @@ func (c Controller) processSingleOperation(ctx context.Context, operation Operat
 	}
 	result.Processed++
 	opCtx, cancel := operationContext(ctx, operation)
-	err = c.applyOperation(opCtx, operation)
+	err = c.applyOperationWithConfigData(opCtx, operation, configData.forOperation(opCtx, c, operation))
 	cancel()
 	if err != nil {
 		if isPermanentOperationError(err) {
@@ -491,7 +502,7 @@ func (c Controller) processSingleOperation(ctx context.Context, operation Operat
 	return nil
 }
 
-func (c Controller) processCoalescedOperations(ctx context.Context, operations []OperationRow, blockedNodes map[int64]bool, result *ProcessOperationsResult) error {
+func (c Controller) processCoalescedOperations(ctx context.Context, operations []OperationRow, blockedNodes map[int64]bool, result *ProcessOperationsResult, configData *sharedRuntimeConfigData) error {
 	if len(operations) == 0 {
 		return nil
 	}
@@ -523,7 +534,7 @@ func (c Controller) processCoalescedOperations(ctx context.Context, operations [
 		return err
 	}
 	opCtx, cancel := operationContext(ctx, representative)
-	err = c.applyOperation(opCtx, representative)
+	err = c.applyOperationWithConfigData(opCtx, representative, configData.forOperation(opCtx, c, representative))
 	cancel()
 	if err != nil {
 		if isPermanentOperationError(err) {
@@ -568,6 +579,43 @@ func (c Controller) processCoalescedOperations(ctx context.Context, operations [
 	return nil
 }
 
+// sharedRuntimeConfigData loads the runtime user snapshot (users, service tags
+// and UUID masks) at most once per queue pass. Every node-specific full sync in
+// the pass was queued before the pass started, so they can all build their
+// config from the same snapshot instead of rereading every user per node.
+type sharedRuntimeConfigData struct {
+	once sync.Once
+	data *runtimeConfigData
+}
+
+func (s *sharedRuntimeConfigData) forOperation(ctx context.Context, c Controller, operation OperationRow) *runtimeConfigData {
+	if s == nil || !operation.NodeID.Valid || !operationBuildsFullConfig(operation) {
+		return nil
+	}
+	s.once.Do(func() {
+		loaded, err := c.loadRuntimeConfigData(ctx)
+		if err != nil {
+			logging.Warnf(logging.ComponentNode, "operation queue could not preload runtime users: %v", err)
+			return
+		}
+		s.data = loaded
+	})
+	return s.data
+}
+
+func operationBuildsFullConfig(operation OperationRow) bool {
+	switch operation.OperationType {
+	case "sync_config", "restart_node":
+	default:
+		return false
+	}
+	var payload operationPayload
+	if len(operation.Payload) > 0 && json.Unmarshal(operation.Payload, &payload) != nil {
+		return false
+	}
+	return strings.TrimSpace(payload.ConfigJSON) == ""
+}
+
 type operationPayload struct {
 	ConfigJSON   string `json:"config_json"`
 	RuntimeEmail string `json:"runtime_email,omitempty"`
@@ -44,8 +44,9 @@ type ProcessOperationsRequest struct {
 }
 
 type ProcessUserOperationsRequest struct {
-	UserID int64 `json:"user_id,omitempty"`
-	Limit  int   `json:"limit,omitempty"`
+	UserID  int64   `json:"user_id,omitempty"`
+	UserIDs []int64 `json:"user_ids,omitempty"`
+	Limit   int     `json:"limit,omitempty"`
 }
 
 type ProcessOperationsResult struct {
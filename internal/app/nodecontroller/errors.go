@@ -10,23 +10,27 @@ import (
 	"google.golang.org/grpc/status"
 )
 
+// maxNodeErrorDetail caps how much of a node error is echoed back to API
+// clients and logs; gRPC status messages can carry whole config payloads.
+const maxNodeErrorDetail = 512
+
 func friendlyNodeError(action string, nodeID int64, err error) error {
 	if err == nil {
 		return nil
 	}
-	message := strings.TrimSpace(err.Error())
-	title := classifyNodeError(err, message)
+	// Classify on the full text; only the detail echoed back is capped.
+	title := classifyNodeError(err, err.Error())
 	if compactNodeError(title) {
 		return fmt.Errorf("%s during %s for node %d", title, action, nodeID)
 	}
 	if st, ok := status.FromError(err); ok {
-		detail := strings.TrimSpace(st.Message())
+		detail := truncateOperationReason(st.Message(), maxNodeErrorDetail)
 		if detail == "" {
 			detail = st.Code().String()
 		}
 		switch st.Code() {
 		case codes.Unavailable:
-			title = classifyNodeError(err, detail)
+			title = classifyNodeError(err, st.Message())
 			if compactNodeError(title) {
 				return fmt.Errorf("%s during %s for node %d", title, action, nodeID)
 			}
@@ -41,6 +45,7 @@ func friendlyNodeError(action string, nodeID int64, err error) error {
 			return fmt.Errorf("%s during %s for node %d: %s", title, action, nodeID, detail)
 		}
 	}
+	message := truncateOperationReason(err.Error(), maxNodeErrorDetail)
 	if message == "" {
 		return fmt.Errorf("%s during %s for node %d", title, action, nodeID)
 	}
@@ -60,6 +65,12 @@ func classifyNodeError(err error, message string) string {
 	if errors.Is(err, context.DeadlineExceeded) {
 		return "Connection timeout"
 	}
+	if st, ok := status.FromError(err); ok {
+		switch st.Code() {
+		case codes.Unauthenticated, codes.PermissionDenied:
+			return "Authentication failed"
+		}
+	}
 	lower := strings.ToLower(strings.TrimSpace(message))
 	switch {
 	case lower == "":
@@ -3,6 +3,7 @@ package nodecontroller
 import (
 	"context"
 	"errors"
+	"strings"
 	"testing"
 
 	"google.golang.org/grpc/codes"
@@ -78,3 +79,25 @@ func TestFriendlyNodeErrorClassifiesDNSAndTLS(t *testing.T) {
 		})
 	}
 }
+
+func TestFriendlyNodeErrorCapsLargeGRPCDetail(t *testing.T) {
+	err := friendlyNodeError("sync", 3, status.Error(codes.Internal, strings.Repeat("x", 4*maxNodeErrorDetail)))
+	if err == nil {
+		t.Fatal("expected error")
+	}
+	want := "Node error during sync for node 3: " + strings.Repeat("x", maxNodeErrorDetail)
+	if got := err.Error(); got != want {
+		t.Fatalf("unexpected error length: got %d want %d", len(got), len(want))
+	}
+}
+
+func TestFriendlyNodeErrorClassifiesUnauthenticatedStatusByCode(t *testing.T) {
+	err := status.Error(codes.Unauthenticated, "token mismatch")
+	if title := classifyNodeError(err, err.Error()); title != "Authentication failed" {
+		t.Fatalf("title = %q, want Authentication failed", title)
+	}
+	want := "node 4 rejected metrics authentication: token mismatch"
+	if got := friendlyNodeError("metrics", 4, err); got == nil || got.Error() != want {
+		t.Fatalf("unexpected error: %v", got)
+	}
+}
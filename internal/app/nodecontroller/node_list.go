@@ -180,13 +180,43 @@ func setCertificatePublicKey(item *NodeListItem, cert string) {
 	if strings.TrimSpace(cert) == "" {
 		return
 	}
-	publicKey, err := nodeapp.ExtractPublicKeyFromCertificate(cert)
-	if err != nil {
+	publicKey, ok := certificatePublicKey(cert)
+	if !ok {
 		return
 	}
 	item.CertificatePublicKey = &publicKey
 }
 
+const certificatePublicKeyCacheLimit = 1024
+
+// certificatePublicKeys memoizes the PEM public key of each certificate. Most
+// nodes share the default certificate and none of them change between list
+// polls, so parsing x509 once per certificate instead of once per row is enough.
+var certificatePublicKeys = struct {
+	sync.RWMutex
+	values map[string]string
+}{values: map[string]string{}}
+
+func certificatePublicKey(cert string) (string, bool) {
+	certificatePublicKeys.RLock()
+	publicKey, ok := certificatePublicKeys.values[cert]
+	certificatePublicKeys.RUnlock()
+	if ok {
+		return publicKey, true
+	}
+	publicKey, err := nodeapp.ExtractPublicKeyFromCertificate(cert)
+	if err != nil {
+		return "", false
+	}
+	certificatePublicKeys.Lock()
+	if len(certificatePublicKeys.values) >= certificatePublicKeyCacheLimit {
+		certificatePublicKeys.values = map[string]string{}
+	}
+	certificatePublicKeys.values[cert] = publicKey
+	certificatePublicKeys.Unlock()
+	return publicKey, true
+}
+
 func withListMetricsTimeout(parent context.Context) (context.Context, context.CancelFunc) {
 	return context.WithTimeout(parent, 12*time.Second)
 }
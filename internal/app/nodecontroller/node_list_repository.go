@@ -11,12 +11,9 @@ import (
 func (r Repository) ListNodeItems(ctx context.Context, nodeID int64) ([]NodeListItem, string, string, error) {
 	defaultCert := ""
 	defaultKey := ""
-	var defaultCertNull, defaultKeyNull sql.NullString
-	if err := r.db.QueryRowContext(ctx, `SELECT certificate, `+"`key`"+` FROM tls ORDER BY id LIMIT 1`).Scan(&defaultCertNull, &defaultKeyNull); err == nil && defaultCertNull.Valid {
-		defaultCert = defaultCertNull.String
-		if defaultKeyNull.Valid {
-			defaultKey = defaultKeyNull.String
-		}
+	if tls, err := r.TLS(ctx); err == nil {
+		defaultCert = tls.Certificate
+		defaultKey = tls.Key
 	}
 
 	query := `SELECT
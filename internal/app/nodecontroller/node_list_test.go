@@ -32,3 +32,21 @@ func TestEnrichCertificateFieldsIncludesInstallBundleMaterial(t *testing.T) {
 		t.Fatalf("custom key was not exposed for install bundle: %#v", custom)
 	}
 }
+
+func TestSetCertificatePublicKeyReusesParsedCertificate(t *testing.T) {
+	cert := "cached certificate"
+	certificatePublicKeys.Lock()
+	certificatePublicKeys.values[cert] = "cached public key"
+	certificatePublicKeys.Unlock()
+	t.Cleanup(func() {
+		certificatePublicKeys.Lock()
+		delete(certificatePublicKeys.values, cert)
+		certificatePublicKeys.Unlock()
+	})
+
+	item := NodeListItem{}
+	setCertificatePublicKey(&item, cert)
+	if item.CertificatePublicKey == nil || *item.CertificatePublicKey != "cached public key" {
+		t.Fatalf("expected memoized public key, got %#v", item.CertificatePublicKey)
+	}
+}
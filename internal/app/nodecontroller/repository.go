@@ -11,11 +11,14 @@ import (
 	"os"
 	"strings"
 	"time"
+
+	nodeapp "github.com/rebeccapanel/rebecca/internal/app/node"
 )
 
 type Repository struct {
-	db      *sql.DB
-	dialect string
+	db       *sql.DB
+	dialect  string
+	tlsCache *nodeapp.TLSCache
 }
 
 type NodeRow struct {
@@ -63,10 +66,21 @@ const (
 	syncConfigRetryBackoff       = 5 * time.Minute
 )
 
+// RuntimeBacklogSyncThreshold is the number of user deltas at which one full
+// config sync per node replaces them.
+const RuntimeBacklogSyncThreshold = runtimeBacklogSyncThreshold
+
 var runtimeProxyProtocolList = []string{"vmess", "vless", "trojan", "shadowsocks", "hysteria"}
 
 func NewRepository(db *sql.DB, dialect string) Repository {
-	return Repository{db: db, dialect: dialect}
+	return NewRepositoryWithTLSCache(db, dialect, nodeapp.NewTLSCache())
+}
+
+// NewRepositoryWithTLSCache builds a repository that reads the default TLS
+// certificate through tlsCache, so it can share one entry with the node
+// repository.
+func NewRepositoryWithTLSCache(db *sql.DB, dialect string, tlsCache *nodeapp.TLSCache) Repository {
+	return Repository{db: db, dialect: dialect, tlsCache: tlsCache}
 }
 
 func (r Repository) Node(ctx context.Context, nodeID int64) (NodeRow, error) {
@@ -120,12 +134,11 @@ FROM nodes WHERE id = ? LIMIT 1`, nodeID).Scan(
 }
 
 func (r Repository) TLS(ctx context.Context) (TLSRow, error) {
-	var row TLSRow
-	err := r.db.QueryRowContext(ctx, `SELECT certificate, `+"`key`"+` FROM tls ORDER BY id LIMIT 1`).Scan(&row.Certificate, &row.Key)
+	certificate, key, err := r.tlsCache.Load(ctx, r.db)
 	if err != nil {
 		return TLSRow{}, err
 	}
-	return row, nil
+	return TLSRow{Certificate: certificate, Key: key}, nil
 }
 
 func (r Repository) NodeRawConfig(ctx context.Context, node NodeRow) (map[string]any, error) {
@@ -573,6 +586,24 @@ func (r Repository) PendingRuntimeUserOperations(ctx context.Context, userID int
 	if userID <= 0 {
 		return nil, nil
 	}
+	return r.PendingRuntimeUsersOperations(ctx, []int64{userID}, limit)
+}
+
+// PendingRuntimeUsersOperations returns the connected-node user deltas queued
+// for any of userIDs, ordered the same way as PendingRuntimeUserOperations.
+func (r Repository) PendingRuntimeUsersOperations(ctx context.Context, userIDs []int64, limit int) ([]OperationRow, error) {
+	placeholders := make([]string, 0, len(userIDs))
+	args := make([]any, 0, len(userIDs)+1)
+	for _, userID := range userIDs {
+		if userID <= 0 {
+			continue
+		}
+		placeholders = append(placeholders, "?")
+		args = append(args, userID)
+	}
+	if len(args) == 0 {
+		return nil, nil
+	}
 	if limit <= 0 {
 		limit = 1000
 	}
@@ -584,7 +615,7 @@ SELECT no.id, no.operation_type, no.node_id, no.user_id, no.payload, no.attempts
 FROM node_operations no
 JOIN nodes n ON n.id = no.node_id
 WHERE no.status IN ('pending', 'retrying')
-  AND no.user_id = ?
+  AND no.user_id IN (` + strings.Join(placeholders, ",") + `)
   AND no.node_id IS NOT NULL
   AND no.operation_type IN ('add_user', 'update_user', 'remove_user', 'disable_user', 'enable_user')
   AND LOWER(COALESCE(n.status, '')) = 'connected'
@@ -598,7 +629,8 @@ ORDER BY
   no.node_id,
   no.id
 LIMIT ?`
-	rows, err := r.db.QueryContext(ctx, query, userID, limit)
+	args = append(args, limit)
+	rows, err := r.db.QueryContext(ctx, query, args...)
 	if err != nil {
 		return nil, err
 	}
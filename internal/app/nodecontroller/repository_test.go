@@ -230,6 +230,17 @@ VALUES
 	if rows[1].OperationType != "remove_user" || !rows[1].NodeID.Valid || rows[1].NodeID.Int64 != 3 {
 		t.Fatalf("expected connected remove_user second, got %#v", rows[1])
 	}
+
+	rows, err = repo.PendingRuntimeUsersOperations(ctx, []int64{10, 11}, 50)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(rows) != 3 {
+		t.Fatalf("expected connected operations for both users, got %#v", rows)
+	}
+	if rows[1].OperationType != "update_user" || !rows[1].UserID.Valid || rows[1].UserID.Int64 != 11 {
+		t.Fatalf("expected other user's update_user between add and remove, got %#v", rows[1])
+	}
 }
 
 func TestRepositoryPendingOperationsPrioritizeFreshRuntimeUserAddsOverDisableBacklog(t *testing.T) {
@@ -1331,6 +1331,16 @@ VALUES ('sync_config', ?, NULL, ?, 'pending', 0, ?, ?, ?)`,
 	return err
 }
 
+// ReplaceRuntimeUserOperationsWithSyncTx settles the node's queued user deltas
+// and queues a single full config sync in their place, reusing a sync that is
+// already pending.
+func (r Repository) ReplaceRuntimeUserOperationsWithSyncTx(ctx context.Context, tx *sql.Tx, nodeID int64, payload any, now time.Time) error {
+	if err := r.deferRuntimeUserOperationsForNodeTx(ctx, tx, nodeID, now); err != nil {
+		return err
+	}
+	return r.queueSyncConfigTx(ctx, tx, nodeID, payload, now)
+}
+
 func (r Repository) pendingStagedUserUsage(ctx context.Context, limit int) ([]stagedUserUsageRow, error) {
 	rows, err := r.db.QueryContext(ctx, `SELECT id, node_id, user_id, used_traffic, online
 FROM node_usage_user_queue
@@ -9,6 +9,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -102,6 +103,10 @@ func (r Repository) UpdatePanelSettings(ctx context.Context, raw map[string]json
 }
 
 func (r Repository) RuntimeSettings(ctx context.Context) (RuntimeSettings, error) {
+	result, err := r.runtimeSettings(ctx)
+	if !errors.Is(err, sql.ErrNoRows) {
+		return result, err
+	}
 	if err := r.ensureRuntimeSettingsRecord(ctx); err != nil {
 		return RuntimeSettings{}, err
 	}
@@ -152,22 +157,38 @@ func (r Repository) UpdateRuntimeSettings(ctx context.Context, raw map[string]js
 }
 
 func (r Repository) SubscriptionBundle(ctx context.Context) (SubscriptionBundle, error) {
+	var admins []AdminSubscriptionSettings
+	var certificates []SubscriptionCertificate
+	var adminsErr, certificatesErr error
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		admins, adminsErr = r.adminSubscriptionSettings(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		certificates, certificatesErr = r.subscriptionCertificates(ctx)
+	}()
 	settings, err := r.SubscriptionSettings(ctx)
+	wg.Wait()
 	if err != nil {
 		return SubscriptionBundle{}, err
 	}
-	admins, err := r.adminSubscriptionSettings(ctx)
-	if err != nil {
-		return SubscriptionBundle{}, err
+	if adminsErr != nil {
+		return SubscriptionBundle{}, adminsErr
 	}
-	certificates, err := r.subscriptionCertificates(ctx)
-	if err != nil {
-		return SubscriptionBundle{}, err
+	if certificatesErr != nil {
+		return SubscriptionBundle{}, certificatesErr
 	}
 	return SubscriptionBundle{Settings: settings, Admins: admins, Certificates: certificates}, nil
 }
 
 func (r Repository) SubscriptionSettings(ctx context.Context) (SubscriptionSettings, error) {
+	result, err := r.subscriptionSettings(ctx)
+	if !errors.Is(err, sql.ErrNoRows) {
+		return result, err
+	}
 	if err := r.ensureSubscriptionRecord(ctx); err != nil {
 		return SubscriptionSettings{}, err
 	}
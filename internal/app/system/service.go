@@ -23,6 +23,10 @@ import (
 
 const historyMaxEntries = 6000
 
+// snapshotReuseWindow is how long a host metrics reading is shared between
+// callers before the provider samples the host again.
+const snapshotReuseWindow = time.Second
+
 type MetricsProvider interface {
 	Snapshot(ctx context.Context) (MetricsSnapshot, error)
 }
@@ -35,6 +39,10 @@ type Service struct {
 	version   string
 	channel   string
 
+	summaryMu      sync.Mutex
+	summaryVersion uint64
+	summaries      map[summaryKey]summarySnapshot
+
 	mu                 sync.Mutex
 	cpuHistory         []HistoryEntry
 	memoryHistory      []HistoryEntry
@@ -65,21 +73,48 @@ func NewServiceWithProvider(db *sql.DB, dialect string, version string, provider
 }
 
 func (s *Service) Stats(ctx context.Context, admin dashboardapp.AdminContext) (SystemStats, error) {
-	snapshot, err := s.metrics.Snapshot(ctx)
-	if err != nil {
-		return SystemStats{}, err
-	}
-	summary, err := s.dashboard.SystemSummary(ctx, dashboardapp.SystemSummaryRequest{Admin: admin})
-	if err != nil {
-		return SystemStats{}, err
-	}
-	xrayRunning, xrayVersion, err := s.connectedNodeRuntime(ctx)
-	if err != nil {
-		return SystemStats{}, err
+	// The host metrics and each database read are independent, so they run
+	// concurrently and the request waits for the slowest rather than the sum.
+	var (
+		wg                sync.WaitGroup
+		snapshot          MetricsSnapshot
+		snapshotErr       error
+		summary           dashboardapp.SystemSummary
+		summaryErr        error
+		xrayRunning       bool
+		xrayVersion       *string
+		runtimeErr        error
+		lastTelegramError *string
+		lastXrayError     *string
+	)
+	wg.Add(5)
+	go func() {
+		defer wg.Done()
+		snapshot, snapshotErr = s.metrics.Snapshot(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		summary, summaryErr = s.systemSummary(ctx, admin)
+	}()
+	go func() {
+		defer wg.Done()
+		xrayRunning, xrayVersion, runtimeErr = s.connectedNodeRuntime(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		lastTelegramError = s.telegramLastError(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		lastXrayError = s.lastXrayError(ctx)
+	}()
+	wg.Wait()
+	for _, err := range []error{snapshotErr, summaryErr, runtimeErr} {
+		if err != nil {
+			return SystemStats{}, err
+		}
 	}
 	history := s.appendHistory(snapshot)
-	lastTelegramError := s.telegramLastError(ctx)
-	lastXrayError := s.lastXrayError(ctx)
 
 	return SystemStats{
 		Version:               s.version,
@@ -123,6 +158,60 @@ func (s *Service) Stats(ctx context.Context, admin dashboardapp.AdminContext) (S
 	}, nil
 }
 
+const (
+	summaryCacheTTL     = 5 * time.Second
+	summaryCacheEntries = 64
+)
+
+// summaryKey identifies the dashboard summary one admin sees; the summary
+// depends only on the admin's username and role.
+type summaryKey struct {
+	username string
+	role     string
+}
+
+// summarySnapshot holds a dashboard summary for admins polling /api/system.
+// InvalidateSummaries bumps summaryVersion on user writes, so a summary read
+// before a write is never served after it; usage counters age out with the TTL.
+type summarySnapshot struct {
+	version uint64
+	expires time.Time
+	summary dashboardapp.SystemSummary
+}
+
+func (s *Service) systemSummary(ctx context.Context, admin dashboardapp.AdminContext) (dashboardapp.SystemSummary, error) {
+	key := summaryKey{username: admin.Username, role: admin.Role}
+	s.summaryMu.Lock()
+	version := s.summaryVersion
+	cached, ok := s.summaries[key]
+	s.summaryMu.Unlock()
+	if ok && cached.version == version && time.Now().Before(cached.expires) {
+		return cached.summary, nil
+	}
+	summary, err := s.dashboard.SystemSummary(ctx, dashboardapp.SystemSummaryRequest{Admin: admin})
+	if err != nil {
+		return summary, err
+	}
+	s.summaryMu.Lock()
+	defer s.summaryMu.Unlock()
+	if version == s.summaryVersion {
+		if s.summaries == nil || len(s.summaries) >= summaryCacheEntries {
+			s.summaries = map[summaryKey]summarySnapshot{}
+		}
+		s.summaries[key] = summarySnapshot{version: version, expires: time.Now().Add(summaryCacheTTL), summary: summary}
+	}
+	return summary, nil
+}
+
+// InvalidateSummaries drops cached dashboard summaries after users are
+// created, changed or removed.
+func (s *Service) InvalidateSummaries() {
+	s.summaryMu.Lock()
+	defer s.summaryMu.Unlock()
+	s.summaryVersion++
+	s.summaries = nil
+}
+
 func (s *Service) telegramLastError(ctx context.Context) *string {
 	if s.db == nil {
 		return nil
@@ -261,21 +350,35 @@ func (s *Service) appendHistory(snapshot MetricsSnapshot) historySnapshot {
 	)
 
 	return historySnapshot{
-		cpu:         append([]HistoryEntry(nil), s.cpuHistory...),
-		memory:      append([]HistoryEntry(nil), s.memoryHistory...),
-		network:     append([]NetworkHistoryEntry(nil), s.networkHistory...),
-		panelCPU:    append([]HistoryEntry(nil), s.panelCPUHistory...),
-		panelMemory: append([]HistoryEntry(nil), s.panelMemoryHistory...),
+		cpu:         historyWindow(s.cpuHistory),
+		memory:      historyWindow(s.memoryHistory),
+		network:     historyWindow(s.networkHistory),
+		panelCPU:    historyWindow(s.panelCPUHistory),
+		panelMemory: historyWindow(s.panelMemoryHistory),
 	}
 }
 
+// appendBounded appends to a history buffer that only ever grows in place
+// past its current length. Once a full buffer runs out of capacity, the last
+// entries move to a fresh array, so windows handed out earlier never see
+// their elements overwritten and can be returned without copying.
 func appendBounded[T any](items []T, item T) []T {
-	items = append(items, item)
-	if len(items) <= historyMaxEntries {
-		return items
+	if len(items) == cap(items) && len(items) >= historyMaxEntries {
+		next := make([]T, historyMaxEntries-1, 2*historyMaxEntries)
+		copy(next, items[len(items)-historyMaxEntries+1:])
+		items = next
 	}
-	copy(items, items[len(items)-historyMaxEntries:])
-	return items[:historyMaxEntries]
+	return append(items, item)
+}
+
+// historyWindow returns the newest historyMaxEntries items, capped so that
+// appending to the window cannot write into the shared buffer.
+func historyWindow[T any](items []T) []T {
+	start := 0
+	if len(items) > historyMaxEntries {
+		start = len(items) - historyMaxEntries
+	}
+	return items[start:len(items):len(items)]
 }
 
 func (s *Service) connectedNodeRuntime(ctx context.Context) (bool, *string, error) {
@@ -298,8 +401,13 @@ func (s *Service) connectedNodeRuntime(ctx context.Context) (bool, *string, erro
 }
 
 type GopsutilMetricsProvider struct {
+	sampleMu     sync.Mutex
+	lastSample   MetricsSnapshot
+	lastSampleAt time.Time
+
 	mu        sync.Mutex
 	process   *process.Process
+	cpuCores  int
 	lastNet   *gonet.IOCountersStat
 	lastNetAt time.Time
 }
@@ -312,11 +420,26 @@ func NewGopsutilMetricsProvider() *GopsutilMetricsProvider {
 	return &GopsutilMetricsProvider{process: proc}
 }
 
+// Snapshot samples the host at most once per snapshotReuseWindow. Dashboards,
+// live metrics sockets and the REST endpoint polling together then share one
+// reading instead of each walking /proc.
 func (p *GopsutilMetricsProvider) Snapshot(ctx context.Context) (MetricsSnapshot, error) {
+	p.sampleMu.Lock()
+	defer p.sampleMu.Unlock()
 	now := time.Now()
+	if !p.lastSampleAt.IsZero() && now.Sub(p.lastSampleAt) < snapshotReuseWindow {
+		return p.lastSample, nil
+	}
+	result := p.sample(ctx, now)
+	p.lastSample = result
+	p.lastSampleAt = now
+	return result, nil
+}
+
+func (p *GopsutilMetricsProvider) sample(ctx context.Context, now time.Time) MetricsSnapshot {
 	result := MetricsSnapshot{Timestamp: now.Unix()}
 
-	if cores, err := cpu.CountsWithContext(ctx, true); err == nil {
+	if cores, ok := p.logicalCores(ctx); ok {
 		result.CPUCores = cores
 	}
 	if percents, err := cpu.PercentWithContext(ctx, 0, false); err == nil && len(percents) > 0 {
@@ -353,7 +476,28 @@ func (p *GopsutilMetricsProvider) Snapshot(ctx context.Context) (MetricsSnapshot
 	}
 	p.populateProcess(ctx, now, &result)
 	result.IncomingBandwidthSpeed, result.OutgoingBandwidthSpeed = p.realtimeBandwidth(ctx, now)
-	return result, nil
+	return result
+}
+
+// logicalCores reads the logical CPU count once; it does not change while the
+// panel runs, and reading it parses /proc/cpuinfo on Linux.
+func (p *GopsutilMetricsProvider) logicalCores(ctx context.Context) (int, bool) {
+	p.mu.Lock()
+	cores := p.cpuCores
+	p.mu.Unlock()
+	if cores > 0 {
+		return cores, true
+	}
+	cores, err := cpu.CountsWithContext(ctx, true)
+	if err != nil {
+		return 0, false
+	}
+	if cores > 0 {
+		p.mu.Lock()
+		p.cpuCores = cores
+		p.mu.Unlock()
+	}
+	return cores, true
 }
 
 func (p *GopsutilMetricsProvider) populateProcess(ctx context.Context, now time.Time, result *MetricsSnapshot) {
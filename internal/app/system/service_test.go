@@ -0,0 +1,85 @@
+package system
+
+import (
+	"context"
+	"database/sql"
+	"testing"
+
+	dashboardapp "github.com/rebeccapanel/rebecca/internal/app/dashboard"
+	_ "modernc.org/sqlite"
+)
+
+func TestAppendBoundedKeepsEarlierWindowsStable(t *testing.T) {
+	var items []int
+	var windows [][]int
+	for i := 0; i < 3*historyMaxEntries+7; i++ {
+		items = appendBounded(items, i)
+		if i%997 == 0 {
+			windows = append(windows, historyWindow(items))
+		}
+	}
+	window := historyWindow(items)
+	if len(window) != historyMaxEntries {
+		t.Fatalf("window length = %d, want %d", len(window), historyMaxEntries)
+	}
+	if window[0] != 2*historyMaxEntries+7 || window[len(window)-1] != 3*historyMaxEntries+6 {
+		t.Fatalf("window spans %d..%d", window[0], window[len(window)-1])
+	}
+	for _, earlier := range windows {
+		last := earlier[len(earlier)-1]
+		for offset, value := range earlier {
+			if want := last - len(earlier) + 1 + offset; value != want {
+				t.Fatalf("earlier window ending at %d changed at %d: got %d, want %d", last, offset, value, want)
+			}
+		}
+	}
+}
+
+func TestSystemSummaryIsCachedUntilInvalidated(t *testing.T) {
+	db, err := sql.Open("sqlite", "file:system-summary?mode=memory&cache=shared")
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer db.Close()
+	for _, statement := range []string{
+		`CREATE TABLE system (id INTEGER PRIMARY KEY, uplink INTEGER, downlink INTEGER)`,
+		`CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT, admin_id INTEGER, status TEXT, online_at TEXT)`,
+		`CREATE TABLE admins (
+			id INTEGER PRIMARY KEY,
+			username TEXT,
+			role TEXT,
+			status TEXT,
+			users_usage INTEGER,
+			lifetime_usage INTEGER,
+			created_traffic INTEGER,
+			traffic_limit_mode TEXT,
+			use_service_traffic_limits BOOLEAN
+		)`,
+		`INSERT INTO users (id, username, status) VALUES (1, 'first', 'active')`,
+	} {
+		if _, err := db.Exec(statement); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	service := NewServiceWithProvider(db, "sqlite", DefaultVersion, NewGopsutilMetricsProvider())
+	admin := dashboardapp.AdminContext{Username: "owner", Role: "sudo"}
+	ctx := context.Background()
+	summary, err := service.systemSummary(ctx, admin)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if summary.TotalUser != 1 {
+		t.Fatalf("total users = %d, want 1", summary.TotalUser)
+	}
+	if _, err := db.Exec(`INSERT INTO users (id, username, status) VALUES (2, 'second', 'active')`); err != nil {
+		t.Fatal(err)
+	}
+	if summary, err = service.systemSummary(ctx, admin); err != nil || summary.TotalUser != 1 {
+		t.Fatalf("cached total users = %d, %v; want 1", summary.TotalUser, err)
+	}
+	service.InvalidateSummaries()
+	if summary, err = service.systemSummary(ctx, admin); err != nil || summary.TotalUser != 2 {
+		t.Fatalf("total users after invalidation = %d, %v; want 2", summary.TotalUser, err)
+	}
+}
@@ -128,29 +128,21 @@ func (r Repository) UpdateSettings(ctx context.Context, raw map[string]json.RawM
 		case "default_vless_flow":
 			add(key, nullableString(rawTrimmedStringPtr(value)))
 		case "forum_topics":
-			incoming := map[string]TopicSettings{}
-			if string(value) != "null" {
-				if err := json.Unmarshal(value, &incoming); err != nil {
-					return Settings{}, fmt.Errorf("forum_topics must be an object")
-				}
+			topics, err := decodeForumTopics(value)
+			if err != nil {
+				return Settings{}, fmt.Errorf("forum_topics must be an object")
 			}
-			topics := normalizeTopics(incoming, true)
 			encoded, _ := json.Marshal(topics)
 			add(key, string(encoded))
 		case "event_toggles":
-			incoming := map[string]bool{}
+			// current.EventToggles already carries the defaults, so the
+			// incoming object is decoded straight over a copy of it.
+			merged := cloneBoolMap(current.EventToggles)
 			if string(value) != "null" {
-				if err := json.Unmarshal(value, &incoming); err != nil {
+				if err := json.Unmarshal(value, &merged); err != nil {
 					return Settings{}, fmt.Errorf("event_toggles must be an object")
 				}
 			}
-			merged := cloneBoolMap(defaultEventToggles)
-			for key, value := range current.EventToggles {
-				merged[key] = value
-			}
-			for key, value := range incoming {
-				merged[key] = value
-			}
 			encoded, _ := json.Marshal(merged)
 			add(key, string(encoded))
 		case "backup_scope":
@@ -337,10 +329,12 @@ LIMIT 1`
 	if err != nil {
 		return Settings{}, err
 	}
-	topics := map[string]TopicSettings{}
-	_ = json.Unmarshal([]byte(topicsRaw.String), &topics)
-	toggles := map[string]bool{}
+	topics, _ := decodeForumTopics([]byte(topicsRaw.String))
+	toggles := cloneBoolMap(defaultEventToggles)
 	_ = json.Unmarshal([]byte(togglesRaw.String), &toggles)
+	if toggles == nil {
+		toggles = cloneBoolMap(defaultEventToggles)
+	}
 	adminIDs, _ := parseStoredInt64List(adminRaw.String)
 	settings := Settings{
 		APIToken:            stringPtrFromNull(apiToken),
@@ -352,8 +346,8 @@ LIMIT 1`
 		BackupChatID:        int64PtrFromNull(backupChatID),
 		BackupChatIsForum:   backupForum.Valid && backupForum.Int64 != 0,
 		DefaultVlessFlow:    stringPtrFromNull(defaultFlow),
-		ForumTopics:         normalizeTopics(topics, true),
-		EventToggles:        normalizeToggles(toggles),
+		ForumTopics:         topics,
+		EventToggles:        toggles,
 		BackupEnabled:       backupEnabled.Valid && backupEnabled.Int64 != 0,
 		BackupScope:         firstNonEmpty(backupScope.String, "database"),
 		BackupIntervalValue: int(firstNonEmptyInt(intervalValue.Int64, 24)),
@@ -399,9 +393,15 @@ func (r Repository) recordID(ctx context.Context) int64 {
 	return id
 }
 
-func normalizeTopics(source map[string]TopicSettings, preserveExtra bool) map[string]TopicSettings {
-	result := DefaultForumTopics()
-	for key, value := range source {
+// decodeForumTopics decodes topics over the defaults and fills in blank
+// titles in place, so stored and incoming values need no second map.
+func decodeForumTopics(raw []byte) (map[string]TopicSettings, error) {
+	topics := DefaultForumTopics()
+	err := json.Unmarshal(raw, &topics)
+	if topics == nil {
+		topics = DefaultForumTopics()
+	}
+	for key, value := range topics {
 		title := strings.TrimSpace(value.Title)
 		if title == "" {
 			if defaultTitle, ok := defaultTopicTitles[key]; ok {
@@ -410,20 +410,11 @@ func normalizeTopics(source map[string]TopicSettings, preserveExtra bool) map[st
 				title = strings.Title(strings.ReplaceAll(key, "_", " "))
 			}
 		}
-		topic := TopicSettings{Title: title, TopicID: value.TopicID}
-		if _, ok := defaultTopicTitles[key]; ok || preserveExtra {
-			result[key] = topic
+		if title != value.Title {
+			topics[key] = TopicSettings{Title: title, TopicID: value.TopicID}
 		}
 	}
-	return result
-}
-
-func normalizeToggles(source map[string]bool) map[string]bool {
-	result := cloneBoolMap(defaultEventToggles)
-	for key, value := range source {
-		result[key] = value
-	}
-	return result
+	return topics, err
 }
 
 func validateProxyURL(value *string) error {
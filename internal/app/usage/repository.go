@@ -73,11 +73,6 @@ func (r Repository) UserUsageTimeseries(ctx context.Context, userID int64, granu
 		return []TimeseriesRow{}, nil
 	}
 
-	usage := map[string]int64{}
-	for cursor := startBucket; !cursor.After(endBucket); cursor = addBucket(cursor, granularity) {
-		usage[bucketKey(cursor, granularity)] = 0
-	}
-
 	bucket := r.bucketExpr("created_at", granularity)
 	startArg, endArg := r.timeRangeArgs(start, end)
 	rows, err := r.db.QueryContext(
@@ -85,7 +80,7 @@ func (r Repository) UserUsageTimeseries(ctx context.Context, userID int64, granu
 		fmt.Sprintf(`SELECT %s AS bucket, COALESCE(SUM(used_traffic), 0)
 		  FROM node_user_usages
 		  WHERE user_id = ? AND created_at >= ? AND created_at <= ?
-		  GROUP BY bucket`, bucket),
+		  GROUP BY bucket ORDER BY bucket`, bucket),
 		userID,
 		startArg,
 		endArg,
@@ -94,10 +89,7 @@ func (r Repository) UserUsageTimeseries(ctx context.Context, userID int64, granu
 		return nil, err
 	}
 	defer rows.Close()
-	if err := mergeBucketRows(rows, usage); err != nil {
-		return nil, err
-	}
-	return timeseriesFromMap(usage, granularity), nil
+	return scanBucketTimeseries(rows, granularity, startBucket, endBucket)
 }
 
 func (r Repository) UserUsageByNodes(ctx context.Context, userID int64, start time.Time, end time.Time) ([]NodeTrafficRow, error) {
@@ -339,11 +331,6 @@ func (r Repository) ServiceUsageTimeseries(ctx context.Context, serviceID int64,
 		return []TimeseriesRow{}, nil
 	}
 
-	usage := map[string]int64{}
-	for cursor := startBucket; !cursor.After(endBucket); cursor = addBucket(cursor, granularity) {
-		usage[bucketKey(cursor, granularity)] = 0
-	}
-
 	bucket := r.bucketExpr("nu.created_at", granularity)
 	startArg, endArg := r.timeRangeArgs(start, end)
 	rows, err := r.db.QueryContext(
@@ -353,7 +340,7 @@ func (r Repository) ServiceUsageTimeseries(ctx context.Context, serviceID int64,
 		  JOIN users u ON u.id = nu.user_id
 		  WHERE u.service_id = ?
 		    AND nu.created_at >= ? AND nu.created_at <= ?
-		  GROUP BY bucket`, bucket),
+		  GROUP BY bucket ORDER BY bucket`, bucket),
 		serviceID,
 		startArg,
 		endArg,
@@ -362,10 +349,7 @@ func (r Repository) ServiceUsageTimeseries(ctx context.Context, serviceID int64,
 		return nil, err
 	}
 	defer rows.Close()
-	if err := mergeBucketRows(rows, usage); err != nil {
-		return nil, err
-	}
-	return timeseriesFromMap(usage, granularity), nil
+	return scanBucketTimeseries(rows, granularity, startBucket, endBucket)
 }
 
 func (r Repository) ServiceAdminUsage(ctx context.Context, serviceID int64, start time.Time, end time.Time) ([]ServiceAdminUsageRow, error) {
@@ -466,11 +450,6 @@ func (r Repository) ServiceAdminUsageTimeseries(ctx context.Context, serviceID i
 		return []TimeseriesRow{}, nil
 	}
 
-	usage := map[string]int64{}
-	for cursor := startBucket; !cursor.After(endBucket); cursor = addBucket(cursor, granularity) {
-		usage[bucketKey(cursor, granularity)] = 0
-	}
-
 	bucket := r.bucketExpr("nu.created_at", granularity)
 	startArg, endArg := r.timeRangeArgs(start, end)
 	args := []any{serviceID, startArg, endArg}
@@ -484,17 +463,14 @@ func (r Repository) ServiceAdminUsageTimeseries(ctx context.Context, serviceID i
 		query += ` AND u.admin_id = ?`
 		args = append(args, adminID)
 	}
-	query += ` GROUP BY bucket`
+	query += ` GROUP BY bucket ORDER BY bucket`
 
 	rows, err := r.db.QueryContext(ctx, query, args...)
 	if err != nil {
 		return nil, err
 	}
 	defer rows.Close()
-	if err := mergeBucketRows(rows, usage); err != nil {
-		return nil, err
-	}
-	return timeseriesFromMap(usage, granularity), nil
+	return scanBucketTimeseries(rows, granularity, startBucket, endBucket)
 }
 
 func (r Repository) baseNodeUsage(ctx context.Context) ([]UsageRow, map[string]int, error) {
@@ -608,37 +584,47 @@ func scanDateUsageRows(rows *sql.Rows) ([]DateUsageRow, error) {
 	return result, rows.Err()
 }
 
-func mergeBucketRows(rows *sql.Rows, usage map[string]int64) error {
+// scanBucketTimeseries walks rows ordered by bucket alongside the expected
+// bucket range, emitting zero-filled rows for buckets the query skipped.
+func scanBucketTimeseries(rows *sql.Rows, granularity string, startBucket time.Time, endBucket time.Time) ([]TimeseriesRow, error) {
+	result := []TimeseriesRow{}
+	cursor := startBucket
+	appendUntil := func(key string) {
+		for ; !cursor.After(endBucket) && bucketKey(cursor, granularity) < key; cursor = addBucket(cursor, granularity) {
+			result = append(result, timeseriesRowAt(cursor, 0))
+		}
+	}
 	for rows.Next() {
 		var bucket sql.NullString
 		var used sql.NullInt64
 		if err := rows.Scan(&bucket, &used); err != nil {
-			return err
+			return nil, err
 		}
 		if !bucket.Valid {
 			continue
 		}
-		usage[bucket.String] += used.Int64
+		appendUntil(bucket.String)
+		if cursor.After(endBucket) || bucketKey(cursor, granularity) != bucket.String {
+			continue
+		}
+		result = append(result, timeseriesRowAt(cursor, used.Int64))
+		cursor = addBucket(cursor, granularity)
 	}
-	return rows.Err()
-}
-
-func timeseriesFromMap(usage map[string]int64, granularity string) []TimeseriesRow {
-	keys := make([]string, 0, len(usage))
-	for key := range usage {
-		keys = append(keys, key)
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	for ; !cursor.After(endBucket); cursor = addBucket(cursor, granularity) {
+		result = append(result, timeseriesRowAt(cursor, 0))
 	}
-	sort.Strings(keys)
+	return result, nil
+}
 
-	result := make([]TimeseriesRow, 0, len(keys))
-	for _, key := range keys {
-		result = append(result, TimeseriesRow{
-			Timestamp:   timestampFromBucketKey(key, granularity),
-			Date:        dateFromBucketKey(key),
-			UsedTraffic: usage[key],
-		})
+func timeseriesRowAt(bucket time.Time, used int64) TimeseriesRow {
+	return TimeseriesRow{
+		Timestamp:   bucket.Format(time.RFC3339),
+		Date:        bucket.Format("2006-01-02"),
+		UsedTraffic: used,
 	}
-	return result
 }
 
 func alignBucket(value time.Time, granularity string) time.Time {
@@ -663,26 +649,6 @@ func bucketKey(value time.Time, granularity string) string {
 	return value.UTC().Format("2006-01-02")
 }
 
-func timestampFromBucketKey(key string, granularity string) string {
-	if granularity == "hour" {
-		if parsed, err := time.ParseInLocation("2006-01-02 15:00", key, time.UTC); err == nil {
-			return parsed.Format(time.RFC3339)
-		}
-		return key
-	}
-	if parsed, err := time.ParseInLocation("2006-01-02", key, time.UTC); err == nil {
-		return parsed.Format(time.RFC3339)
-	}
-	return key
-}
-
-func dateFromBucketKey(key string) string {
-	if len(key) >= len("2006-01-02") {
-		return key[:len("2006-01-02")]
-	}
-	return key
-}
-
 func sortNodeID(nodeID *int64) int64 {
 	if nodeID == nil {
 		return 0
@@ -158,6 +158,32 @@ func TestServiceUsage(t *testing.T) {
 	}
 }
 
+func TestUserUsageTimeseriesFillsHourlyGaps(t *testing.T) {
+	repo := testRepository(t)
+	start, end := testRange(t)
+
+	rows, err := repo.UserUsageTimeseries(context.Background(), 1, "hour", start, end)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(rows) != 25 {
+		t.Fatalf("UserUsageTimeseries() returned %d rows, want 25", len(rows))
+	}
+	for index, row := range rows {
+		want := start.Add(time.Duration(index) * time.Hour).Format(time.RFC3339)
+		if row.Timestamp != want {
+			t.Fatalf("UserUsageTimeseries()[%d].Timestamp = %q, want %q", index, row.Timestamp, want)
+		}
+		wantUsed := int64(0)
+		if index == 9 {
+			wantUsed = 300
+		}
+		if row.UsedTraffic != wantUsed {
+			t.Fatalf("UserUsageTimeseries()[%d].UsedTraffic = %d, want %d", index, row.UsedTraffic, wantUsed)
+		}
+	}
+}
+
 func int64Ptr(value int64) *int64 {
 	v := value
 	return &v
@@ -13,6 +13,7 @@ import (
 
 const NodeOperationSyncConfig = "sync_config"
 const maxBulkDeleteUsers = 500
+const bulkUserIDChunkSize = 500
 
 type bulkUserFilter struct {
 	where []string
@@ -160,11 +161,8 @@ func (r Repository) bulkUsersActionMutation(ctx context.Context, requester admin
 	}
 
 	if payload.Action != AdvancedUserActionDeleteUsers {
-		now := time.Now().UTC()
-		for _, userID := range affectedUserIDs {
-			if err := r.enqueueUserOperationForNodesTx(ctx, tx, NodeOperationUpdateUser, userID, now); err != nil {
-				return BulkUsersActionResult{}, err
-			}
+		if err := r.enqueueUsersOperationForNodesTx(ctx, tx, NodeOperationUpdateUser, affectedUserIDs, time.Now().UTC()); err != nil {
+			return BulkUsersActionResult{}, err
 		}
 	}
 	if err := tx.Commit(); err != nil {
@@ -276,14 +274,22 @@ LIMIT ?`, args...)
 		if err := r.recordDeletedUserUsageCreditTx(ctx, tx, requester, snapshot, now); err != nil {
 			return 0, nil, err
 		}
-		if _, err := tx.ExecContext(ctx, `UPDATE users SET status = ?, last_status_change = ? WHERE id = ?`, string(UserStatusDeleted), dbTime(now), snapshot.ID); err != nil {
-			return 0, nil, err
-		}
-		if err := r.enqueueUserOperationForNodesTx(ctx, tx, NodeOperationRemoveUser, snapshot.ID, now); err != nil {
-			return 0, nil, err
-		}
 		userIDs = append(userIDs, snapshot.ID)
 	}
+	if len(userIDs) == 0 {
+		return 0, userIDs, nil
+	}
+	updateArgs := make([]any, 0, len(userIDs)+2)
+	updateArgs = append(updateArgs, string(UserStatusDeleted), dbTime(now))
+	for _, id := range userIDs {
+		updateArgs = append(updateArgs, id)
+	}
+	if _, err := tx.ExecContext(ctx, `UPDATE users SET status = ?, last_status_change = ? WHERE id IN (`+placeholders(len(userIDs))+`)`, updateArgs...); err != nil {
+		return 0, nil, err
+	}
+	if err := r.enqueueUsersOperationForNodesTx(ctx, tx, NodeOperationRemoveUser, userIDs, now); err != nil {
+		return 0, nil, err
+	}
 	return int64(len(userIDs)), userIDs, nil
 }
 
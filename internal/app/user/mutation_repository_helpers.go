@@ -800,6 +800,76 @@ func (r Repository) enqueueUserOperationForNodesTx(ctx context.Context, tx *sql.
 	return nil
 }
 
+// enqueueUsersOperationForNodesTx queues one operation per user and active
+// node, resolving runtime emails in batches instead of once per user.
+func (r Repository) enqueueUsersOperationForNodesTx(ctx context.Context, tx *sql.Tx, operationType string, userIDs []int64, queuedAt time.Time) error {
+	if len(userIDs) == 0 {
+		return nil
+	}
+	nodeIDs, err := r.activeNodeIDsTx(ctx, tx)
+	if err != nil {
+		return err
+	}
+	emails := map[int64]string{}
+	if isRuntimeUserNodeOperation(operationType) {
+		if emails, err = r.runtimeUserEmailsTx(ctx, tx, userIDs); err != nil {
+			return err
+		}
+	}
+	queuedAtText := queuedAt.Format(time.RFC3339Nano)
+	for _, userID := range userIDs {
+		payload := map[string]any{"queued_at": queuedAtText}
+		if email := emails[userID]; email != "" {
+			payload["runtime_email"] = email
+		}
+		for _, nodeID := range nodeIDs {
+			if err := r.insertNodeOperationTx(ctx, tx, operationType, nodeID, userID, payload, queuedAt); err != nil {
+				return err
+			}
+		}
+	}
+	return nil
+}
+
+func (r Repository) runtimeUserEmailsTx(ctx context.Context, tx *sql.Tx, userIDs []int64) (map[int64]string, error) {
+	ids := uniqueInt64(userIDs)
+	result := make(map[int64]string, len(ids))
+	for start := 0; start < len(ids); start += bulkUserIDChunkSize {
+		end := start + bulkUserIDChunkSize
+		if end > len(ids) {
+			end = len(ids)
+		}
+		chunk := ids[start:end]
+		args := make([]any, 0, len(chunk))
+		for _, id := range chunk {
+			args = append(args, id)
+		}
+		rows, err := tx.QueryContext(ctx, `SELECT id, username FROM users WHERE id IN (`+placeholders(len(chunk))+`)`, args...)
+		if err != nil {
+			return nil, err
+		}
+		for rows.Next() {
+			var id int64
+			var username string
+			if err := rows.Scan(&id, &username); err != nil {
+				rows.Close()
+				return nil, err
+			}
+			if username = strings.TrimSpace(username); username != "" && id > 0 {
+				result[id] = fmt.Sprintf("%d.%s", id, username)
+			}
+		}
+		if err := rows.Err(); err != nil {
+			rows.Close()
+			return nil, err
+		}
+		if err := rows.Close(); err != nil {
+			return nil, err
+		}
+	}
+	return result, nil
+}
+
 func (r Repository) runtimeUserEmailTx(ctx context.Context, tx *sql.Tx, userID int64) (string, error) {
 	if userID <= 0 {
 		return "", nil
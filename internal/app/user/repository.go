@@ -40,6 +40,65 @@ type repositoryCache struct {
 	fastCreateContextExpires time.Time
 	activeNodeIDs            []int64
 	activeNodeIDsExpires     time.Time
+	effectiveSettings        map[int64]effectiveSettingsSnapshot
+}
+
+type effectiveSettingsSnapshot struct {
+	settings SubscriptionSettings
+	expires  time.Time
+}
+
+const (
+	effectiveSettingsCacheTTL     = 10 * time.Second
+	effectiveSettingsCacheEntries = 1024
+)
+
+func (r Repository) cachedEffectiveSettings(adminID int64) (SubscriptionSettings, bool) {
+	if r.cache == nil {
+		return SubscriptionSettings{}, false
+	}
+	now := time.Now()
+	r.cache.mu.RLock()
+	defer r.cache.mu.RUnlock()
+	snapshot, ok := r.cache.effectiveSettings[adminID]
+	if !ok || now.After(snapshot.expires) {
+		return SubscriptionSettings{}, false
+	}
+	return cloneSubscriptionSettings(snapshot.settings), true
+}
+
+func (r Repository) storeEffectiveSettings(adminID int64, settings SubscriptionSettings) {
+	if r.cache == nil {
+		return
+	}
+	r.cache.mu.Lock()
+	defer r.cache.mu.Unlock()
+	if r.cache.effectiveSettings == nil || len(r.cache.effectiveSettings) >= effectiveSettingsCacheEntries {
+		r.cache.effectiveSettings = map[int64]effectiveSettingsSnapshot{}
+	}
+	r.cache.effectiveSettings[adminID] = effectiveSettingsSnapshot{
+		settings: cloneSubscriptionSettings(settings),
+		expires:  time.Now().Add(effectiveSettingsCacheTTL),
+	}
+}
+
+func (r Repository) invalidateEffectiveSettings() {
+	if r.cache == nil {
+		return
+	}
+	r.cache.mu.Lock()
+	defer r.cache.mu.Unlock()
+	r.cache.effectiveSettings = nil
+}
+
+func cloneSubscriptionSettings(settings SubscriptionSettings) SubscriptionSettings {
+	if settings.SubscriptionPorts != nil {
+		settings.SubscriptionPorts = append([]int{}, settings.SubscriptionPorts...)
+	}
+	if settings.SubscriptionAliases != nil {
+		settings.SubscriptionAliases = append([]string{}, settings.SubscriptionAliases...)
+	}
+	return settings
 }
 
 func (r Repository) LinkPrerequisites(ctx context.Context, req LinkPrerequisitesRequest) (LinkPrerequisites, error) {
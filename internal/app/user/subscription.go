@@ -13,7 +13,9 @@ import (
 	"strconv"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
+	"unicode/utf8"
 
 	"github.com/flosch/pongo2/v6"
 	"github.com/rebeccapanel/rebecca/internal/app/usage"
@@ -51,6 +53,27 @@ type SubscriptionHTTPResponse struct {
 	JSON      any
 }
 
+// SubscriptionUsageResponse is the /usage payload. Fields are declared in key
+// order so the output matches the map-based payload it replaced.
+type SubscriptionUsageResponse struct {
+	End          string                    `json:"end"`
+	HourlyUsages []SubscriptionHourlyUsage `json:"hourly_usages"`
+	NodeUsages   []usage.NodeTrafficRow    `json:"node_usages"`
+	Start        string                    `json:"start"`
+	Usages       []SubscriptionDailyUsage  `json:"usages"`
+	Username     string                    `json:"username"`
+}
+
+type SubscriptionDailyUsage struct {
+	Date        string `json:"date"`
+	UsedTraffic int64  `json:"used_traffic"`
+}
+
+type SubscriptionHourlyUsage struct {
+	Timestamp   string `json:"timestamp"`
+	UsedTraffic int64  `json:"used_traffic"`
+}
+
 type subscriptionTokenPayload struct {
 	Username  string
 	CreatedAt time.Time
@@ -123,8 +146,8 @@ func (s Service) RenderSubscription(ctx context.Context, req SubscriptionRenderR
 			Body:      []byte(html),
 		}, nil
 	}
-	if !req.ReadOnly {
-		_ = s.repo.updateSubscriptionAccess(ctx, user.ID, req.UserAgent)
+	if !req.ReadOnly && subscriptionAccessStale(user, req.UserAgent, time.Now()) {
+		s.recordSubscriptionAccess(ctx, user.ID, req.UserAgent)
 	}
 	if req.ClientType == "openvpn" {
 		return s.generateOVProfile(ctx, user, req)
@@ -132,9 +155,10 @@ func (s Service) RenderSubscription(ctx context.Context, req SubscriptionRenderR
 	if req.ClientType == "wireguard" {
 		return s.generateWGProfile(ctx, user, req)
 	}
+	settings := s.effectiveSettings(ctx, user.AdminID)
 	clientType := req.ClientType
 	if clientType == "" {
-		clientType = selectSubscriptionClientType(req.UserAgent, s.effectiveSettings(ctx, user.AdminID))
+		clientType = selectSubscriptionClientType(req.UserAgent, settings)
 	}
 	config, ok := subscriptionClientConfigs[clientType]
 	if !ok {
@@ -147,8 +171,8 @@ func (s Service) RenderSubscription(ctx context.Context, req SubscriptionRenderR
 	return SubscriptionHTTPResponse{
 		Status:    200,
 		MediaType: config.Media,
-		Headers:   subscriptionHeaders(user, req, s.effectiveSettings(ctx, user.AdminID)),
-		Body:      []byte(body),
+		Headers:   subscriptionHeaders(user, req, settings),
+		Body:      body,
 	}, nil
 }
 
@@ -245,73 +269,108 @@ func (s Service) subscriptionVPNInfo(ctx context.Context, user UserDetail, subsc
 	}, nil
 }
 
-func (s Service) SubscriptionUsage(ctx context.Context, req SubscriptionRenderRequest) (map[string]any, error) {
+func (s Service) SubscriptionUsage(ctx context.Context, req SubscriptionRenderRequest) (SubscriptionUsageResponse, error) {
 	user, err := s.resolveSubscriptionUser(ctx, req)
 	if err != nil {
-		return nil, err
+		return SubscriptionUsageResponse{}, err
 	}
 	start, end, err := subscriptionUsageRange(req.Start, req.End)
 	if err != nil {
-		return nil, clientError(400, "Invalid date range or format")
-	}
-	daily, err := req.Usage.UserUsageTimeseries(ctx, usage.UsageRequest{
-		UserID:      user.ID,
-		Start:       start.Format(time.RFC3339Nano),
-		End:         end.Format(time.RFC3339Nano),
-		Granularity: "day",
-	})
+		return SubscriptionUsageResponse{}, clientError(400, "Invalid date range or format")
+	}
+	rangeStart := start.Format(time.RFC3339Nano)
+	rangeEnd := end.Format(time.RFC3339Nano)
+
+	var nodes []usage.NodeTrafficRow
+	var nodesErr error
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		nodes, nodesErr = req.Usage.UserUsageByNodes(ctx, usage.UsageRequest{
+			UserID: user.ID,
+			Start:  rangeStart,
+			End:    rangeEnd,
+		})
+	}()
+	hourly, usages, err := subscriptionUsageTimeline(ctx, req.Usage, user.ID, start, end)
+	wg.Wait()
 	if err != nil {
-		return nil, err
+		return SubscriptionUsageResponse{}, err
+	}
+	if nodesErr != nil {
+		return SubscriptionUsageResponse{}, nodesErr
+	}
+	return SubscriptionUsageResponse{
+		End:          rangeEnd,
+		HourlyUsages: hourly,
+		NodeUsages:   nodes,
+		Start:        rangeStart,
+		Usages:       usages,
+		Username:     user.Username,
+	}, nil
+}
+
+// subscriptionUsageTimeline loads the daily and, for single-day ranges, hourly
+// usage. A single-day range has exactly one daily bucket, so it is summed from
+// the hourly rows instead of being queried separately.
+func subscriptionUsageTimeline(ctx context.Context, usageService usage.Service, userID int64, start time.Time, end time.Time) ([]SubscriptionHourlyUsage, []SubscriptionDailyUsage, error) {
+	request := usage.UsageRequest{
+		UserID: userID,
+		Start:  start.Format(time.RFC3339Nano),
+		End:    end.Format(time.RFC3339Nano),
 	}
-	hourly := []map[string]any{}
 	if sameUTCDate(start, end) {
-		rows, err := req.Usage.UserUsageTimeseries(ctx, usage.UsageRequest{
-			UserID:      user.ID,
-			Start:       start.Format(time.RFC3339Nano),
-			End:         end.Format(time.RFC3339Nano),
-			Granularity: "hour",
-		})
+		request.Granularity = "hour"
+		rows, err := usageService.UserUsageTimeseries(ctx, request)
 		if err != nil {
-			return nil, err
+			return nil, nil, err
 		}
+		hourly := make([]SubscriptionHourlyUsage, 0, len(rows))
+		var total int64
 		for _, row := range rows {
-			hourly = append(hourly, map[string]any{"timestamp": row.Timestamp, "used_traffic": row.UsedTraffic})
+			hourly = append(hourly, SubscriptionHourlyUsage{Timestamp: row.Timestamp, UsedTraffic: row.UsedTraffic})
+			total += row.UsedTraffic
+		}
+		daily := []SubscriptionDailyUsage{}
+		if len(rows) > 0 {
+			daily = append(daily, SubscriptionDailyUsage{Date: start.UTC().Format("2006-01-02"), UsedTraffic: total})
 		}
+		return hourly, daily, nil
 	}
-	nodes, err := req.Usage.UserUsageByNodes(ctx, usage.UsageRequest{
-		UserID: user.ID,
-		Start:  start.Format(time.RFC3339Nano),
-		End:    end.Format(time.RFC3339Nano),
-	})
+
+	request.Granularity = "day"
+	rows, err := usageService.UserUsageTimeseries(ctx, request)
 	if err != nil {
-		return nil, err
+		return nil, nil, err
 	}
-	usages := make([]map[string]any, 0, len(daily))
-	for _, row := range daily {
+	daily := make([]SubscriptionDailyUsage, 0, len(rows))
+	for _, row := range rows {
 		date := row.Timestamp
 		if len(date) >= 10 {
 			date = date[:10]
 		}
-		usages = append(usages, map[string]any{"date": date, "used_traffic": row.UsedTraffic})
+		daily = append(daily, SubscriptionDailyUsage{Date: date, UsedTraffic: row.UsedTraffic})
 	}
-	return map[string]any{
-		"username":      user.Username,
-		"start":         start.Format(time.RFC3339Nano),
-		"end":           end.Format(time.RFC3339Nano),
-		"usages":        usages,
-		"hourly_usages": hourly,
-		"node_usages":   nodes,
-	}, nil
+	return []SubscriptionHourlyUsage{}, daily, nil
 }
 
 func (s Service) ResolveSubscriptionAlias(ctx context.Context, path string, query url.Values) (SubscriptionRenderRequest, bool, error) {
-	settings, err := s.repo.subscriptionSettings(ctx)
-	if err != nil {
-		return SubscriptionRenderRequest{}, false, err
-	}
+	// The default /sub/ prefix needs nothing from settings, so it is resolved
+	// before the settings read; the rest go through the cached panel-wide
+	// settings shared with rendering.
 	if req, ok := resolvePrefixedSubscriptionPath(path, "/sub/"); ok {
 		return req, true, nil
 	}
+	settings, ok := s.repo.cachedEffectiveSettings(0)
+	if !ok {
+		base, err := s.repo.subscriptionSettings(ctx)
+		if err != nil {
+			return SubscriptionRenderRequest{}, false, err
+		}
+		settings = effectiveSubscriptionSettings(base, AdminLinkSettings{})
+		s.repo.storeEffectiveSettings(0, settings)
+	}
 	if configured := "/" + normalizePath(settings.SubscriptionPath) + "/"; configured != "/sub/" {
 		if req, ok := resolvePrefixedSubscriptionPath(path, configured); ok {
 			return req, true, nil
@@ -330,13 +389,8 @@ func (s Service) ResolveSubscriptionAlias(ctx context.Context, path string, quer
 			return SubscriptionRenderRequest{Identifier: identifier}, true, nil
 		}
 	}
-	for _, alias := range settings.SubscriptionAliases {
-		if identifier := matchSubscriptionQueryAlias(alias, path, query); identifier != "" {
-			return SubscriptionRenderRequest{Identifier: identifier}, true, nil
-		}
-		if identifier := matchSubscriptionPathAlias(alias, path); identifier != "" {
-			return SubscriptionRenderRequest{Identifier: identifier}, true, nil
-		}
+	if identifier := subscriptionAliasDispatcherFor(settings.SubscriptionAliases).match(path, query); identifier != "" {
+		return SubscriptionRenderRequest{Identifier: identifier}, true, nil
 	}
 	return SubscriptionRenderRequest{}, false, nil
 }
@@ -345,9 +399,18 @@ func (s Service) resolveSubscriptionUser(ctx context.Context, req SubscriptionRe
 	if req.Username != "" || req.Key != "" {
 		return s.repo.subscriptionUserByUsernameKey(ctx, req.Username, req.Key)
 	}
-	for _, candidate := range candidateIdentifiers(req.Identifier) {
-		if user, err := s.resolveSubscriptionToken(ctx, candidate); err == nil {
-			return user, nil
+	candidates := candidateIdentifiers(req.Identifier)
+	if len(candidates) == 0 {
+		return UserDetail{}, clientError(404, "Not Found")
+	}
+	// The signing secret is read once for every candidate; unsigned candidates
+	// then fail token parsing without touching the database.
+	secret, secretErr := s.repo.subscriptionSecretKey(ctx)
+	for _, candidate := range candidates {
+		if secretErr == nil {
+			if user, ok := s.resolveSubscriptionToken(ctx, candidate, secret); ok {
+				return user, nil
+			}
 		}
 		if isCredentialKey(candidate) {
 			if user, err := s.repo.subscriptionUserByKeyOnly(ctx, candidate); err == nil {
@@ -361,61 +424,75 @@ func (s Service) resolveSubscriptionUser(ctx context.Context, req SubscriptionRe
 	return UserDetail{}, clientError(404, "Not Found")
 }
 
-func (s Service) resolveSubscriptionToken(ctx context.Context, token string) (UserDetail, error) {
-	secret, err := s.repo.subscriptionSecretKey(ctx)
-	if err != nil {
-		return UserDetail{}, err
-	}
+// resolveSubscriptionToken reports whether token is a valid, unrevoked signed
+// token for an existing user. Callers fall through to the other identifier
+// forms on failure, so no error value is built for the miss.
+func (s Service) resolveSubscriptionToken(ctx context.Context, token string, secret string) (UserDetail, bool) {
 	payload, ok := parseSubscriptionToken(token, secret)
 	if !ok {
-		return UserDetail{}, clientError(404, "Not Found")
+		return UserDetail{}, false
 	}
 	user, err := s.repo.subscriptionUserByUsername(ctx, payload.Username)
 	if err != nil {
-		return UserDetail{}, err
+		return UserDetail{}, false
 	}
 	created, ok := parseDBTime(user.CreatedAt)
 	if !ok || created.After(payload.CreatedAt) {
-		return UserDetail{}, clientError(404, "Not Found")
+		return UserDetail{}, false
 	}
 	revoked, hasRevoked, err := s.repo.subscriptionRevokedAt(ctx, user.ID)
-	if err != nil {
-		return UserDetail{}, err
-	}
-	if hasRevoked && revoked.After(payload.CreatedAt) {
-		return UserDetail{}, clientError(404, "Not Found")
+	if err != nil || (hasRevoked && revoked.After(payload.CreatedAt)) {
+		return UserDetail{}, false
 	}
-	return user, nil
+	return user, true
 }
 
 func (s Service) effectiveSettings(ctx context.Context, adminID *int64) SubscriptionSettings {
+	key := int64(0)
+	if adminID != nil && *adminID > 0 {
+		key = *adminID
+	}
+	if cached, ok := s.repo.cachedEffectiveSettings(key); ok {
+		return cached
+	}
 	settings, err := s.repo.subscriptionSettings(ctx)
 	if err != nil {
 		return SubscriptionSettings{SubscriptionProfileTitle: "Subscription", SubscriptionSupportURL: "https://t.me/", SubscriptionUpdateInterval: "12", SubscriptionPath: "sub"}
 	}
 	admin := AdminLinkSettings{}
-	if adminID != nil && *adminID > 0 {
-		admins, err := s.repo.adminLinkSettings(ctx, []int64{*adminID})
-		if err == nil {
-			admin = admins[*adminID]
+	if key > 0 {
+		admins, err := s.repo.adminLinkSettings(ctx, []int64{key})
+		if err != nil {
+			return effectiveSubscriptionSettings(settings, admin)
 		}
+		admin = admins[key]
 	}
-	return effectiveSubscriptionSettings(settings, admin)
+	effective := effectiveSubscriptionSettings(settings, admin)
+	s.repo.storeEffectiveSettings(key, effective)
+	return effective
+}
+
+// EffectiveSubscriptionSettings returns the subscription settings that users
+// of adminID render with, served from the short-lived settings cache.
+func (s Service) EffectiveSubscriptionSettings(ctx context.Context, adminID *int64) SubscriptionSettings {
+	return s.effectiveSettings(ctx, adminID)
 }
 
-func (s Service) generateSubscriptionConfig(ctx context.Context, user UserDetail, config SubscriptionClientConfig) (string, error) {
+// InvalidateSubscriptionSettings drops cached effective subscription settings
+// after panel, subscription or admin settings change.
+func (s Service) InvalidateSubscriptionSettings() {
+	s.repo.invalidateEffectiveSettings()
+}
+
+func (s Service) generateSubscriptionConfig(ctx context.Context, user UserDetail, config SubscriptionClientConfig) ([]byte, error) {
 	links, err := s.ConfigLinks(ctx, ConfigLinksRequest{UserID: user.ID, Reverse: config.Reverse})
 	if err != nil {
-		return "", err
+		return nil, err
 	}
 	raw := links.Links
 	switch config.Format {
 	case "v2ray":
-		content := strings.Join(raw, "\n")
-		if config.Base64 {
-			return base64.StdEncoding.EncodeToString([]byte(content)), nil
-		}
-		return content, nil
+		return joinSubscriptionLinks(raw, config.Base64), nil
 	case "outline":
 		servers := make([]string, 0, len(raw))
 		for _, link := range raw {
@@ -430,10 +507,36 @@ func (s Service) generateSubscriptionConfig(ctx context.Context, user UserDetail
 	case "sing-box":
 		return renderSingBoxJSON(raw)
 	case "clash", "clash-meta":
-		return renderClashLikeYAML(user.Username, raw, config.Format == "clash-meta"), nil
+		return []byte(renderClashLikeYAML(user.Username, raw, config.Format == "clash-meta")), nil
 	default:
-		return "", clientError(404, "Unsupported client type")
+		return nil, clientError(404, "Unsupported client type")
+	}
+}
+
+// joinSubscriptionLinks writes the newline separated links into one buffer
+// and, when requested, base64-encodes that buffer into the response body
+// without intermediate strings.
+func joinSubscriptionLinks(links []string, encode bool) []byte {
+	size := 0
+	for i, link := range links {
+		if i > 0 {
+			size++
+		}
+		size += len(link)
+	}
+	joined := make([]byte, 0, size)
+	for i, link := range links {
+		if i > 0 {
+			joined = append(joined, '\n')
+		}
+		joined = append(joined, link...)
+	}
+	if !encode {
+		return joined
 	}
+	encoded := make([]byte, base64.StdEncoding.EncodedLen(len(joined)))
+	base64.StdEncoding.Encode(encoded, joined)
+	return encoded
 }
 
 func (s Service) subscriptionTemplateContent(ctx context.Context, templateKey string, adminID *int64) string {
@@ -567,6 +670,33 @@ func (r Repository) subscriptionRevokedAt(ctx context.Context, userID int64) (ti
 	return parsed, ok, nil
 }
 
+const (
+	subscriptionAccessDebounce     = time.Minute
+	subscriptionAccessWriteTimeout = 10 * time.Second
+)
+
+// subscriptionAccessStale reports whether the stored access stamp is worth
+// rewriting: clients polling with the same user agent within a minute keep
+// the existing one.
+func subscriptionAccessStale(user UserDetail, userAgent string, now time.Time) bool {
+	if user.SubUpdatedAt == nil || user.SubLastUserAgent == nil || *user.SubLastUserAgent != strings.TrimSpace(userAgent) {
+		return true
+	}
+	updated, ok := parseDBTime(*user.SubUpdatedAt)
+	return !ok || now.Sub(updated) >= subscriptionAccessDebounce
+}
+
+// recordSubscriptionAccess stamps the access after the response is on its
+// way; the write is bookkeeping and must not hold up the subscription body.
+func (s Service) recordSubscriptionAccess(ctx context.Context, userID int64, userAgent string) {
+	parent := context.WithoutCancel(ctx)
+	go func() {
+		ctx, cancel := context.WithTimeout(parent, subscriptionAccessWriteTimeout)
+		defer cancel()
+		_ = s.repo.updateSubscriptionAccess(ctx, userID, userAgent)
+	}()
+}
+
 func (r Repository) updateSubscriptionAccess(ctx context.Context, userID int64, userAgent string) error {
 	_, err := r.db.ExecContext(ctx, `UPDATE users SET sub_updated_at = ?, sub_last_user_agent = ? WHERE id = ?`, dbTime(time.Now().UTC()), strings.TrimSpace(userAgent), userID)
 	return err
@@ -638,18 +768,35 @@ func candidateIdentifiers(identifier string) []string {
 	if raw == "" {
 		return nil
 	}
-	result := []string{raw}
-	for _, sep := range []string{"+", ":", "|", " "} {
-		if strings.Contains(raw, sep) {
-			tail := strings.TrimSpace(raw[strings.LastIndex(raw, sep)+len(sep):])
-			if tail != "" && !containsString(result, tail) {
-				result = append(result, tail)
-			}
+	// One pass finds the last position of each separator; tails are then
+	// tried in separator order as before.
+	last := [len(candidateIdentifierSeparators)]int{-1, -1, -1, -1}
+	found := false
+	for i := 0; i < len(raw); i++ {
+		if sep := strings.IndexByte(candidateIdentifierSeparators, raw[i]); sep >= 0 {
+			last[sep] = i
+			found = true
+		}
+	}
+	if !found {
+		return []string{raw}
+	}
+	result := make([]string, 1, len(last)+1)
+	result[0] = raw
+	for _, idx := range last {
+		if idx < 0 {
+			continue
+		}
+		tail := strings.TrimSpace(raw[idx+1:])
+		if tail != "" && !containsString(result, tail) {
+			result = append(result, tail)
 		}
 	}
 	return result
 }
 
+const candidateIdentifierSeparators = "+:| "
+
 func resolvePrefixedSubscriptionPath(path string, prefix string) (SubscriptionRenderRequest, bool) {
 	if !strings.HasPrefix(path, prefix) {
 		return SubscriptionRenderRequest{}, false
@@ -658,7 +805,12 @@ func resolvePrefixedSubscriptionPath(path string, prefix string) (SubscriptionRe
 	if tail == "" {
 		return SubscriptionRenderRequest{}, false
 	}
-	segments := strings.Split(tail, "/")
+	var buffer [4]string
+	count, ok := splitSubscriptionPath(tail, &buffer)
+	if !ok {
+		return SubscriptionRenderRequest{}, false
+	}
+	segments := buffer[:count]
 	if len(segments) == 1 {
 		return SubscriptionRenderRequest{Identifier: segments[0]}, true
 	}
@@ -712,31 +864,158 @@ func resolvePrefixedSubscriptionPath(path string, prefix string) (SubscriptionRe
 	return SubscriptionRenderRequest{}, false
 }
 
-func matchSubscriptionPathAlias(alias string, path string) string {
-	parsed, err := url.Parse(alias)
-	if err != nil {
-		return ""
+// splitSubscriptionPath splits a subscription path tail on '/' into the
+// caller's fixed buffer. It reports false when the tail has more segments than
+// any subscription route uses.
+func splitSubscriptionPath(tail string, segments *[4]string) (int, bool) {
+	for count := 0; count < len(segments); count++ {
+		slash := strings.IndexByte(tail, '/')
+		if slash < 0 {
+			segments[count] = tail
+			return count + 1, true
+		}
+		segments[count] = tail[:slash]
+		tail = tail[slash+1:]
 	}
-	aliasPath := strings.TrimSpace(parsed.Path)
-	if aliasPath == "" {
-		return ""
+	return 0, false
+}
+
+// subscriptionAliasDispatcher matches a request against every configured alias
+// at once: query aliases are grouped by path, plain aliases are prefixes, and
+// templated paths share one alternation regex. When several aliases match, the
+// earliest in settings order wins, as it did when they were tried one by one.
+type subscriptionAliasDispatcher struct {
+	aliases   []string
+	queries   map[string][]subscriptionQueryAlias
+	prefixes  []subscriptionPrefixAlias
+	templated *regexp.Regexp
+	groups    []subscriptionTemplatedGroup
+}
+
+type subscriptionQueryAlias struct {
+	index    int
+	template url.Values
+}
+
+type subscriptionPrefixAlias struct {
+	index  int
+	prefix string
+}
+
+// subscriptionTemplatedGroup locates an alias's first placeholder capture in
+// the combined templated regex.
+type subscriptionTemplatedGroup struct {
+	index int
+	group int
+}
+
+// subscriptionAliasDispatch holds the dispatcher for the most recent alias
+// list; it is rebuilt only when the configured aliases change.
+var subscriptionAliasDispatch atomic.Pointer[subscriptionAliasDispatcher]
+
+func subscriptionAliasDispatcherFor(aliases []string) *subscriptionAliasDispatcher {
+	if cached := subscriptionAliasDispatch.Load(); cached != nil && sameSubscriptionAliases(cached.aliases, aliases) {
+		return cached
+	}
+	dispatcher := newSubscriptionAliasDispatcher(aliases)
+	dispatcher.aliases = append([]string(nil), aliases...)
+	subscriptionAliasDispatch.Store(dispatcher)
+	return dispatcher
+}
+
+func sameSubscriptionAliases(left []string, right []string) bool {
+	if len(left) != len(right) {
+		return false
 	}
-	if strings.Contains(aliasPath, "{") {
+	for index := range left {
+		if left[index] != right[index] {
+			return false
+		}
+	}
+	return true
+}
+
+func newSubscriptionAliasDispatcher(aliases []string) *subscriptionAliasDispatcher {
+	dispatcher := &subscriptionAliasDispatcher{queries: map[string][]subscriptionQueryAlias{}}
+	var alternatives []string
+	for index, alias := range aliases {
+		parsed, err := url.Parse(alias)
+		if err != nil {
+			continue
+		}
+		if parsed.RawQuery != "" {
+			path := strings.TrimRight(parsed.Path, "/")
+			dispatcher.queries[path] = append(dispatcher.queries[path], subscriptionQueryAlias{index: index, template: parsed.Query()})
+		}
+		aliasPath := strings.TrimSpace(parsed.Path)
+		if aliasPath == "" {
+			continue
+		}
+		if !strings.Contains(aliasPath, "{") {
+			if !strings.HasSuffix(aliasPath, "/") {
+				aliasPath += "/"
+			}
+			dispatcher.prefixes = append(dispatcher.prefixes, subscriptionPrefixAlias{index: index, prefix: aliasPath})
+			continue
+		}
 		pattern := regexp.QuoteMeta(aliasPath)
 		for _, placeholder := range []string{"\\{identifier\\}", "\\{token\\}", "\\{key\\}"} {
 			pattern = strings.ReplaceAll(pattern, placeholder, "([^/]+)")
 		}
-		re := regexp.MustCompile("^" + pattern + "/?$")
-		match := re.FindStringSubmatch(path)
-		if len(match) > 1 {
-			return match[1]
+		if !strings.Contains(pattern, "([^/]+)") {
+			continue
+		}
+		name := "a" + strconv.Itoa(index)
+		alternatives = append(alternatives, "(?P<"+name+">"+pattern+")")
+		dispatcher.groups = append(dispatcher.groups, subscriptionTemplatedGroup{index: index})
+	}
+	if len(alternatives) > 0 {
+		dispatcher.templated = regexp.MustCompile("^(?:" + strings.Join(alternatives, "|") + ")/?$")
+		for i := range dispatcher.groups {
+			dispatcher.groups[i].group = dispatcher.templated.SubexpIndex("a"+strconv.Itoa(dispatcher.groups[i].index)) + 1
+		}
+	}
+	return dispatcher
+}
+
+// match returns the identifier carried by path and query, or "" when no alias
+// matches.
+func (d *subscriptionAliasDispatcher) match(path string, query url.Values) string {
+	best, identifier := -1, ""
+	for _, alias := range d.queries[strings.TrimRight(path, "/")] {
+		if value := matchSubscriptionQueryTemplate(alias.template, query); value != "" {
+			best, identifier = alias.index, value
+			break
+		}
+	}
+	for _, alias := range d.prefixes {
+		if best >= 0 && alias.index >= best {
+			break
+		}
+		if value := matchSubscriptionPrefix(alias.prefix, path); value != "" {
+			best, identifier = alias.index, value
+			break
 		}
-		return ""
 	}
-	prefix := aliasPath
-	if !strings.HasSuffix(prefix, "/") {
-		prefix += "/"
+	if d.templated == nil {
+		return identifier
 	}
+	match := d.templated.FindStringSubmatchIndex(path)
+	if match == nil {
+		return identifier
+	}
+	for _, group := range d.groups {
+		if best >= 0 && group.index >= best {
+			break
+		}
+		if start := match[2*group.group]; start >= 0 {
+			return path[start:match[2*group.group+1]]
+		}
+	}
+	return identifier
+}
+
+func matchSubscriptionPrefix(prefix string, path string) string {
 	if !strings.HasPrefix(path, prefix) {
 		return ""
 	}
@@ -744,15 +1023,13 @@ func matchSubscriptionPathAlias(alias string, path string) string {
 	if tail == "" {
 		return ""
 	}
-	return strings.Split(tail, "/")[0]
+	if slash := strings.IndexByte(tail, '/'); slash >= 0 {
+		return tail[:slash]
+	}
+	return tail
 }
 
-func matchSubscriptionQueryAlias(alias string, path string, query url.Values) string {
-	parsed, err := url.Parse(alias)
-	if err != nil || parsed.RawQuery == "" || strings.TrimRight(path, "/") != strings.TrimRight(parsed.Path, "/") {
-		return ""
-	}
-	template := parsed.Query()
+func matchSubscriptionQueryTemplate(template url.Values, query url.Values) string {
 	for key, values := range template {
 		expected := ""
 		if len(values) > 0 {
@@ -772,77 +1049,173 @@ func matchSubscriptionQueryAlias(alias string, path string, query url.Values) st
 	return firstNonEmptyString(query.Get("token"), query.Get("key"), query.Get("identifier"))
 }
 
+// subscriptionUARule maps a user-agent prefix to a client type. Rules are
+// tried in order; leads lists the lowercased first letters a matching user
+// agent can start with, enabled gates the custom JSON clients and minVersion
+// is compared against the pattern's first capture group.
+type subscriptionUARule struct {
+	leads      string
+	pattern    *regexp.Regexp
+	clientType string
+	enabled    func(SubscriptionSettings) bool
+	minVersion []int
+}
+
+var subscriptionUARules = []subscriptionUARule{
+	{leads: "cfm", pattern: regexp.MustCompile(`^([Cc]lash-verge|[Cc]lash[-\.]?[Mm]eta|[Ff][Ll][Cc]lash|[Mm]ihomo)`), clientType: "clash-meta"},
+	{leads: "c", pattern: regexp.MustCompile(`(?i)^clash\s*mi`), clientType: "clash-mi"},
+	{leads: "cs", pattern: regexp.MustCompile(`^([Cc]lash|[Ss]tash)`), clientType: "clash"},
+	{leads: "k", pattern: regexp.MustCompile(`(?i)^karing`), clientType: "karing"},
+	{leads: "h", pattern: regexp.MustCompile(`(?i)^hiddifynextx?`), clientType: "hiddify"},
+	{leads: "s", pattern: regexp.MustCompile(`^(SFA|SFI|SFM|SFT)`), clientType: "sing-box"},
+	{leads: "v", pattern: regexp.MustCompile(`(?i)^v2raytun`), clientType: "v2raytun"},
+	{leads: "s", pattern: regexp.MustCompile(`(?i)^shadowrocket`), clientType: "shadowrocket"},
+	{leads: "n", pattern: regexp.MustCompile(`(?i)^(nekobox|nekoboxforandroid)`), clientType: "nekobox"},
+	{leads: "p", pattern: regexp.MustCompile(`(?i)^passwall`), clientType: "passwall"},
+	{leads: "t", pattern: regexp.MustCompile(`(?i)^thron(e)?`), clientType: "throne"},
+	{leads: "so", pattern: regexp.MustCompile(`^(SS|SSR|SSD|SSS|Outline|Shadowsocks|SSconf)`), clientType: "outline"},
+	{
+		leads:      "v",
+		pattern:    regexp.MustCompile(`^v2rayN/(\d+\.\d+)`),
+		clientType: "v2ray-json",
+		enabled:    func(settings SubscriptionSettings) bool { return settings.UseCustomJSONForV2rayN },
+		minVersion: versionParts("6.40"),
+	},
+	{
+		leads:      "v",
+		pattern:    regexp.MustCompile(`(?i)^v2rayng/(\d+\.\d+)`),
+		clientType: "v2ray-json",
+		enabled:    func(settings SubscriptionSettings) bool { return settings.UseCustomJSONForV2rayNG },
+	},
+	{
+		leads:      "h",
+		pattern:    regexp.MustCompile(`^Happ/(\d+\.\d+\.\d+)`),
+		clientType: "happ",
+		enabled:    func(settings SubscriptionSettings) bool { return settings.UseCustomJSONForHapp },
+		minVersion: versionParts("1.63.1"),
+	},
+	{
+		leads:      "i",
+		pattern:    regexp.MustCompile(`(?i)^incy`),
+		clientType: "incy",
+		enabled:    func(settings SubscriptionSettings) bool { return settings.UseCustomJSONForIncy },
+	},
+	{
+		leads:      "s",
+		pattern:    regexp.MustCompile(`^Streisand`),
+		clientType: "v2ray-json",
+		enabled:    func(settings SubscriptionSettings) bool { return settings.UseCustomJSONForStreisand },
+	},
+}
+
+// subscriptionUARulesByLead holds the rules that can match a user agent
+// starting with a given ASCII letter, in table order.
+var subscriptionUARulesByLead = indexSubscriptionUARules(subscriptionUARules)
+
+func indexSubscriptionUARules(rules []subscriptionUARule) map[byte][]subscriptionUARule {
+	index := map[byte][]subscriptionUARule{}
+	for _, rule := range rules {
+		for i := 0; i < len(rule.leads); i++ {
+			index[rule.leads[i]] = append(index[rule.leads[i]], rule)
+		}
+	}
+	return index
+}
+
 func selectSubscriptionClientType(userAgent string, settings SubscriptionSettings) string {
 	ua := strings.TrimSpace(userAgent)
-	if regexp.MustCompile(`^([Cc]lash-verge|[Cc]lash[-\.]?[Mm]eta|[Ff][Ll][Cc]lash|[Mm]ihomo)`).MatchString(ua) {
-		return "clash-meta"
-	}
-	if regexp.MustCompile(`(?i)^clash\s*mi`).MatchString(ua) || regexp.MustCompile(`(?i)^clashmi`).MatchString(ua) {
-		return "clash-mi"
+	if ua == "" {
+		return "v2ray"
 	}
-	if regexp.MustCompile(`^([Cc]lash|[Ss]tash)`).MatchString(ua) {
-		return "clash"
-	}
-	if regexp.MustCompile(`(?i)^karing`).MatchString(ua) {
-		return "karing"
-	}
-	if regexp.MustCompile(`(?i)^hiddifynextx?`).MatchString(ua) {
-		return "hiddify"
-	}
-	if regexp.MustCompile(`^(SFA|SFI|SFM|SFT)`).MatchString(ua) {
-		return "sing-box"
-	}
-	if regexp.MustCompile(`(?i)^v2raytun`).MatchString(ua) {
-		return "v2raytun"
-	}
-	if regexp.MustCompile(`(?i)^shadowrocket`).MatchString(ua) {
-		return "shadowrocket"
-	}
-	if regexp.MustCompile(`(?i)^(nekobox|nekoboxforandroid)`).MatchString(ua) {
-		return "nekobox"
-	}
-	if regexp.MustCompile(`(?i)^passwall`).MatchString(ua) {
-		return "passwall"
-	}
-	if regexp.MustCompile(`(?i)^thron(e)?`).MatchString(ua) {
-		return "throne"
-	}
-	if regexp.MustCompile(`^(SS|SSR|SSD|SSS|Outline|Shadowsocks|SSconf)`).MatchString(ua) {
-		return "outline"
+	rules := subscriptionUARules
+	// Non-ASCII leads can still case-fold onto a rule (the Kelvin sign folds
+	// to k), so only ASCII leads take the indexed path.
+	if lead := ua[0]; lead < utf8.RuneSelf {
+		if 'A' <= lead && lead <= 'Z' {
+			lead += 'a' - 'A'
+		}
+		rules = subscriptionUARulesByLead[lead]
 	}
-	if (settings.UseCustomJSONDefault || settings.UseCustomJSONForV2rayN) && regexp.MustCompile(`^v2rayN/(\d+\.\d+)`).MatchString(ua) {
-		if versionAtLeast(firstVersion(ua), "6.40") {
-			return "v2ray-json"
+	for _, rule := range rules {
+		if rule.enabled != nil && !settings.UseCustomJSONDefault && !rule.enabled(settings) {
+			continue
+		}
+		match := rule.pattern.FindStringSubmatch(ua)
+		if match == nil {
+			continue
 		}
+		if rule.minVersion != nil && !versionAtLeast(match[1], rule.minVersion) {
+			continue
+		}
+		return rule.clientType
 	}
-	if (settings.UseCustomJSONDefault || settings.UseCustomJSONForV2rayNG) && regexp.MustCompile(`(?i)^v2rayng/(\d+\.\d+)`).MatchString(ua) {
-		return "v2ray-json"
+	return "v2ray"
+}
+
+type subscriptionStaticHeaderFields struct {
+	supportURL     string
+	profileTitle   string
+	updateInterval string
+}
+
+const subscriptionStaticHeaderCacheEntries = 32
+
+// subscriptionStaticHeaders caches the settings-derived header values keyed
+// by their raw settings, so a settings change simply produces a new entry.
+var subscriptionStaticHeaders = struct {
+	mu    sync.RWMutex
+	items map[subscriptionStaticHeaderFields]subscriptionStaticHeaderFields
+}{items: map[subscriptionStaticHeaderFields]subscriptionStaticHeaderFields{}}
+
+func subscriptionStaticHeaderValues(settings SubscriptionSettings) subscriptionStaticHeaderFields {
+	key := subscriptionStaticHeaderFields{
+		supportURL:     settings.SubscriptionSupportURL,
+		profileTitle:   settings.SubscriptionProfileTitle,
+		updateInterval: settings.SubscriptionUpdateInterval,
 	}
-	if (settings.UseCustomJSONDefault || settings.UseCustomJSONForHapp) && regexp.MustCompile(`^Happ/(\d+\.\d+\.\d+)`).MatchString(ua) {
-		if versionAtLeast(firstVersion(ua), "1.63.1") {
-			return "happ"
-		}
+	subscriptionStaticHeaders.mu.RLock()
+	cached, ok := subscriptionStaticHeaders.items[key]
+	subscriptionStaticHeaders.mu.RUnlock()
+	if ok {
+		return cached
 	}
-	if (settings.UseCustomJSONDefault || settings.UseCustomJSONForIncy) && regexp.MustCompile(`(?i)^incy`).MatchString(ua) {
-		return "incy"
+	values := subscriptionStaticHeaderFields{
+		supportURL:     strings.TrimSpace(key.supportURL),
+		profileTitle:   "base64:" + base64.StdEncoding.EncodeToString([]byte(firstNonEmptyString(key.profileTitle, "Subscription"))),
+		updateInterval: firstNonEmptyString(key.updateInterval, "12"),
 	}
-	if (settings.UseCustomJSONDefault || settings.UseCustomJSONForStreisand) && strings.HasPrefix(ua, "Streisand") {
-		return "v2ray-json"
+	subscriptionStaticHeaders.mu.Lock()
+	defer subscriptionStaticHeaders.mu.Unlock()
+	if len(subscriptionStaticHeaders.items) >= subscriptionStaticHeaderCacheEntries {
+		subscriptionStaticHeaders.items = map[subscriptionStaticHeaderFields]subscriptionStaticHeaderFields{}
 	}
-	return "v2ray"
+	subscriptionStaticHeaders.items[key] = values
+	return values
 }
 
 func subscriptionHeaders(user UserDetail, req SubscriptionRenderRequest, settings SubscriptionSettings) map[string]string {
+	static := subscriptionStaticHeaderValues(settings)
 	return map[string]string{
 		"content-disposition":     `attachment; filename="` + user.Username + `"`,
 		"profile-web-page-url":    req.URL,
-		"support-url":             strings.TrimSpace(settings.SubscriptionSupportURL),
-		"profile-title":           "base64:" + base64.StdEncoding.EncodeToString([]byte(firstNonEmptyString(settings.SubscriptionProfileTitle, "Subscription"))),
-		"profile-update-interval": firstNonEmptyString(settings.SubscriptionUpdateInterval, "12"),
-		"subscription-userinfo":   fmt.Sprintf("upload=0; download=%d; total=%d; expire=%d", user.UsedTraffic, int64OrZero(user.DataLimit), int64OrZero(user.Expire)),
+		"support-url":             static.supportURL,
+		"profile-title":           static.profileTitle,
+		"profile-update-interval": static.updateInterval,
+		"subscription-userinfo":   subscriptionUserInfo(user),
 	}
 }
 
+func subscriptionUserInfo(user UserDetail) string {
+	buf := make([]byte, 0, 64)
+	buf = append(buf, "upload=0; download="...)
+	buf = strconv.AppendInt(buf, user.UsedTraffic, 10)
+	buf = append(buf, "; total="...)
+	buf = strconv.AppendInt(buf, int64OrZero(user.DataLimit), 10)
+	buf = append(buf, "; expire="...)
+	buf = strconv.AppendInt(buf, int64OrZero(user.Expire), 10)
+	return string(buf)
+}
+
 func (s Service) renderSubscriptionHTML(ctx context.Context, user UserDetail, req SubscriptionRenderRequest, settings SubscriptionSettings) (string, error) {
 	links, err := s.ConfigLinks(ctx, ConfigLinksRequest{UserID: user.ID})
 	if err != nil {
@@ -926,7 +1299,7 @@ func renderClashLikeYAML(username string, links []string, meta bool) string {
 	return b.String()
 }
 
-func renderSingBoxJSON(links []string) (string, error) {
+func renderSingBoxJSON(links []string) ([]byte, error) {
 	proxies := make([]map[string]any, 0, len(links))
 	tags := make([]string, 0, len(links))
 	for i, link := range links {
@@ -1208,16 +1581,16 @@ func singBoxTLS(query url.Values) map[string]any {
 	return tls
 }
 
-func renderV2RayJSONSubscription(links []string, reverse bool) (string, error) {
+func renderV2RayJSONSubscription(links []string, reverse bool) ([]byte, error) {
 	return renderV2RayJSONSubscriptionWithTemplate(links, reverse, "")
 }
 
-func renderV2RayJSONSubscriptionWithTemplate(links []string, reverse bool, templateContent string) (string, error) {
+func renderV2RayJSONSubscriptionWithTemplate(links []string, reverse bool, templateContent string) ([]byte, error) {
 	configs := make([]map[string]any, 0, len(links))
 	templateConfig := defaultV2RayClientConfig()
 	if strings.TrimSpace(templateContent) != "" {
 		if err := json.Unmarshal([]byte(templateContent), &templateConfig); err != nil {
-			return "", fmt.Errorf("invalid v2ray subscription template: %w", err)
+			return nil, fmt.Errorf("invalid v2ray subscription template: %w", err)
 		}
 	}
 	for _, link := range links {
@@ -1979,7 +2352,7 @@ func renderSubscriptionPageTemplate(content string, user UserDetail, links []str
 	if strings.TrimSpace(content) == "" {
 		content = fallbackSubscriptionPageTemplate
 	}
-	tpl, err := pongo2.FromString(normalizeLegacySubscriptionTemplate(content))
+	tpl, err := subscriptionPageTemplate(content)
 	if err != nil {
 		return "", err
 	}
@@ -1990,6 +2363,35 @@ func renderSubscriptionPageTemplate(content string, user UserDetail, links []str
 	return rendered, nil
 }
 
+const subscriptionPageTemplateCacheEntries = 32
+
+// subscriptionPageTemplates holds compiled page templates keyed by their raw
+// content, so an edited template is simply compiled under a new key.
+var subscriptionPageTemplates = struct {
+	mu    sync.RWMutex
+	items map[string]*pongo2.Template
+}{items: map[string]*pongo2.Template{}}
+
+func subscriptionPageTemplate(content string) (*pongo2.Template, error) {
+	subscriptionPageTemplates.mu.RLock()
+	tpl, ok := subscriptionPageTemplates.items[content]
+	subscriptionPageTemplates.mu.RUnlock()
+	if ok {
+		return tpl, nil
+	}
+	tpl, err := pongo2.FromString(normalizeLegacySubscriptionTemplate(content))
+	if err != nil {
+		return nil, err
+	}
+	subscriptionPageTemplates.mu.Lock()
+	defer subscriptionPageTemplates.mu.Unlock()
+	if len(subscriptionPageTemplates.items) >= subscriptionPageTemplateCacheEntries {
+		subscriptionPageTemplates.items = map[string]*pongo2.Template{}
+	}
+	subscriptionPageTemplates.items[content] = tpl
+	return tpl, nil
+}
+
 func registerSubscriptionTemplateFilters() error {
 	subscriptionTemplateFiltersOnce.Do(func() {
 		for name, filter := range map[string]pongo2.FilterFunction{
@@ -2548,12 +2950,8 @@ func decodeFlexibleBase64(value string) ([]byte, error) {
 	return base64.RawURLEncoding.DecodeString(value)
 }
 
-func marshalPretty(value any) (string, error) {
-	raw, err := json.MarshalIndent(value, "", "  ")
-	if err != nil {
-		return "", err
-	}
-	return string(raw), nil
+func marshalPretty(value any) ([]byte, error) {
+	return json.MarshalIndent(value, "", "  ")
 }
 
 func subscriptionUsageRange(startRaw string, endRaw string) (time.Time, time.Time, error) {
@@ -2612,30 +3010,23 @@ func normalizeSubscriptionKey(value string) (string, bool) {
 	return cleaned, len(cleaned) == 32 && isHexString(cleaned)
 }
 
-func firstVersion(value string) string {
-	re := regexp.MustCompile(`(\d+(?:\.\d+){1,2})`)
-	match := re.FindStringSubmatch(value)
-	if len(match) > 1 {
-		return match[1]
-	}
-	return ""
-}
-
-func versionAtLeast(value string, minimum string) bool {
-	left := versionParts(value)
-	right := versionParts(minimum)
-	for len(left) < len(right) {
-		left = append(left, 0)
-	}
-	for len(right) < len(left) {
-		right = append(right, 0)
-	}
-	for i := range left {
-		if left[i] > right[i] {
-			return true
+// versionAtLeast compares a dotted version against pre-parsed minimum parts
+// field by field, without splitting the string. Missing fields count as 0.
+func versionAtLeast(value string, minimum []int) bool {
+	for i := 0; value != "" || i < len(minimum); i++ {
+		field := value
+		if dot := strings.IndexByte(value, '.'); dot >= 0 {
+			field, value = value[:dot], value[dot+1:]
+		} else {
+			value = ""
 		}
-		if left[i] < right[i] {
-			return false
+		current, _ := strconv.Atoi(field)
+		var want int
+		if i < len(minimum) {
+			want = minimum[i]
+		}
+		if current != want {
+			return current > want
 		}
 	}
 	return true
@@ -359,6 +359,25 @@ func TestSubscriptionInfoIncludesVPNDownloadMaterialAndProtocolEntries(t *testin
 	}
 }
 
+func TestEffectiveSubscriptionSettingsAreCachedUntilInvalidated(t *testing.T) {
+	service, _ := newSubscriptionClientTestService(t)
+	ctx := context.Background()
+	adminID := int64(1)
+	if got := service.effectiveSettings(ctx, &adminID).SubscriptionProfileTitle; got != "Subscription" {
+		t.Fatalf("profile title = %q, want Subscription", got)
+	}
+	if _, err := service.repo.db.Exec(`UPDATE admins SET subscription_settings = '{"subscription_profile_title":"Owner"}' WHERE id = 1`); err != nil {
+		t.Fatal(err)
+	}
+	if got := service.effectiveSettings(ctx, &adminID).SubscriptionProfileTitle; got != "Subscription" {
+		t.Fatalf("cached profile title = %q, want Subscription", got)
+	}
+	service.InvalidateSubscriptionSettings()
+	if got := service.effectiveSettings(ctx, &adminID).SubscriptionProfileTitle; got != "Owner" {
+		t.Fatalf("profile title after invalidation = %q, want Owner", got)
+	}
+}
+
 func newSubscriptionClientTestService(t *testing.T) (Service, string) {
 	t.Helper()
 	db, err := sql.Open("sqlite", "file:"+filepath.Join(t.TempDir(), "subscription-clients.db")+"?_pragma=busy_timeout(30000)")
@@ -6,8 +6,10 @@ import (
 	"net/url"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
 	"testing"
+	"time"
 )
 
 func readTestTemplateFile(t *testing.T, relativePath string) string {
@@ -201,7 +203,7 @@ func TestRenderV2RayJSONSubscriptionBuildsImportableConfig(t *testing.T) {
 	if err != nil {
 		t.Fatal(err)
 	}
-	if strings.Contains(body, "share_link") || strings.Contains(body, "vless://") {
+	if strings.Contains(string(body), "share_link") || strings.Contains(string(body), "vless://") {
 		t.Fatalf("v2ray json must contain real outbounds, not wrapped share links:\n%s", body)
 	}
 	var configs []map[string]any
@@ -565,6 +567,8 @@ func TestSubscriptionClientAliasesAndAppUserAgents(t *testing.T) {
 		"Throne/1.0":         "throne",
 		"ClashMi/1.2":        "clash-mi",
 		"Happ/1.63.1":        "happ",
+		"Happ/1.62.9":        "v2ray",
+		"v2rayN/6.40":        "v2ray",
 		"Incy/2.0":           "incy",
 		"HiddifyNext/2.5.7":  "hiddify",
 		"HiddifyNextX/2.5.7": "hiddify",
@@ -575,6 +579,101 @@ func TestSubscriptionClientAliasesAndAppUserAgents(t *testing.T) {
 	}
 }
 
+func TestJoinSubscriptionLinksMatchesJoinedBase64(t *testing.T) {
+	for _, links := range [][]string{nil, {"vless://a"}, {"vless://a", "trojan://b", "ss://c"}} {
+		joined := strings.Join(links, "\n")
+		if got := string(joinSubscriptionLinks(links, false)); got != joined {
+			t.Fatalf("joinSubscriptionLinks(%q, false) = %q, want %q", links, got, joined)
+		}
+		want := base64.StdEncoding.EncodeToString([]byte(joined))
+		if got := string(joinSubscriptionLinks(links, true)); got != want {
+			t.Fatalf("joinSubscriptionLinks(%q, true) = %q, want %q", links, got, want)
+		}
+	}
+}
+
+func TestCandidateIdentifiersTriesTailsInSeparatorOrder(t *testing.T) {
+	for identifier, expected := range map[string][]string{
+		"":                {},
+		"abc":             {"abc"},
+		"name+key":        {"name+key", "key"},
+		"a|b:c+d":         {"a|b:c+d", "d", "c+d", "b:c+d"},
+		"x y+z":           {"x y+z", "z", "y+z"},
+		"dup+tail:tail":   {"dup+tail:tail", "tail:tail", "tail"},
+		"trailing+":       {"trailing+"},
+		"  spaced | key ": {"spaced | key", "key"},
+	} {
+		got := candidateIdentifiers(identifier)
+		if strings.Join(got, ",") != strings.Join(expected, ",") {
+			t.Fatalf("candidateIdentifiers(%q) = %q, want %q", identifier, got, expected)
+		}
+	}
+}
+
+func TestSubscriptionUserInfoHeader(t *testing.T) {
+	limit := int64(10485760)
+	expire := int64(1767225600)
+	if got := subscriptionUserInfo(UserDetail{UsedTraffic: 1024, DataLimit: &limit, Expire: &expire}); got != "upload=0; download=1024; total=10485760; expire=1767225600" {
+		t.Fatalf("subscriptionUserInfo = %q", got)
+	}
+	if got := subscriptionUserInfo(UserDetail{}); got != "upload=0; download=0; total=0; expire=0" {
+		t.Fatalf("subscriptionUserInfo without limits = %q", got)
+	}
+}
+
+func TestSubscriptionUARuleLeadsMatchFullScan(t *testing.T) {
+	fullScan := func(ua string, settings SubscriptionSettings) string {
+		ua = strings.TrimSpace(ua)
+		for _, rule := range subscriptionUARules {
+			if rule.enabled != nil && !settings.UseCustomJSONDefault && !rule.enabled(settings) {
+				continue
+			}
+			match := rule.pattern.FindStringSubmatch(ua)
+			if match != nil && (rule.minVersion == nil || versionAtLeast(match[1], rule.minVersion)) {
+				return rule.clientType
+			}
+		}
+		return "v2ray"
+	}
+	agents := []string{
+		"clash-verge/1.0", "Clash.Meta", "FlClash/2", "mihomo", "ClashMi/1", "Clash/1", "Stash/2", "karing/1",
+		"HiddifyNextX/2", "SFA/1", "sfa/1", "v2rayTun/4", "Shadowrocket/2", "NekoBox/1", "PassWall/25", "Throne/1",
+		"SSconf", "Outline/1", "v2rayN/6.40", "V2RAYNG/1.8", "Happ/1.63.1", "happ/1.70.0", "Incy/2",
+		"Streisand/1", "Mozilla/5.0", "curl/8", "", "1abc",
+	}
+	for _, settings := range []SubscriptionSettings{{}, {UseCustomJSONDefault: true}} {
+		for _, ua := range agents {
+			for _, variant := range []string{ua, strings.ToUpper(ua), strings.ToLower(ua)} {
+				if got, want := selectSubscriptionClientType(variant, settings), fullScan(variant, settings); got != want {
+					t.Fatalf("selectSubscriptionClientType(%q) = %q, full scan gives %q", variant, got, want)
+				}
+			}
+		}
+	}
+}
+
+func TestSubscriptionAccessStaleDebouncesSameUserAgent(t *testing.T) {
+	now := time.Date(2026, 7, 1, 12, 0, 0, 0, time.UTC)
+	recent := "2026-07-01 11:59:30"
+	old := "2026-07-01 11:58:00"
+	agent := "v2rayNG/1.8"
+	other := "Happ/1.63.1"
+	tests := []struct {
+		user UserDetail
+		want bool
+	}{
+		{UserDetail{}, true},
+		{UserDetail{SubUpdatedAt: &recent, SubLastUserAgent: &agent}, false},
+		{UserDetail{SubUpdatedAt: &old, SubLastUserAgent: &agent}, true},
+		{UserDetail{SubUpdatedAt: &recent, SubLastUserAgent: &other}, true},
+	}
+	for _, test := range tests {
+		if got := subscriptionAccessStale(test.user, " "+agent+" ", now); got != test.want {
+			t.Fatalf("subscriptionAccessStale(%+v) = %v, want %v", test.user, got, test.want)
+		}
+	}
+}
+
 func TestSubscriptionTokenAcceptsLegacyPythonAndRecentGoSignatures(t *testing.T) {
 	body := "YWxpY2UsMTcwMDAwMDAwMA"
 	secret := "subscription-secret"
@@ -594,3 +693,99 @@ func TestSubscriptionTokenAcceptsLegacyPythonAndRecentGoSignatures(t *testing.T)
 		t.Fatalf("new tokens must use legacy python-compatible signatures: %s", generated)
 	}
 }
+
+func TestSubscriptionAliasesMatchPathAndQueryForms(t *testing.T) {
+	cases := []struct {
+		alias string
+		path  string
+		query string
+		want  string
+	}{
+		{alias: "/my/{identifier}", path: "/my/abc", want: "abc"},
+		{alias: "/my/{token}", path: "/my/abc/", want: "abc"},
+		{alias: "/my/{key}", path: "/my/abc/extra", want: ""},
+		{alias: "/plain", path: "/plain/abc/sing-box", want: "abc"},
+		{alias: "/plain/", path: "/plain/", want: ""},
+		{alias: "/get?token={token}", path: "/get", query: "token=abc", want: "abc"},
+		{alias: "/get?mode=x", path: "/get", query: "mode=y&token=abc", want: ""},
+		{alias: "/get?mode=x", path: "/get/", query: "mode=x&key=abc", want: "abc"},
+	}
+	for _, tc := range cases {
+		for round := 0; round < 2; round++ {
+			query, err := url.ParseQuery(tc.query)
+			if err != nil {
+				t.Fatal(err)
+			}
+			got := subscriptionAliasDispatcherFor([]string{tc.alias}).match(tc.path, query)
+			if got != tc.want {
+				t.Fatalf("alias %q on %q?%s = %q, want %q", tc.alias, tc.path, tc.query, got, tc.want)
+			}
+		}
+	}
+}
+
+func TestSubscriptionAliasDispatcherPrefersEarlierAlias(t *testing.T) {
+	aliases := []string{"/x/{identifier}/a", "/x/", "/x/{token}", "/x?k={key}"}
+	dispatcher := newSubscriptionAliasDispatcher(aliases)
+	cases := []struct {
+		path  string
+		query string
+		want  string
+	}{
+		{path: "/x/abc/a", want: "abc"},
+		{path: "/x/abc", want: "abc"},
+		{path: "/x", query: "k=q1", want: "q1"},
+		{path: "/y/abc", want: ""},
+	}
+	for _, tc := range cases {
+		query, _ := url.ParseQuery(tc.query)
+		if got := dispatcher.match(tc.path, query); got != tc.want {
+			t.Fatalf("match(%q?%s) = %q, want %q", tc.path, tc.query, got, tc.want)
+		}
+	}
+
+	templatedFirst := newSubscriptionAliasDispatcher([]string{"/p/t-{token}", "/p/"})
+	if got := templatedFirst.match("/p/t-abc", nil); got != "abc" {
+		t.Fatalf("templated-first match = %q, want abc", got)
+	}
+	prefixFirst := newSubscriptionAliasDispatcher([]string{"/p/", "/p/t-{token}"})
+	if got := prefixFirst.match("/p/t-abc", nil); got != "t-abc" {
+		t.Fatalf("prefix-first match = %q, want t-abc", got)
+	}
+	templatedOrder := newSubscriptionAliasDispatcher([]string{"/r/{token}-x", "/r/a-{token}"})
+	if got := templatedOrder.match("/r/a-b-x", nil); got != "a-b" {
+		t.Fatalf("templated order match = %q, want a-b", got)
+	}
+}
+
+func TestSplitSubscriptionPathMatchesSplit(t *testing.T) {
+	for _, tail := range []string{"a", "a/b", "a//b", "a/b/c", "a/b/c/d", "a/b/c/d/e", "a/b/c/d/"} {
+		var buffer [4]string
+		count, ok := splitSubscriptionPath(tail, &buffer)
+		want := strings.Split(tail, "/")
+		if len(want) > len(buffer) {
+			if ok {
+				t.Fatalf("splitSubscriptionPath(%q) accepted %d segments", tail, len(want))
+			}
+			continue
+		}
+		if !ok || strings.Join(buffer[:count], "|") != strings.Join(want, "|") {
+			t.Fatalf("splitSubscriptionPath(%q) = %q, want %q", tail, buffer[:count], want)
+		}
+	}
+}
+
+func TestSubscriptionStaticHeaderCacheIsBounded(t *testing.T) {
+	for i := 0; i < subscriptionStaticHeaderCacheEntries*2; i++ {
+		values := subscriptionStaticHeaderValues(SubscriptionSettings{SubscriptionProfileTitle: "title-" + strconv.Itoa(i)})
+		if values.updateInterval != "12" {
+			t.Fatalf("unexpected update interval %q", values.updateInterval)
+		}
+	}
+	subscriptionStaticHeaders.mu.RLock()
+	entries := len(subscriptionStaticHeaders.items)
+	subscriptionStaticHeaders.mu.RUnlock()
+	if entries > subscriptionStaticHeaderCacheEntries {
+		t.Fatalf("static header cache grew to %d entries", entries)
+	}
+}
@@ -3,12 +3,13 @@ package user
 import (
 	"context"
 	"database/sql"
+	"encoding/json"
 	"fmt"
 	"strings"
 )
 
 func (r Repository) UserGet(ctx context.Context, req UserGetRequest) (UserDetail, error) {
-	row, err := r.userDetailRow(ctx, strings.TrimSpace(req.Username))
+	row, admin, err := r.userDetailRow(ctx, strings.TrimSpace(req.Username))
 	if err != nil {
 		return UserDetail{}, err
 	}
@@ -61,14 +62,6 @@ func (r Repository) UserGet(ctx context.Context, req UserGetRequest) (UserDetail
 	if err != nil {
 		return UserDetail{}, err
 	}
-	admin := AdminLinkSettings{}
-	if row.AdminID != nil {
-		admins, err := r.adminLinkSettings(ctx, []int64{*row.AdminID})
-		if err != nil {
-			return UserDetail{}, err
-		}
-		admin = admins[*row.AdminID]
-	}
 	subscription, err := BuildSubscriptionLinks(
 		SubscriptionLinkRequest{
 			Username:      row.Username,
@@ -126,7 +119,9 @@ func (r Repository) UserGet(ctx context.Context, req UserGetRequest) (UserDetail
 	return row, nil
 }
 
-func (r Repository) userDetailRow(ctx context.Context, username string) (UserDetail, error) {
+// userDetailRow also returns the owning admin's link settings, read through
+// the same admins join instead of a second lookup.
+func (r Repository) userDetailRow(ctx context.Context, username string) (UserDetail, AdminLinkSettings, error) {
 	baseQuery := `SELECT
 	u.id,
 	u.username,
@@ -153,7 +148,9 @@ func (r Repository) userDetailRow(ctx context.Context, username string) (UserDet
 	u.service_id,
 	s.name,
 	u.admin_id,
-	a.username
+	a.username,
+	a.subscription_domain,
+	a.subscription_settings
 FROM users u
 LEFT JOIN admins a ON u.admin_id = a.id
 LEFT JOIN services s ON u.service_id = s.id
@@ -163,7 +160,7 @@ LIMIT 1`
 	var createdAt, subUpdatedAt, onlineAt, onHoldTimeout any
 	var credentialKey, resetStrategy, flow, note, telegramID, contactNumber, userAgent, subadress sql.NullString
 	var expire, dataLimit, holdDuration, autoDelete, serviceID, adminID sql.NullInt64
-	var serviceName, adminUsername sql.NullString
+	var serviceName, adminUsername, adminDomain, adminSettings sql.NullString
 	scan := func(where string) error {
 		query := fmt.Sprintf(baseQuery, where)
 		return r.db.QueryRowContext(ctx, query, username, "deleted").Scan(
@@ -193,6 +190,8 @@ LIMIT 1`
 			&serviceName,
 			&adminID,
 			&adminUsername,
+			&adminDomain,
+			&adminSettings,
 		)
 	}
 	err := scan("u.username = ?")
@@ -201,9 +200,9 @@ LIMIT 1`
 	}
 	if err != nil {
 		if err == sql.ErrNoRows {
-			return UserDetail{}, fmt.Errorf("User not found")
+			return UserDetail{}, AdminLinkSettings{}, fmt.Errorf("User not found")
 		}
-		return UserDetail{}, err
+		return UserDetail{}, AdminLinkSettings{}, err
 	}
 	row.CredentialKey = nullStringValue(credentialKey)
 	row.CreatedAt = dbTimeString(createdAt)
@@ -231,7 +230,18 @@ LIMIT 1`
 	row.ServiceName = stringPtr(serviceName)
 	row.AdminID = int64Ptr(adminID)
 	row.AdminUsername = stringPtr(adminUsername)
-	return row, nil
+	admin := AdminLinkSettings{}
+	if adminID.Valid && adminUsername.Valid {
+		admin.AdminID = adminID.Int64
+		if adminDomain.Valid && adminDomain.String != "" {
+			value := adminDomain.String
+			admin.SubscriptionDomain = &value
+		}
+		if adminSettings.Valid && adminSettings.String != "" {
+			admin.SubscriptionSettings = json.RawMessage(adminSettings.String)
+		}
+	}
+	return row, admin, nil
 }
 
 func canAccessUser(admin AdminContext, userAdminUsername *string) bool {
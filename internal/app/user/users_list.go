@@ -103,6 +103,10 @@ func (r Repository) UsersList(ctx context.Context, req UsersListRequest) (UsersR
 	}
 
 	items := make([]UserListItem, 0, len(rows))
+	var configUsers []ConfigLinkUser
+	if req.IncludeLinks {
+		configUsers = make([]ConfigLinkUser, 0, len(rows))
+	}
 	for _, row := range rows {
 		item := row.item
 		item.Links = []string{}
@@ -148,16 +152,24 @@ func (r Repository) UsersList(ctx context.Context, req UsersListRequest) (UsersR
 				configUser.ServiceHostOrders = serviceOrders[*item.ServiceID]
 			}
 			configUser.Hosts = hosts
-			if err := r.populateWGAddresses(ctx, &configUser, inbounds); err != nil {
+			configUsers = append(configUsers, configUser)
+		}
+		items = append(items, item)
+	}
+	if req.IncludeLinks {
+		if err := r.prefetchWGAddresses(ctx, configUsers, inbounds); err != nil {
+			return UsersResponse{}, err
+		}
+		for i := range configUsers {
+			if err := r.populateWGAddresses(ctx, &configUsers[i], inbounds); err != nil {
 				return UsersResponse{}, err
 			}
-			links, err := BuildConfigLinks(configUser, inbounds, inboundOrder, hosts, masks, false)
+			links, err := BuildConfigLinks(configUsers[i], inbounds, inboundOrder, hosts, masks, false)
 			if err != nil {
 				return UsersResponse{}, err
 			}
-			item.Links = links.Links
+			items[i].Links = links.Links
 		}
-		items = append(items, item)
 	}
 
 	activeTotal, err := r.usersActiveTotal(ctx, req)
@@ -183,6 +183,50 @@ func isWGAddressConflict(err error) bool {
 		strings.Contains(message, "constraint failed")
 }
 
+// prefetchWGAddresses resolves WireGuard peer addresses for a batch of users
+// with a single allocation per inbound instead of one per user.
+func (r Repository) prefetchWGAddresses(ctx context.Context, items []ConfigLinkUser, inbounds map[string]ResolvedInbound) error {
+	userIDsByTag := map[string][]int64{}
+	for _, item := range items {
+		if item.ServiceID == nil || *item.ServiceID <= 0 {
+			continue
+		}
+		for _, selected := range selectConfigHosts(item.Hosts, item.ServiceID) {
+			tag := selected.host.InboundTag
+			inbound, ok := inbounds[tag]
+			if !ok || normalizeProxyProtocol(stringValue(inbound["protocol"])) != "wireguard" {
+				continue
+			}
+			userIDsByTag[tag] = append(userIDsByTag[tag], item.ID)
+		}
+	}
+	if len(userIDsByTag) == 0 {
+		return nil
+	}
+	addressesByTag := make(map[string]map[int64]string, len(userIDsByTag))
+	for tag, userIDs := range userIDsByTag {
+		settings := normalizeWGProfileSettings(mapValue(inbounds[tag]["settings"]))
+		addresses, err := r.WGIPv4Addresses(ctx, tag, userIDs, stringValue(settings["address_pool"]), stringValue(settings["server_address"]))
+		if err != nil {
+			return err
+		}
+		addressesByTag[tag] = addresses
+	}
+	for i := range items {
+		for tag, addresses := range addressesByTag {
+			address, ok := addresses[items[i].ID]
+			if !ok {
+				continue
+			}
+			if items[i].WireGuardAddresses == nil {
+				items[i].WireGuardAddresses = map[string]string{}
+			}
+			items[i].WireGuardAddresses[tag] = address
+		}
+	}
+	return nil
+}
+
 func (r Repository) populateWGAddresses(ctx context.Context, item *ConfigLinkUser, inbounds map[string]ResolvedInbound) error {
 	if item == nil || item.ServiceID == nil || *item.ServiceID <= 0 {
 		return nil
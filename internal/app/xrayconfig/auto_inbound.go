@@ -7,13 +7,17 @@ import (
 	"errors"
 	"fmt"
 	"math/big"
+	"sort"
 	"strconv"
 	"strings"
+	"sync"
 )
 
 const (
 	autoInboundMinPort = 10000
 	autoInboundMaxPort = 60000
+
+	serviceAutoInboundTagPrefix = "setservice-"
 )
 
 var (
@@ -42,7 +46,8 @@ func (r Repository) CreateServiceAutoInbound(ctx context.Context, serviceID int6
 	if err != nil {
 		return AutoInboundResult{}, err
 	}
-	if configHasInbound(config, tag) {
+	inbounds := configInboundList(config)
+	if inboundIndex(inbounds, tag) >= 0 {
 		return AutoInboundResult{}, ErrAutoInboundAlreadyExists
 	}
 
@@ -50,8 +55,7 @@ func (r Repository) CreateServiceAutoInbound(ctx context.Context, serviceID int6
 	if err != nil {
 		return AutoInboundResult{}, err
 	}
-	inbounds := listOfMaps(config["inbounds"])
-	inbounds = append(inbounds, map[string]any{
+	config["inbounds"] = append(inbounds, map[string]any{
 		"tag":      tag,
 		"listen":   "::",
 		"port":     port,
@@ -61,7 +65,6 @@ func (r Repository) CreateServiceAutoInbound(ctx context.Context, serviceID int6
 			"network": "tcp,udp",
 		},
 	})
-	config["inbounds"] = mapsToAnyList(inbounds)
 
 	if err := r.saveMasterRawConfigTx(ctx, tx, config); err != nil {
 		return AutoInboundResult{}, err
@@ -91,7 +94,9 @@ func (r Repository) DeleteServiceAutoInbound(ctx context.Context, serviceID int6
 	if err != nil {
 		return AutoInboundResult{}, err
 	}
-	if !configHasInbound(config, tag) {
+	inbounds := configInboundList(config)
+	index := inboundIndex(inbounds, tag)
+	if index < 0 {
 		return AutoInboundResult{}, ErrAutoInboundNotFound
 	}
 
@@ -103,7 +108,7 @@ func (r Repository) DeleteServiceAutoInbound(ctx context.Context, serviceID int6
 		return AutoInboundResult{}, ErrInboundHasHosts
 	}
 
-	removeInboundFromConfig(config, tag)
+	config["inbounds"] = append(inbounds[:index:index], inbounds[index+1:]...)
 	if err := r.saveMasterRawConfigTx(ctx, tx, config); err != nil {
 		return AutoInboundResult{}, err
 	}
@@ -119,39 +124,189 @@ func (r Repository) DeleteServiceAutoInbound(ctx context.Context, serviceID int6
 	return AutoInboundResult{Detail: "Auto inbound removed"}, nil
 }
 
+// configInboundList returns the raw inbounds list of a decoded config, so the
+// auto inbound endpoints can find, append and remove entries in place.
+func configInboundList(config map[string]any) []any {
+	if inbounds, ok := config["inbounds"].([]any); ok {
+		return inbounds
+	}
+	return mapsToAnyList(listOfMaps(config["inbounds"]))
+}
+
+func inboundIndex(inbounds []any, tag string) int {
+	for idx, item := range inbounds {
+		if stringValue(mapValue(item)["tag"]) == tag {
+			return idx
+		}
+	}
+	return -1
+}
+
 func serviceAutoInboundTag(serviceID int64) string {
-	return "setservice-" + strconv.FormatInt(serviceID, 10)
+	return serviceAutoInboundTagPrefix + strconv.FormatInt(serviceID, 10)
+}
+
+// IsServiceAutoInboundTag reports whether tag has the setservice-<id> form
+// used for service auto inbounds. It is a plain prefix and digit check so
+// callers can test many tags without running a regexp for each.
+func IsServiceAutoInboundTag(tag string) bool {
+	digits, ok := strings.CutPrefix(tag, serviceAutoInboundTagPrefix)
+	if !ok || digits == "" {
+		return false
+	}
+	for i := 0; i < len(digits); i++ {
+		if digits[i] < '0' || digits[i] > '9' {
+			return false
+		}
+	}
+	return true
 }
 
 func pickAvailableAutoInboundPort(config map[string]any) (int, error) {
 	used, ranges := extractUsedPorts(config)
-	for i := 0; i < 200; i++ {
-		candidate, err := randomPort(autoInboundMinPort, autoInboundMaxPort)
-		if err != nil {
-			break
-		}
-		if !isPortUsed(candidate, used, ranges) {
-			return candidate, nil
+	return permutedPortSearch(autoInboundMinPort, autoInboundMaxPort, func(port int) bool {
+		return !isPortUsed(port, used, ranges)
+	})
+}
+
+// permutedPortSearch visits every port in [minPort, maxPort] exactly once in a
+// random order and returns the first one accepted by free. The order is a walk
+// x -> x*g mod p over the multiplicative group of the smallest prime p above
+// the range size, with g a random generator, so no port is probed twice and
+// the search only fails when the whole range is taken.
+func permutedPortSearch(minPort int, maxPort int, free func(int) bool) (int, error) {
+	if maxPort < minPort {
+		return 0, fmt.Errorf("invalid port range")
+	}
+	size := int64(maxPort - minPort + 1)
+	prime, generator := portPermutationGroup(size)
+	order := prime - 1
+	if exponent, err := randomBelow(order); err == nil && order > 1 {
+		// Powers of a primitive root with exponents coprime to p-1 are
+		// exactly the other generators of the group.
+		for exponent == 0 || gcd(exponent, order) != 1 {
+			exponent = (exponent + 1) % order
 		}
+		generator = modPow(generator, exponent, prime)
 	}
-	for candidate := autoInboundMinPort; candidate <= autoInboundMaxPort; candidate++ {
-		if !isPortUsed(candidate, used, ranges) {
-			return candidate, nil
+	current := int64(1)
+	if start, err := randomBelow(order); err == nil {
+		current = start + 1
+	}
+	for i := int64(0); i < order; i++ {
+		if current <= size {
+			if port := minPort + int(current-1); free(port) {
+				return port, nil
+			}
 		}
+		current = current * generator % prime
 	}
 	return 0, ErrNoAvailablePort
 }
 
-func randomPort(minPort int, maxPort int) (int, error) {
-	if maxPort < minPort {
-		return 0, fmt.Errorf("invalid port range")
+type permutationGroup struct {
+	prime int64
+	root  int64
+}
+
+// portPermutationGroups memoises the prime modulus and primitive root for each
+// range size; the auto inbound range is fixed, so every allocation after the
+// first skips the prime search and factorisation.
+var portPermutationGroups sync.Map
+
+func portPermutationGroup(size int64) (int64, int64) {
+	if cached, ok := portPermutationGroups.Load(size); ok {
+		group := cached.(permutationGroup)
+		return group.prime, group.root
 	}
-	span := int64(maxPort - minPort + 1)
-	value, err := rand.Int(rand.Reader, big.NewInt(span))
+	prime := nextPrime(size + 1)
+	group := permutationGroup{prime: prime, root: primitiveRoot(prime)}
+	portPermutationGroups.Store(size, group)
+	return group.prime, group.root
+}
+
+func randomBelow(limit int64) (int64, error) {
+	value, err := rand.Int(rand.Reader, big.NewInt(limit))
 	if err != nil {
 		return 0, err
 	}
-	return minPort + int(value.Int64()), nil
+	return value.Int64(), nil
+}
+
+func nextPrime(value int64) int64 {
+	if value <= 2 {
+		return 2
+	}
+	for candidate := value | 1; ; candidate += 2 {
+		if isPrime(candidate) {
+			return candidate
+		}
+	}
+}
+
+func isPrime(value int64) bool {
+	if value < 2 {
+		return false
+	}
+	for divisor := int64(2); divisor*divisor <= value; divisor++ {
+		if value%divisor == 0 {
+			return false
+		}
+	}
+	return true
+}
+
+func primitiveRoot(prime int64) int64 {
+	if prime == 2 {
+		return 1
+	}
+	order := prime - 1
+	factors := make([]int64, 0)
+	remaining := order
+	for divisor := int64(2); divisor*divisor <= remaining; divisor++ {
+		if remaining%divisor == 0 {
+			factors = append(factors, divisor)
+			for remaining%divisor == 0 {
+				remaining /= divisor
+			}
+		}
+	}
+	if remaining > 1 {
+		factors = append(factors, remaining)
+	}
+	for candidate := int64(2); candidate < prime; candidate++ {
+		root := true
+		for _, factor := range factors {
+			if modPow(candidate, order/factor, prime) == 1 {
+				root = false
+				break
+			}
+		}
+		if root {
+			return candidate
+		}
+	}
+	return 1
+}
+
+func modPow(base int64, exponent int64, modulus int64) int64 {
+	result := int64(1)
+	base %= modulus
+	for exponent > 0 {
+		if exponent&1 == 1 {
+			result = result * base % modulus
+		}
+		base = base * base % modulus
+		exponent >>= 1
+	}
+	return result
+}
+
+func gcd(a int64, b int64) int64 {
+	for b != 0 {
+		a, b = b, a%b
+	}
+	return a
 }
 
 type portRange struct {
@@ -165,7 +320,28 @@ func extractUsedPorts(config map[string]any) (map[int]bool, []portRange) {
 	for _, inbound := range listOfMaps(config["inbounds"]) {
 		collectPorts(inbound["port"], used, &ranges)
 	}
-	return used, ranges
+	return used, mergePortRanges(ranges)
+}
+
+// mergePortRanges sorts ranges by start and folds overlapping or adjacent
+// ranges together, so isPortUsed can binary search them.
+func mergePortRanges(ranges []portRange) []portRange {
+	if len(ranges) < 2 {
+		return ranges
+	}
+	sort.Slice(ranges, func(i, j int) bool { return ranges[i].start < ranges[j].start })
+	merged := ranges[:1]
+	for _, item := range ranges[1:] {
+		last := &merged[len(merged)-1]
+		if item.start <= last.end+1 {
+			if item.end > last.end {
+				last.end = item.end
+			}
+			continue
+		}
+		merged = append(merged, item)
+	}
+	return merged
 }
 
 func collectPorts(value any, used map[int]bool, ranges *[]portRange) {
@@ -231,10 +407,6 @@ func isPortUsed(port int, used map[int]bool, ranges []portRange) bool {
 	if used[port] {
 		return true
 	}
-	for _, item := range ranges {
-		if item.start <= port && port <= item.end {
-			return true
-		}
-	}
-	return false
+	idx := sort.Search(len(ranges), func(i int) bool { return ranges[i].start > port }) - 1
+	return idx >= 0 && ranges[idx].end >= port
 }
@@ -0,0 +1,74 @@
+package xrayconfig
+
+import "testing"
+
+func TestIsPortUsedMatchesMergedRanges(t *testing.T) {
+	used, ranges := extractUsedPorts(map[string]any{
+		"inbounds": []any{
+			map[string]any{"port": "20000-20010,443"},
+			map[string]any{"port": "20005-20020"},
+			map[string]any{"port": "20021-20030"},
+			map[string]any{"port": "10500-10400"},
+			map[string]any{"port": float64(8443)},
+		},
+	})
+	if len(ranges) != 2 {
+		t.Fatalf("expected overlapping and adjacent ranges to merge, got %#v", ranges)
+	}
+	for _, port := range []int{443, 8443, 10400, 10500, 20000, 20015, 20030} {
+		if !isPortUsed(port, used, ranges) {
+			t.Fatalf("port %d should be used", port)
+		}
+	}
+	for _, port := range []int{80, 10399, 10501, 19999, 20031} {
+		if isPortUsed(port, used, ranges) {
+			t.Fatalf("port %d should be free", port)
+		}
+	}
+}
+
+func TestPermutedPortSearchVisitsEveryPortOnce(t *testing.T) {
+	for _, bounds := range [][2]int{{10, 10}, {10, 11}, {10, 40}, {1000, 1096}} {
+		seen := map[int]int{}
+		_, err := permutedPortSearch(bounds[0], bounds[1], func(port int) bool {
+			seen[port]++
+			return false
+		})
+		if err != ErrNoAvailablePort {
+			t.Fatalf("range %v: expected ErrNoAvailablePort, got %v", bounds, err)
+		}
+		if len(seen) != bounds[1]-bounds[0]+1 {
+			t.Fatalf("range %v: visited %d distinct ports", bounds, len(seen))
+		}
+		for port, count := range seen {
+			if port < bounds[0] || port > bounds[1] || count != 1 {
+				t.Fatalf("range %v: port %d visited %d times", bounds, port, count)
+			}
+		}
+	}
+}
+
+func TestPickAvailableAutoInboundPortFindsLastFreePort(t *testing.T) {
+	config := map[string]any{
+		"inbounds": []any{
+			map[string]any{"port": "10000-30000,30002-60000"},
+		},
+	}
+	port, err := pickAvailableAutoInboundPort(config)
+	if err != nil || port != 30001 {
+		t.Fatalf("expected the single free port, got %d err=%v", port, err)
+	}
+}
+
+func TestIsServiceAutoInboundTag(t *testing.T) {
+	for _, tag := range []string{"setservice-1", "setservice-42", serviceAutoInboundTag(9001)} {
+		if !IsServiceAutoInboundTag(tag) {
+			t.Fatalf("%q should be a service auto inbound tag", tag)
+		}
+	}
+	for _, tag := range []string{"", "setservice-", "setservice-1a", "SetService-1", "xsetservice-1", "setservice--1", "vless-setservice-1"} {
+		if IsServiceAutoInboundTag(tag) {
+			t.Fatalf("%q should not be a service auto inbound tag", tag)
+		}
+	}
+}
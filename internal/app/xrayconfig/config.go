@@ -97,7 +97,13 @@ func Parse(input any, opts Options) (*Config, error) {
 }
 
 func NormalizePayload(payload map[string]any) map[string]any {
-	cfg := deepCopyMap(payload)
+	return normalizeDecodedPayload(deepCopyMap(payload))
+}
+
+// normalizeDecodedPayload normalizes cfg in place. It is for maps that were
+// just decoded from JSON and are not shared, where NormalizePayload's
+// defensive deep copy would only duplicate the whole config for nothing.
+func normalizeDecodedPayload(cfg map[string]any) map[string]any {
 	removeLegacyReverse(cfg)
 	for _, inbound := range listOfMaps(cfg["inbounds"]) {
 		normalizeRemovedTLSFields(mapValue(inbound["streamSettings"]), true)
@@ -162,15 +168,11 @@ func (c *Config) GetInbound(tag string) (map[string]any, bool) {
 }
 
 func IsManageableInbound(inbound map[string]any) bool {
-	tag := stringValue(inbound["tag"])
 	protocol := normalizeProxyProtocol(stringValue(inbound["protocol"]))
-	if tag == "" || protocol == "" {
-		return false
-	}
 	if !isManageableInboundProtocol(protocol) {
 		return false
 	}
-	return true
+	return stringValue(inbound["tag"]) != ""
 }
 
 func (c *Config) validate() error {
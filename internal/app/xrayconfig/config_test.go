@@ -738,3 +738,25 @@ func hasAPIInbound(payload map[string]any) bool {
 	}
 	return false
 }
+
+func TestSanitizeInboundLeavesSourceClientsIntact(t *testing.T) {
+	clients := []any{map[string]any{"id": "a"}}
+	inbound := map[string]any{
+		"tag":      "vless-tcp",
+		"protocol": "vless",
+		"settings": map[string]any{"decryption": "none", "clients": clients},
+	}
+	sanitized := sanitizeInbound(inbound, []string{MasterTargetID}, nil)
+	if got := mapValue(sanitized["settings"])["clients"].([]any); len(got) != 0 {
+		t.Fatalf("sanitized clients = %#v, want empty", got)
+	}
+	if got := mapValue(sanitized["settings"])["decryption"]; got != "none" {
+		t.Fatalf("sanitized decryption = %#v", got)
+	}
+	if got := mapValue(inbound["settings"])["clients"].([]any); len(got) != 1 {
+		t.Fatalf("source clients = %#v, want untouched", got)
+	}
+	if _, ok := inbound["targets"]; ok {
+		t.Fatal("sanitizeInbound added targets to the source inbound")
+	}
+}
@@ -12,10 +12,7 @@ import (
 	"strings"
 )
 
-var (
-	shortIDSplitPattern  = regexp.MustCompile(`[,\s]+`)
-	autoServiceTagRegexp = regexp.MustCompile(`^setservice-\d+$`)
-)
+var shortIDSplitPattern = regexp.MustCompile(`[,\s]+`)
 
 type InboundMutationResult struct {
 	Inbound map[string]any `json:"inbound,omitempty"`
@@ -74,19 +71,61 @@ func (r Repository) FullInbounds(ctx context.Context) ([]map[string]any, error)
 	return inbounds, nil
 }
 
+// GetInbound returns the first manageable inbound with tag across the stored
+// configs, resolving targets for that inbound only.
 func (r Repository) GetInbound(ctx context.Context, tag string) (map[string]any, error) {
-	inbounds, err := r.manageableInboundsWithTargets(ctx)
+	if tag == "" {
+		return nil, ErrInboundNotFound
+	}
+	stored, err := r.IterStoredConfigs(ctx)
 	if err != nil {
 		return nil, err
 	}
-	for _, inbound := range inbounds {
-		if stringValue(inbound["tag"]) == tag {
-			return inbound, nil
+	for _, item := range stored {
+		for _, inbound := range listOfMaps(item.Config["inbounds"]) {
+			if stringValue(inbound["tag"]) != tag || !r.isManageableInbound(inbound) {
+				continue
+			}
+			direct, err := r.directTargetsForInbound(ctx, tag)
+			if err != nil {
+				return nil, err
+			}
+			effective, err := r.effectiveTargetsForInbound(ctx, tag, direct)
+			if err != nil {
+				return nil, err
+			}
+			return sanitizeInbound(inbound, direct, effective), nil
 		}
 	}
 	return nil, ErrInboundNotFound
 }
 
+// InboundProtocols returns the protocol of the first manageable inbound for
+// each of tags, reading the stored configs once for all of them.
+func (r Repository) InboundProtocols(ctx context.Context, tags []string) (map[string]any, error) {
+	wanted := make(map[string]bool, len(tags))
+	for _, tag := range tags {
+		wanted[tag] = true
+	}
+	protocols := make(map[string]any, len(tags))
+	stored, err := r.IterStoredConfigs(ctx)
+	if err != nil {
+		return nil, err
+	}
+	for _, item := range stored {
+		for _, inbound := range listOfMaps(item.Config["inbounds"]) {
+			tag := stringValue(inbound["tag"])
+			if !wanted[tag] || !r.isManageableInbound(inbound) {
+				continue
+			}
+			if _, found := protocols[tag]; !found {
+				protocols[tag] = inbound["protocol"]
+			}
+		}
+	}
+	return protocols, nil
+}
+
 func (r Repository) CreateInbound(ctx context.Context, payload map[string]any) (InboundMutationResult, error) {
 	targetIDs, cleanPayload, err := r.extractTargetIDs(payload, nil)
 	if err != nil {
@@ -673,37 +712,46 @@ func mapsToAnyList(values []map[string]any) []any {
 }
 
 func sanitizeInbound(inbound map[string]any, directTargets []string, effectiveTargets []string) map[string]any {
-	sanitized := deepCopyMap(inbound)
-	settings := mapValue(sanitized["settings"])
-	if len(settings) == 0 {
-		settings = make(map[string]any)
-	}
+	sanitized, settings := cloneInboundSettings(inbound)
 	if !isVirtualTunnelProtocol(normalizeProxyProtocol(stringValue(sanitized["protocol"]))) {
 		settings["clients"] = []any{}
 	}
-	sanitized["settings"] = settings
 	sanitized["targets"] = targetObjects(directTargets)
 	sanitized["effective_targets"] = targetObjects(effectiveTargets)
 	return sanitized
 }
 
 func reverseClientsForInbound(config map[string]any, tag string) ([]any, bool) {
-	for _, inbound := range listOfMaps(config["inbounds"]) {
-		if stringValue(inbound["tag"]) == tag {
-			return ReverseClients(mapValue(inbound["settings"])["clients"]), true
-		}
+	inbound := findInboundInConfig(config, tag)
+	if inbound == nil {
+		return nil, false
 	}
-	return nil, false
+	return ReverseClients(mapValue(inbound["settings"])["clients"]), true
 }
 
 func withReverseClients(inbound map[string]any, clients []any) map[string]any {
-	next := deepCopyMap(inbound)
-	settings := mapValue(next["settings"])
+	next, settings := cloneInboundSettings(inbound)
 	settings["clients"] = clients
-	next["settings"] = settings
 	return next
 }
 
+// cloneInboundSettings copies the inbound's top level and its settings object
+// so callers can replace settings entries without touching the source. Deeper
+// values stay shared; callers that store the result copy it fully on upsert.
+func cloneInboundSettings(inbound map[string]any) (map[string]any, map[string]any) {
+	next := make(map[string]any, len(inbound)+2)
+	for key, value := range inbound {
+		next[key] = value
+	}
+	source := mapValue(inbound["settings"])
+	settings := make(map[string]any, len(source)+1)
+	for key, value := range source {
+		settings[key] = value
+	}
+	next["settings"] = settings
+	return next, settings
+}
+
 func targetObjects(targetIDs []string) []any {
 	out := make([]any, 0, len(targetIDs))
 	for _, targetID := range targetIDs {
@@ -760,7 +808,7 @@ func (r Repository) directTargetsForInboundTx(ctx context.Context, tx *sql.Tx, t
 		if err := rows.Scan(&id, &raw); err != nil {
 			return nil, err
 		}
-		cfg := NormalizePayload(jsonMap(raw))
+		cfg := normalizeDecodedPayload(jsonMap(raw))
 		if configHasInbound(cfg, tag) {
 			out = append(out, fmt.Sprintf("%s%d", NodePrefix, id))
 		}
@@ -803,12 +851,7 @@ func (r Repository) effectiveTargetsForInboundTx(ctx context.Context, tx *sql.Tx
 }
 
 func configHasInbound(config map[string]any, tag string) bool {
-	for _, inbound := range listOfMaps(config["inbounds"]) {
-		if stringValue(inbound["tag"]) == tag {
-			return true
-		}
-	}
-	return false
+	return findInboundInConfig(config, tag) != nil
 }
 
 func (r Repository) findManageableInboundTx(ctx context.Context, tx *sql.Tx, tag string) (map[string]any, error) {
@@ -829,7 +872,7 @@ func (r Repository) findManageableInboundTx(ctx context.Context, tx *sql.Tx, tag
 		if err := rows.Scan(&raw); err != nil {
 			return nil, err
 		}
-		cfg := NormalizePayload(jsonMap(raw))
+		cfg := normalizeDecodedPayload(jsonMap(raw))
 		if inbound := findInboundInConfig(cfg, tag); inbound != nil && r.isManageableInbound(inbound) {
 			return inbound, nil
 		}
@@ -876,7 +919,7 @@ func (r Repository) findSingleIPSecInboundTagTx(ctx context.Context, tx *sql.Tx,
 		if err := rows.Scan(&raw); err != nil {
 			return "", err
 		}
-		if tag := r.findProtocolInboundTagInConfig(NormalizePayload(jsonMap(raw)), allowedTag, protocol); tag != "" {
+		if tag := r.findProtocolInboundTagInConfig(normalizeDecodedPayload(jsonMap(raw)), allowedTag, protocol); tag != "" {
 			return tag, nil
 		}
 	}
@@ -913,7 +956,7 @@ func (r Repository) findL2TPInboundTagTx(ctx context.Context, tx *sql.Tx, allowe
 		if err := rows.Scan(&raw); err != nil {
 			return "", err
 		}
-		if tag := r.findL2TPInboundTagInConfig(NormalizePayload(jsonMap(raw)), allowedTag); tag != "" {
+		if tag := r.findL2TPInboundTagInConfig(normalizeDecodedPayload(jsonMap(raw)), allowedTag); tag != "" {
 			return tag, nil
 		}
 	}
@@ -936,7 +979,18 @@ func (r Repository) findL2TPInboundTagInConfig(config map[string]any, allowedTag
 	return ""
 }
 
+// findInboundInConfig walks a decoded inbound list in place rather than
+// through listOfMaps, so a lookup stops at the match without first copying
+// every inbound of a large config.
 func findInboundInConfig(config map[string]any, tag string) map[string]any {
+	if inbounds, ok := config["inbounds"].([]any); ok {
+		for _, item := range inbounds {
+			if inbound := mapValue(item); len(inbound) > 0 && stringValue(inbound["tag"]) == tag {
+				return inbound
+			}
+		}
+		return nil
+	}
 	for _, inbound := range listOfMaps(config["inbounds"]) {
 		if stringValue(inbound["tag"]) == tag {
 			return inbound
@@ -951,13 +1005,23 @@ func (r Repository) ensureTargetConfigsForMutationTx(ctx context.Context, tx *sq
 	if err != nil {
 		return nil, err
 	}
+	// master is freshly decoded and normalized, so the first target that
+	// follows it takes it as is; only further targets need their own copy.
+	masterTaken := false
+	masterConfig := func() map[string]any {
+		if !masterTaken {
+			masterTaken = true
+			return master
+		}
+		return deepCopyMap(master)
+	}
 	for _, targetID := range targetIDs {
 		kind, nodeID, err := ParseTargetID(targetID)
 		if err != nil {
 			return nil, err
 		}
 		if kind == "master" {
-			configs[MasterTargetID] = NormalizePayload(master)
+			configs[MasterTargetID] = masterConfig()
 			continue
 		}
 		if nodeID == nil {
@@ -971,9 +1035,10 @@ func (r Repository) ensureTargetConfigsForMutationTx(ctx context.Context, tx *sq
 			return nil, err
 		}
 		if mode != ConfigModeCustom || raw == nil {
-			raw = master
+			configs[NodeTargetID(*nodeID)] = masterConfig()
+			continue
 		}
-		configs[NodeTargetID(*nodeID)] = NormalizePayload(raw)
+		configs[NodeTargetID(*nodeID)] = normalizeDecodedPayload(raw)
 	}
 	return configs, nil
 }
@@ -1035,7 +1100,7 @@ func (r Repository) ensureInboundRecordTx(ctx context.Context, tx *sql.Tx, tag s
 }
 
 func (r Repository) ensureDefaultHostForInboundTx(ctx context.Context, tx *sql.Tx, tag string) error {
-	if autoServiceTagRegexp.MatchString(tag) {
+	if IsServiceAutoInboundTag(tag) {
 		return nil
 	}
 	var hostID int64
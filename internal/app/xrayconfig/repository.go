@@ -179,7 +179,7 @@ func (r Repository) MasterRawConfig(ctx context.Context) (map[string]any, error)
 	if err != nil {
 		return nil, err
 	}
-	return NormalizePayload(jsonMap(raw)), nil
+	return normalizeDecodedPayload(jsonMap(raw)), nil
 }
 
 func (r Repository) NodeEffectiveRawConfig(ctx context.Context, nodeID int64, masterConfig map[string]any) (map[string]any, error) {
@@ -241,7 +241,7 @@ func (r Repository) IterStoredConfigs(ctx context.Context) ([]StoredConfig, erro
 		if err := rows.Scan(&nodeID, &raw); err != nil {
 			return nil, err
 		}
-		parsed := NormalizePayload(jsonMap(raw))
+		parsed := normalizeDecodedPayload(jsonMap(raw))
 		if len(parsed) > 0 {
 			result = append(result, StoredConfig{TargetID: NodeTargetID(nodeID), Config: parsed})
 		}
@@ -294,7 +294,7 @@ func (r Repository) masterRawConfigTx(ctx context.Context, tx *sql.Tx) (map[stri
 	if err != nil {
 		return nil, err
 	}
-	return NormalizePayload(jsonMap(raw)), nil
+	return normalizeDecodedPayload(jsonMap(raw)), nil
 }
 
 func (r Repository) saveMasterRawConfigTx(ctx context.Context, tx *sql.Tx, payload map[string]any) error {
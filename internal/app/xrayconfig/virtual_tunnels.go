@@ -27,11 +27,22 @@ const (
 	OVDCODataCiphers          = "AES-256-GCM:AES-128-GCM:CHACHA20-POLY1305"
 )
 
+// manageableInboundProtocols is the union of proxy and virtual tunnel
+// protocols, so the manageable check is a single lookup.
+var manageableInboundProtocols = func() map[string]struct{} {
+	protocols := make(map[string]struct{}, len(proxyProtocols)+len(virtualTunnelProtocols))
+	for protocol := range proxyProtocols {
+		protocols[protocol] = struct{}{}
+	}
+	for protocol := range virtualTunnelProtocols {
+		protocols[protocol] = struct{}{}
+	}
+	return protocols
+}()
+
 func isManageableInboundProtocol(protocol string) bool {
-	if _, ok := proxyProtocols[protocol]; ok {
-		return true
-	}
-	return isVirtualTunnelProtocol(protocol)
+	_, ok := manageableInboundProtocols[protocol]
+	return ok
 }
 
 func isVirtualTunnelProtocol(protocol string) bool {